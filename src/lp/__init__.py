@@ -3,14 +3,15 @@
 #
 # Copyright © 2015,2019 R.F. Smith <rsmith@xs4all.nl>. All rights reserved.
 # Created: 2015-05-16 16:57:52 +0200
-# Last modified: 2024-12-27T17:31:13+0100
+# Last modified: 2026-10-17T13:05:44+0200
 #
 # SPDX-License-Identifier: BSD-2-Clause
 """Module for calculating fiber reinforced composites properties."""
 
 from .html import out as html_output  # noqa
 from .latex import out as latex_output  # noqa
-from .parser import parse, info, warn  # noqa
+from .parser import parse, parse_iter, info, warn  # noqa
 from .text import out as text_output  # noqa
 from .core import fiber, resin, lamina, laminate  # noqa
 from .version import __version__, __license__  # noqa
+from .parallel import evaluate_many  # noqa
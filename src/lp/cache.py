@@ -0,0 +1,70 @@
+# file: cache.py
+# vim:fileencoding=utf-8:ft=python:fdm=marker
+#
+# Copyright © 2026 R.F. Smith <rsmith@xs4all.nl>. All rights reserved.
+# SPDX-License-Identifier: BSD-2-Clause
+# Created: 2026-10-16T15:02:33+0200
+# Last modified: 2026-10-16T15:02:33+0200
+"""Bounded least-recently-used cache with statistics."""
+
+from collections import OrderedDict, namedtuple
+
+CacheInfo = namedtuple("CacheInfo", "hits misses evictions maxsize currsize")
+
+
+class LRUCache:
+    """
+    Mapping of keys to values, limited to maxsize entries.
+
+    When the cache is full, the least recently used entry is evicted.
+    The number of hits, misses and evictions is counted.
+    """
+
+    def __init__(self, maxsize=128):
+        """Create an empty cache that holds at most maxsize entries."""
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, func, *args):
+        """
+        Return the value for key.
+
+        If the key is not in the cache, func(*args) is called to create the
+        value, which is then stored.
+        """
+        data = self._data
+        try:
+            value = data[key]
+        except KeyError:
+            self.misses += 1
+            value = func(*args)
+            data[key] = value
+            if len(data) > self.maxsize:
+                data.popitem(last=False)
+                self.evictions += 1
+            return value
+        self.hits += 1
+        data.move_to_end(key)
+        return value
+
+    def info(self):
+        """Return the statistics of the cache as a CacheInfo."""
+        return CacheInfo(
+            self.hits, self.misses, self.evictions, self.maxsize, len(self._data)
+        )
+
+    def clear(self):
+        """Remove all entries and reset the statistics."""
+        self._data.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
@@ -0,0 +1,203 @@
+# file: carpet.py
+# vim:fileencoding=utf-8:ft=python:fdm=marker
+#
+# Copyright © 2026 R.F. Smith <rsmith@xs4all.nl>. All rights reserved.
+# SPDX-License-Identifier: BSD-2-Clause
+# Created: 2026-10-17T00:41:27+0200
+# Last modified: 2026-10-17T14:52:10+0200
+"""
+Carpet plots for laminates made of 0°, ±45° and 90° plies. This requires
+NumPy.
+
+For preliminary sizing, laminates are often described by the percentages of
+0°, ±45° and 90° plies; see the ten-percent rule of Hart-Smith (1992) in
+core.py. The in-plane (membrane) properties of such a laminate do not depend
+on the stacking sequence. The stiffness A/h is the average of the Q̅
+matrices of the four ply orientations, weighted by their percentages.
+The ±45° plies are assumed to be balanced.
+
+All compositions on a grid are calculated in one vectorized pass.
+
+This module can also be used from the command line; run
+"python -m lp.carpet -h" for the options.
+"""
+
+import argparse
+import csv
+import sys
+
+from lp.core import lamina
+from lp.parser import materials, warn
+from lp.svg import lineplot
+
+__all__ = ["PROPERTIES", "grid", "carpet", "plot", "main"]
+
+PROPERTIES = ("Ex", "Ey", "Gxy", "νxy", "νyx", "αx", "αy")
+# Labels for the plots.
+_LABELS = {
+    "Ex": "Ex [MPa]",
+    "Ey": "Ey [MPa]",
+    "Gxy": "Gxy [MPa]",
+    "νxy": "νxy [-]",
+    "νyx": "νyx [-]",
+    "αx": "αx [K⁻¹]",
+    "αy": "αy [K⁻¹]",
+}
+
+
+def grid(step=1):
+    """
+    Return all compositions for a step in percent.
+
+    Returns:
+        Three integer arrays with the percentages of 0°, ±45° and 90° plies.
+        They add up to 100.
+    """
+    import numpy as np
+
+    count = 100 // step
+    if step < 1 or count * step != 100:
+        raise ValueError("step must be a divisor of 100")
+    p0, p45 = np.divmod(np.arange((count + 1) ** 2), count + 1)
+    keep = p0 + p45 <= count
+    p0, p45 = p0[keep] * step, p45[keep] * step
+    return p0, p45, 100 - p0 - p45
+
+
+def carpet(fiber, resin, vf, step=1):
+    """
+    Calculate the in-plane properties of all compositions of 0°, ±45° and
+    90° plies.
+
+    Arguments:
+        fiber: The Fiber used in the plies.
+        resin: The Resin used in the plies.
+        vf: Fiber volume fraction.
+        step: Step of the percentages. Must be a divisor of 100.
+
+    Returns:
+        A dictionary of arrays for "p0", "p45", "p90" (the percentages) and
+        the PROPERTIES.
+    """
+    import numpy as np
+
+    p0, p45, p90 = grid(step)
+    Q, Qα = [], []
+    for angle in (0, 45, -45, 90):
+        # The fiber weight does not matter for the properties per unit thickness.
+        la = lamina(fiber, resin, 100, angle, vf)
+        q = np.array(
+            [
+                [la.Q̅11, la.Q̅12, la.Q̅16],
+                [la.Q̅12, la.Q̅22, la.Q̅26],
+                [la.Q̅16, la.Q̅26, la.Q̅66],
+            ]
+        )
+        Q.append(q)
+        Qα.append(q @ [la.αx, la.αy, la.αxy])
+    fractions = np.column_stack([p0, p45 / 2, p45 / 2, p90]) / 100
+    A = np.einsum("nk,kij->nij", fractions, np.array(Q))
+    Nt = np.einsum("nk,ki->ni", fractions, np.array(Qα))
+    a = np.linalg.inv(A)
+    α = np.einsum("nij,nj->ni", a, Nt)
+    return {
+        "p0": p0,
+        "p45": p45,
+        "p90": p90,
+        "Ex": 1 / a[:, 0, 0],
+        "Ey": 1 / a[:, 1, 1],
+        "Gxy": 1 / a[:, 2, 2],
+        "νxy": -a[:, 1, 0] / a[:, 0, 0],
+        "νyx": -a[:, 0, 1] / a[:, 1, 1],
+        "αx": α[:, 0],
+        "αy": α[:, 1],
+    }
+
+
+def plot(columns, prop="Ex", lines=10, title=""):
+    """
+    Create a carpet plot of a property as SVG.
+
+    The property is plotted against the percentage of ±45° plies. There is a
+    line for every multiple of lines percent of 0° plies.
+
+    Arguments:
+        columns: Dictionary as returned by carpet.
+        prop: Name of the property to plot.
+        lines: Step in percent of 0° plies between the lines.
+        title: Title of the plot.
+
+    Returns:
+        The SVG document as a string.
+    """
+    if prop not in PROPERTIES:
+        raise ValueError(f'unknown property "{prop}"')
+    p0, p45, values = columns["p0"], columns["p45"], columns[prop]
+    series = []
+    for level in range(0, 101, lines):
+        keep = p0 == level
+        if keep.any():
+            series.append((f"{level}% 0°", p45[keep], values[keep]))
+    return lineplot(series, "±45° plies [%]", _LABELS[prop], title)
+
+
+def main(argv=None):
+    """Entry point for the carpet command-line program."""
+    opts = argparse.ArgumentParser(
+        prog="python -m lp.carpet",
+        description="Calculate carpet plots for 0/±45/90 laminates.",
+    )
+    opts.add_argument(
+        "-m", "--materials", help="lamprop file to read fibers and resins from"
+    )
+    opts.add_argument("-f", "--fiber", required=True, help="fiber name")
+    opts.add_argument("-r", "--resin", required=True, help="resin name")
+    opts.add_argument("--vf", type=float, default=0.5, help="fiber volume fraction")
+    opts.add_argument(
+        "-s", "--step", type=int, default=1, help="step of the percentages"
+    )
+    opts.add_argument("-o", "--output", help="CSV file to write (default stdout)")
+    opts.add_argument("--svg", help="SVG file to write the carpet plot to")
+    opts.add_argument(
+        "-p",
+        "--property",
+        default="Ex",
+        choices=PROPERTIES,
+        help="property to plot (default Ex)",
+    )
+    opts.add_argument(
+        "-l", "--lines", type=int, default=10, help="percent 0° between plot lines"
+    )
+    args = opts.parse_args(argv)
+    fibers, resins = materials(args.materials)
+    for ln in warn:
+        print(ln, file=sys.stderr)
+    try:
+        f, r = fibers[args.fiber], resins[args.resin]
+    except KeyError as e:
+        opts.error(f"unknown material {e}")
+    try:
+        columns = carpet(f, r, args.vf, args.step)
+    except ValueError as e:
+        opts.error(str(e))
+    names = ["p0", "p45", "p90", *PROPERTIES]
+    out = (
+        open(args.output, "w", encoding="utf-8", newline="")
+        if args.output
+        else sys.stdout
+    )
+    try:
+        writer = csv.writer(out)
+        writer.writerow(names)
+        writer.writerows(zip(*(columns[n].tolist() for n in names)))
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    if args.svg:
+        title = f"{args.property} of {f.name} / {r.name}, vf = {args.vf}"
+        with open(args.svg, "w", encoding="utf-8") as svg:
+            svg.write(plot(columns, args.property, args.lines, title))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+# file: compact.py
+# vim:fileencoding=utf-8:ft=python:fdm=marker
+#
+# Copyright © 2026 R.F. Smith <rsmith@xs4all.nl>. All rights reserved.
+# SPDX-License-Identifier: BSD-2-Clause
+# Created: 2026-10-16T17:52:19+0200
+# Last modified: 2026-10-17T13:41:27+0200
+"""
+Compact representations of Lamina and Laminate for large collections.
+
+The floating point properties are packed into an array("d"), and the
+matrices are stored as lp.matrix.Matrix. The objects have the same
+attributes as the namedtuples in lp.types, so they can be used by the output
+functions. They are read-only.
+
+A laminate only needs the C matrix of its layers to calculate its own
+properties. So by default the compact layers do not keep their C matrix.
+If it is needed later, it is recalculated.
+
+See doc/memory.rst for the sizes of the objects.
+"""
+
+from array import array
+import sys
+
+from lp.types import Fiber, Resin, Lamina, Laminate
+import lp.matrix as lpm
+
+__all__ = ["CompactLamina", "CompactLaminate", "compact", "sizeof"]
+
+_MATRICES = ("ABD", "abd", "H", "h", "C", "S")
+
+
+def _packed(cls):
+    """Add read-only properties for the packed floats of cls."""
+    for index, name in enumerate(cls._floats):
+        setattr(cls, name, property(lambda self, i=index: self._v[i]))
+    return cls
+
+
+class _Compact:
+    __slots__ = ()
+
+    def __eq__(self, other):
+        if not hasattr(other, "_fields"):
+            return NotImplemented
+        for f in self._fields:
+            a, b = getattr(self, f), getattr(other, f)
+            if isinstance(a, lpm.Matrix):
+                b = lpm.Matrix(b)
+            elif isinstance(b, list):
+                a = list(a)
+            if a != b:
+                return False
+        return True
+
+    __hash__ = None
+
+    def __repr__(self):
+        values = ", ".join(f"{f}={getattr(self, f)!r}" for f in self._fields)
+        return f"{type(self).__name__}({values})"
+
+
+@_packed
+class CompactLamina(_Compact):
+    """
+    Read-only Lamina with its floats packed in an array.
+
+    If the C matrix was not kept, it is recalculated on access.
+    """
+
+    __slots__ = ("fiber", "resin", "_v", "_C")
+    _fields = Lamina._fields
+    _floats = Lamina._fields[2:-1]
+
+    def __init__(self, la, keep_C=True):
+        """
+        Create a CompactLamina from the Lamina la.
+
+        Arguments:
+            la: Lamina to convert.
+            keep_C: Store the 3D stiffness matrix. If False, it is
+                recalculated when used.
+        """
+        self.fiber = la.fiber
+        self.resin = la.resin
+        self._v = array("d", la[2:-1])
+        self._C = lpm.Matrix(la.C) if keep_C else None
+
+    @property
+    def C(self):
+        if self._C is not None:
+            return self._C
+        # Import here to prevent a circular import.
+        from lp.core import lamina
+
+        la = lamina(self.fiber, self.resin, self.fiber_weight, self.angle, self.vf)
+        return lpm.Matrix(la.C)
+
+    def tolamina(self):
+        """Return the lamina as a lp.types.Lamina."""
+        return Lamina(self.fiber, self.resin, *self._v, self.C.tolist())
+
+
+@_packed
+class CompactLaminate(_Compact):
+    """Read-only Laminate with its floats packed in an array."""
+
+    __slots__ = ("name", "layers", "_v") + _MATRICES
+    _fields = Laminate._fields
+    _floats = tuple(f for f in Laminate._fields[2:] if f not in _MATRICES)
+
+    def __init__(self, lam, keep_ply_C=False, memo=None):
+        """
+        Create a CompactLaminate from the Laminate lam.
+
+        Arguments:
+            lam: Laminate to convert.
+            keep_ply_C: Keep the C matrices of the layers.
+            memo: Optional dictionary. Layers that are the same object are
+                converted only once when the same memo is used for several
+                laminates. Discard the memo after conversion; it refers
+                to the original layers.
+        """
+        if memo is None:
+            memo = {}
+        self.name = lam.name
+        layers = []
+        for la in lam.layers:
+            if not isinstance(la, str):
+                key = id(la)
+                if key not in memo:
+                    # The original is stored as well, to keep its id unique.
+                    memo[key] = (CompactLamina(la, keep_ply_C), la)
+                la = memo[key][0]
+            layers.append(la)
+        self.layers = tuple(layers)
+        self._v = array("d", (getattr(lam, f) for f in self._floats))
+        for m in _MATRICES:
+            setattr(self, m, lpm.Matrix(getattr(lam, m)))
+
+    def tolaminate(self):
+        """Return the laminate as a lp.types.Laminate."""
+        layers = [la if isinstance(la, str) else la.tolamina() for la in self.layers]
+        values = {f: getattr(self, f) for f in self._floats}
+        # The matrices of a Laminate are lists.
+        values.update((m, getattr(self, m).tolist()) for m in _MATRICES)
+        return Laminate(self.name, layers, **values)
+
+
+def compact(obj, keep_ply_C=False, memo=None):
+    """
+    Return the compact form of a Lamina or Laminate.
+
+    For a Lamina, keep_ply_C determines if its C matrix is kept. See
+    CompactLaminate for the meaning of the arguments.
+    """
+    if isinstance(obj, Lamina):
+        return CompactLamina(obj, keep_ply_C)
+    if isinstance(obj, Laminate):
+        return CompactLaminate(obj, keep_ply_C, memo)
+    raise TypeError("can only compact a Lamina or Laminate")
+
+
+def sizeof(obj, seen=None):
+    """
+    Return the number of bytes used by obj and the objects it refers to.
+
+    Every object is counted once. Strings are included. Fibers and resins
+    are not, since they are shared by many laminae. Neither are classes,
+    functions and modules.
+    """
+    if seen is None:
+        seen = set()
+    if id(obj) in seen or isinstance(obj, (type, Fiber, Resin)):
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        items = [*obj.keys(), *obj.values()]
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        items = obj
+    elif isinstance(obj, (str, bytes, array, memoryview, int, float)):
+        items = ()
+    else:
+        items = [
+            getattr(obj, s)
+            for c in type(obj).__mro__
+            for s in getattr(c, "__slots__", ())
+            if hasattr(obj, s)
+        ]
+        items += list(getattr(obj, "__dict__", {}).values())
+    return size + sum(sizeof(item, seen) for item in items)
@@ -4,7 +4,7 @@
 # Copyright © 2014-2021 R.F. Smith <rsmith@xs4all.nl>. All rights reserved.
 # SPDX-License-Identifier: BSD-2-Clause
 # Created: 2014-02-21 22:20:39 +0100
-# Last modified: 2024-03-25T22:30:09+0100
+# Last modified: 2026-10-17T14:20:33+0200
 """
 Core functions of lamprop.
 
@@ -82,12 +82,21 @@ The following references were used in coding this module:
   number =       {Reference Publication 1351}
 }
 """
-from lp.types import Fiber, Resin, Lamina, Laminate
+from lp.types import Fiber, Resin, Lamina, LaminaBatch, Laminate, LaminateBatch
+from lp.types import OnAxis, Rotation
+from lp.cache import LRUCache
+from collections.abc import MutableSequence, Sequence
+from functools import cached_property
 import math
 import lp.matrix as lpm
 
+# The on-axis properties of laminae, keyed by (fiber, resin, vf).
+onaxis_cache = LRUCache(maxsize=1024)
+# Powers of the sine and cosine and Tbar matrices, keyed by the angle.
+rotation_cache = LRUCache(maxsize=4096)
 
-def fiber(E1, ν12, α1, ρ, name):
+
+def fiber(E1, ν12, α1, ρ, name, strength=None):
     """Create a Fiber.
 
     The arguments with subscript "1" are in the length direction of the fiber.
@@ -98,6 +107,7 @@ def fiber(E1, ν12, α1, ρ, name):
         α1 (float): Coefficient of thermal expansion in K⁻¹.
         ρ (float): Fiber density in g/cm³. Must be > 0
         name (str): Name of the fiber. Must not be empty.
+        strength (Strength): Optional strengths of a ply made with the fiber.
     """
     E1 = float(E1)
     assert E1 > 0, "fiber E1 must be > 0"
@@ -109,7 +119,7 @@ def fiber(E1, ν12, α1, ρ, name):
     assert (
         isinstance(name, str) and len(name) > 0
     ), "fiber name must be a non-empty string"
-    return Fiber(E1, ν12, α1, ρ, name)
+    return Fiber(E1, ν12, α1, ρ, name, strength)
 
 
 def resin(E, ν, α, ρ, name):
@@ -173,10 +183,320 @@ def lamina(fiber, resin, fiber_weight, angle, vf):
     assert (
         1.0 < vf <= 100.0 or 0.0 <= vf <= 1.0
     ), "vf must be in the ranges 0.0-1.0 or 1.0-100.0"
-    vm = 1.0 - vf
+    p = onaxis_cache.get((fiber, resin, vf), _onaxis, fiber, resin, vf)
     fiber_thickness = fiber_weight / (fiber.ρ * 1000)
-    thickness = fiber_thickness * (1 + vm / vf)
-    resin_weight = thickness * vm * resin.ρ * 1000  # Resin [g/m²]
+    thickness = fiber_thickness * p.ft
+    resin_weight = thickness * p.vm * resin.ρ * 1000  # Resin [g/m²]
+    r = rotation_cache.get(angle, _rotation, angle)
+    props, c = _rotated(p, r)
+    C̅11, C̅12, C̅13, C̅16, C̅22, C̅23, C̅26, C̅33, C̅36, C̅44, C̅45, C̅55, C̅66 = c
+    # fmt: off
+    C = [
+        [C̅11, C̅12, C̅13, 0.0, 0.0, C̅16],
+        [C̅12, C̅22, C̅23, 0.0, 0.0, C̅26],
+        [C̅13, C̅23, C̅33, 0.0, 0.0, C̅36],
+        [0.0, 0.0, 0.0, C̅44, C̅45, 0.0],
+        [0.0, 0.0, 0.0, C̅45, C̅55, 0.0],
+        [C̅16, C̅26, C̅36, 0.0, 0.0, C̅66],
+    ]
+    # fmt: on
+    return Lamina(
+        fiber,
+        resin,
+        fiber_weight,
+        angle,
+        vf,
+        thickness,
+        resin_weight,
+        p.E1,
+        p.E2,
+        p.E3,
+        p.G12,
+        p.G13,
+        p.G23,
+        p.ν12,
+        p.ν13,
+        p.ν23,
+        *props,
+        p.ρ,
+        C,
+    )
+
+
+def lamina_batch(fiber, resin, fiber_weights, angles, vfs, stiffness=True):
+    """Create many laminae of the same fiber and resin at once.
+    This requires NumPy.
+
+    Arguments:
+        fiber: The Fiber used in the laminae
+        resin: The Resin binding the laminae
+        fiber_weights: Array of the amount of Fibers in g/m². Must be >0.
+        angles: Array of the orientation of the layers in degrees.
+        vfs: Array of the fiber volume fractions.
+        stiffness: If False, the 3D stiffness matrices are not calculated,
+            and C is None.
+
+    The arrays must have the same length N. The numbers in the fiber and
+    resin can also be arrays of length N.
+
+    Returns:
+        A LaminaBatch. It has the same fields as a Lamina, but every number
+        is an array of N elements, and C is an N×6×6 array. Element i is
+        identical to lamina(fiber, resin, fiber_weights[i], angles[i], vfs[i]).
+    """
+    import numpy as np
+
+    fiber_weight = np.asarray(fiber_weights, dtype=float)
+    angle = np.asarray(angles, dtype=float)
+    vf = np.asarray(vfs, dtype=float)
+    if fiber_weight.ndim != 1 or not (fiber_weight.shape == angle.shape == vf.shape):
+        raise ValueError("fiber_weights, angles and vfs must have the same length")
+    assert np.all(fiber_weight > 0), "fiber weight cannot be <=0!"
+    assert np.all(
+        ((1.0 < vf) & (vf <= 100.0)) | ((0.0 <= vf) & (vf <= 1.0))
+    ), "vf must be in the ranges 0.0-1.0 or 1.0-100.0"
+    p = _onaxis(fiber, resin, vf)
+    fiber_thickness = fiber_weight / (fiber.ρ * 1000)
+    thickness = fiber_thickness * p.ft
+    resin_weight = thickness * p.vm * resin.ρ * 1000  # Resin [g/m²]
+    unique, index = np.unique(angle, return_inverse=True)
+    if len(unique) <= _UNIQUE_ANGLES:
+        # Use the same rotation data as lamina(), but only once per angle.
+        rotations = [rotation_cache.get(a, _rotation, a) for a in unique.tolist()]
+        powers = np.array([rot[:8] for rot in rotations])[index]
+        r = Rotation(*powers.T, None)
+    else:
+        r = _rotation_array(angle)
+    props, c = _rotated(p, r)
+    C = None
+    if stiffness:
+        C = np.zeros((len(vf), 6, 6))
+        for (i, j), value in zip(_CINDEX, c):
+            C[:, i, j] = value
+            C[:, j, i] = value
+    return LaminaBatch(
+        fiber,
+        resin,
+        fiber_weight,
+        angle,
+        vf,
+        thickness,
+        resin_weight,
+        p.E1,
+        p.E2,
+        p.E3,
+        p.G12,
+        p.G13,
+        p.G23,
+        p.ν12,
+        p.ν13,
+        p.ν23,
+        *props,
+        p.ρ,
+        C,
+    )
+
+
+def laminate_batch(fiber, resin, fiber_weights, angles, vfs):
+    """Calculate the in-plane properties of many laminates at once.
+    All laminates are made from the same fiber and resin, and have the same
+    number of layers. This requires NumPy.
+
+    Arguments:
+        fiber: The Fiber used in the laminates
+        resin: The Resin binding the laminates
+        fiber_weights: Array of the amount of Fibers in g/m².
+        angles: Array of the orientation of the layers in degrees.
+        vfs: Array of the fiber volume fractions.
+
+    The arrays must be broadcastable to the shape (N, P) for N laminates of
+    P layers. The first layer is at the bottom. The numbers in the fiber and
+    resin can also be arrays of N·P elements, in the same order as the
+    flattened (N, P) arrays.
+
+    Returns:
+        A LaminateBatch. Every number is an array of N elements. ABD and abd
+        are N×6×6 arrays. The properties are the same as those calculated by
+        laminate(), up to rounding.
+    """
+    import numpy as np
+
+    fiber_weight, angle, vf = np.broadcast_arrays(
+        np.asarray(fiber_weights, dtype=float),
+        np.asarray(angles, dtype=float),
+        np.asarray(vfs, dtype=float),
+    )
+    if angle.ndim != 2:
+        raise ValueError("the arrays must be broadcastable to two dimensions")
+    shape = angle.shape
+    la = lamina_batch(
+        fiber, resin, fiber_weight.ravel(), angle.ravel(), vf.ravel(), stiffness=False
+    )
+
+    def get(name):
+        return getattr(la, name).reshape(shape)
+
+    t = get("thickness")
+    thickness = t.sum(axis=1)
+    ze = np.cumsum(t, axis=1) - thickness[:, None] / 2
+    zs = ze - t
+    z2, z3 = (ze**2 - zs**2) / 2, (ze**3 - zs**3) / 3
+    Q11, Q12, Q16 = get("Q̅11"), get("Q̅12"), get("Q̅16")
+    Q22, Q26, Q66 = get("Q̅22"), get("Q̅26"), get("Q̅66")
+    Q = np.stack(
+        [
+            np.stack([Q11, Q12, Q16], axis=-1),
+            np.stack([Q12, Q22, Q26], axis=-1),
+            np.stack([Q16, Q26, Q66], axis=-1),
+        ],
+        axis=-2,
+    )
+    ABD = np.empty((shape[0], 6, 6))
+    ABD[:, :3, :3] = np.einsum("npij,np->nij", Q, t)
+    ABD[:, :3, 3:] = ABD[:, 3:, :3] = np.einsum("npij,np->nij", Q, z2)
+    ABD[:, 3:, 3:] = np.einsum("npij,np->nij", Q, z3)
+    ABD[np.abs(ABD) < lpm._LIMIT] = 0.0
+    abd = np.linalg.inv(ABD)
+    abd[np.abs(abd) < lpm._LIMIT] = 0.0
+    # Hyer:1998, p. 445 and p. 451
+    α = np.stack([get("αx"), get("αy"), get("αxy")], axis=-1)
+    Nt = np.einsum("npij,npj,np->ni", Q, α, t)
+    αx = np.einsum("ni,ni->n", abd[:, 0, :3], Nt)
+    αy = np.einsum("ni,ni->n", abd[:, 1, :3], Nt)
+    fiber_weight = get("fiber_weight").sum(axis=1)
+    resin_weight = get("resin_weight").sum(axis=1)
+    return LaminateBatch(
+        thickness,
+        fiber_weight,
+        (get("ρ") * t).sum(axis=1) / thickness,
+        (get("vf") * t).sum(axis=1) / thickness,
+        resin_weight,
+        fiber_weight / (fiber_weight + resin_weight),
+        ABD,
+        abd,
+        # These are equivalent to the ratios of determinants in _inplane.
+        1 / (abd[:, 0, 0] * thickness),
+        1 / (abd[:, 1, 1] * thickness),
+        1 / (abd[:, 2, 2] * thickness),
+        -abd[:, 1, 0] / abd[:, 0, 0],
+        -abd[:, 0, 1] / abd[:, 1, 1],
+        αx,
+        αy,
+    )
+
+
+# Above this number of different angles, lamina_batch does not use the
+# rotation cache.
+_UNIQUE_ANGLES = 256
+
+
+def _rotation_array(degrees):
+    """
+    Calculate the rotation data for an array of angles with NumPy, like
+    _rotation. Multiples of 90° yield exact values.
+    """
+    import numpy as np
+
+    θ = np.radians(degrees)
+    c, s = np.cos(θ), np.sin(θ)
+    right = degrees % 90 == 0
+    if np.any(right):
+        quadrant = (degrees[right] // 90).astype(int) % 4
+        c[right] = np.array([1.0, 0.0, -1.0, 0.0])[quadrant]
+        s[right] = np.array([0.0, 1.0, 0.0, -1.0])[quadrant]
+    c2, s2 = c * c, s * s
+    return Rotation(c, s, c2, s2, c2 * c, s2 * s, c2 * c2, s2 * s2, None)
+
+
+# Indices of the terms of C that _rotated returns.
+_CINDEX = (
+    (0, 0),
+    (0, 1),
+    (0, 2),
+    (0, 5),
+    (1, 1),
+    (1, 2),
+    (1, 5),
+    (2, 2),
+    (2, 5),
+    (3, 3),
+    (3, 4),
+    (4, 4),
+    (5, 5),
+)
+
+
+def _rotated(p, r):
+    """
+    Rotate the on-axis properties of a lamina around the z-axis.
+    Only arithmetic is used, so the data in p and r can also be arrays.
+
+    Arguments:
+        p: OnAxis data.
+        r: Rotation data.
+
+    Returns:
+        A 2-tuple of (αx, αy, αxy, Q̅11, Q̅12, Q̅16, Q̅22, Q̅26, Q̅66, Q̅s44, Q̅s55,
+        Q̅s45) and the terms of the rotated 3D stiffness matrix in the order
+        given by _CINDEX.
+    """
+    m, n, m2, n2, m3, n3, m4, n4 = r.m, r.n, r.m2, r.n2, r.m3, r.n3, r.m4, r.n4
+    # Rotate the 3D stiffness around the z-axis; this is Tbarᵀ·Cp·Tbar
+    # written out.
+    C11, C12, C13, C22, C23 = p.C11, p.C12, p.C13, p.C22, p.C23
+    C44, C55, C66 = p.C44, p.C55, p.C66
+    CA = C11 - C12 - 2 * C66
+    CB = C12 - C22 + 2 * C66
+    C̅11 = C11 * m4 + 2 * (C12 + 2 * C66) * n2 * m2 + C22 * n4
+    C̅12 = (C11 + C22 - 4 * C66) * n2 * m2 + C12 * (n4 + m4)
+    C̅13 = C13 * m2 + C23 * n2
+    C̅16 = CA * n * m3 + CB * n3 * m
+    C̅22 = C11 * n4 + 2 * (C12 + 2 * C66) * n2 * m2 + C22 * m4
+    C̅23 = C13 * n2 + C23 * m2
+    C̅26 = CA * n3 * m + CB * n * m3
+    C̅36 = (C13 - C23) * n * m
+    C̅44 = C44 * m2 + C55 * n2
+    C̅45 = (C55 - C44) * n * m
+    C̅55 = C44 * n2 + C55 * m2
+    C̅66 = (C11 + C22 - 2 * C12 - 2 * C66) * n2 * m2 + C66 * (n4 + m4)
+    α1, α2 = p.α1, p.α2
+    αx = α1 * m2 + α2 * n2
+    αy = α1 * n2 + α2 * m2
+    αxy = 2 * (α1 - α2) * m * n
+    Q11, Q12, Q22, Q66 = p.Q11, p.Q12, p.Q22, p.Q66
+    Qs44, Qs55 = p.Qs44, p.Qs55
+    # Q̅ according to Hyer:1997, p. 182
+    Q̅11 = Q11 * m4 + 2 * (Q12 + 2 * Q66) * n2 * m2 + Q22 * n4
+    QA = Q11 - Q12 - 2 * Q66
+    QB = Q12 - Q22 + 2 * Q66
+    Q̅12 = (Q11 + Q22 - 4 * Q66) * n2 * m2 + Q12 * (n4 + m4)
+    Q̅16 = QA * n * m3 + QB * n3 * m
+    Q̅22 = Q11 * n4 + 2 * (Q12 + 2 * Q66) * n2 * m2 + Q22 * m4
+    Q̅26 = QA * n3 * m + QB * n * m3
+    Q̅66 = (Q11 + Q22 - 2 * Q12 - 2 * Q66) * n2 * m2 + Q66 * (n4 + m4)
+    # Qstar (Qs) according to Barbero:2018, p. 167
+    Q̅s44 = Qs44 * m2 + Qs55 * n2
+    Q̅s55 = Qs44 * n2 + Qs55 * m2
+    Q̅s45 = (Q̅s55 - Q̅s44) * n * m
+    return (
+        (αx, αy, αxy, Q̅11, Q̅12, Q̅16, Q̅22, Q̅26, Q̅66, Q̅s44, Q̅s55, Q̅s45),
+        (C̅11, C̅12, C̅13, C̅16, C̅22, C̅23, C̅26, p.C33, C̅36, C̅44, C̅45, C̅55, C̅66),
+    )
+
+
+def _onaxis(fiber, resin, vf):
+    """
+    Calculate the properties of a lamina in its own coordinate system.
+
+    These only depend on the fiber, the resin and the fiber volume fraction.
+    Only arithmetic is used, so vf and the properties of the fiber and resin
+    can also be arrays.
+
+    Returns:
+        An OnAxis tuple.
+    """
+    vm = 1.0 - vf
+    ft = 1 + vm / vf  # Ratio of lamina thickness and fiber thickness.
     E1 = vf * fiber.E1 + resin.E * vm  # Hyer:1998, p. 115, (3.32)
     # As of version 2020-12-22, use the Halpin-Tsai formula for E2.
     ξ = 1.5  # Giner, 2014
@@ -196,68 +516,40 @@ def lamina(fiber, resin, fiber_weight, angle, vf):
     K = 1 / (vf / Kf + vm / Km)
     ν23 = 1 - ν21 - E2 / (3 * K)
     G23 = E2 / (2 * (1 + ν23))  # Barbero:2008, p. 23, Barbero:2018, p. 504
-    a = math.radians(float(angle))
-    m, n = math.cos(a), math.sin(a)
     # Calculate the 3D stiffness matrix for this lamina
     # Note about terminology: in the literature, the stiffness matrix is
     # generally named C, while its inverse the compliance matrix is called S.
     # This is confusing IMO, but I will follow convention here for the sake of
     # clarity.
-    # First, the compliance matrix in lamina coordinates
-    Sp = [
-        [1 / E1, -ν12 / E1, -ν13 / E1, 0, 0, 0],
-        [-ν12 / E1, 1 / E2, -ν23 / E2, 0, 0, 0],
-        [-ν13 / E1, -ν23 / E2, 1 / E3, 0, 0, 0],
-        [0, 0, 0, 1 / G23, 0, 0],
-        [0, 0, 0, 0, 1 / G13, 0],
-        [0, 0, 0, 0, 0, 1 / G12],
-    ]
-    # Invert it to the stiffness matrix in lamina coordinates
-    Cp = lpm.inv(Sp)
-    # Convert to global coordinates.
-    Tbar = tbar(angle)
-    C = lpm.matmul(lpm.matmul(lpm.transp(Tbar), Cp), Tbar)
-    # The powers of the sine and cosine are often used later.
-    m2 = m * m
-    m3, m4 = m2 * m, m2 * m2
-    n2 = n * n
-    n3, n4 = n2 * n, n2 * n2
+    # The compliance matrix in lamina coordinates is
+    # | 1/E1    -ν12/E1 -ν13/E1 0      0      0     |
+    # | -ν12/E1 1/E2    -ν23/E2 0      0      0     |
+    # | -ν13/E1 -ν23/E2 1/E3    0      0      0     |
+    # | 0       0       0       1/G23  0      0     |
+    # | 0       0       0       0      1/G13  0     |
+    # | 0       0       0       0      0      1/G12 |
+    # Since E3 = E2 and ν13 = ν12, its inverse has a closed form.
+    S11, S12, S22, S23 = 1 / E1, -ν12 / E1, 1 / E2, -ν23 / E2
+    Δ = (S22 - S23) * (S11 * (S22 + S23) - 2 * S12 * S12)
+    C11 = (S22 * S22 - S23 * S23) / Δ
+    C12 = C13 = S12 * (S23 - S22) / Δ
+    C22 = C33 = (S11 * S22 - S12 * S12) / Δ
+    C23 = (S12 * S12 - S11 * S23) / Δ
     α1 = (fiber.α1 * fiber.E1 * vf + resin.α * resin.E * vm) / E1
     # Since α2 properties of fibers are hard to come by, we have to estimate.
     # This is based on our own measurements.
     α2 = vf * resin.α  # This is not 100% accurate, but simple.
-    αx = α1 * m2 + α2 * n2
-    αy = α1 * n2 + α2 * m2
-    αxy = 2 * (α1 - α2) * m * n
     # Barbero:2018, p. 159
     denum = 1 - ν12 * ν21
     Q11, Q12 = E1 / denum, ν12 * E2 / denum
     Q22, Q66 = E2 / denum, G12
     Qs44 = G23
     Qs55 = G12  # Assuming transverse isotropy.
-    # Q̅ according to Hyer:1997, p. 182
-    Q̅11 = Q11 * m4 + 2 * (Q12 + 2 * Q66) * n2 * m2 + Q22 * n4
-    QA = Q11 - Q12 - 2 * Q66
-    QB = Q12 - Q22 + 2 * Q66
-    Q̅12 = (Q11 + Q22 - 4 * Q66) * n2 * m2 + Q12 * (n4 + m4)
-    Q̅16 = QA * n * m3 + QB * n3 * m
-    Q̅22 = Q11 * n4 + 2 * (Q12 + 2 * Q66) * n2 * m2 + Q22 * m4
-    Q̅26 = QA * n3 * m + QB * n * m3
-    Q̅66 = (Q11 + Q22 - 2 * Q12 - 2 * Q66) * n2 * m2 + Q66 * (n4 + m4)
-    # Qstar (Qs) according to Barbero:2018, p. 167
-    Q̅s44 = Qs44 * m2 + Qs55 * n2
-    Q̅s55 = Qs44 * n2 + Qs55 * m2
-    Q̅s45 = (Q̅s55 - Q̅s44) * n * m
     # Calculate density
     ρ = fiber.ρ * vf + resin.ρ * vm
-    return Lamina(
-        fiber,
-        resin,
-        fiber_weight,
-        angle,
-        vf,
-        thickness,
-        resin_weight,
+    return OnAxis(
+        vm,
+        ft,
         E1,
         E2,
         E3,
@@ -267,29 +559,36 @@ def lamina(fiber, resin, fiber_weight, angle, vf):
         ν12,
         ν13,
         ν23,
-        αx,
-        αy,
-        αxy,
-        Q̅11,
-        Q̅12,
-        Q̅16,
-        Q̅22,
-        Q̅26,
-        Q̅66,
-        Q̅s44,
-        Q̅s55,
-        Q̅s45,
+        α1,
+        α2,
+        Q11,
+        Q12,
+        Q22,
+        Q66,
+        Qs44,
+        Qs55,
+        C11,
+        C12,
+        C13,
+        C22,
+        C23,
+        C33,
+        G23,
+        G13,
+        G12,
         ρ,
-        C,
     )
 
 
-def laminate(name, layers):
+def laminate(name, layers, lazy=False):
     """Create a Laminate.
 
     Arguments/properties of a laminate:
         name: A non-empty string containing the name of the laminate
         layers: A non-empty sequence of lamina (will be converted into a tuple).
+            For a SymmetricLayers, only the lower half is integrated.
+        lazy: If True, return a LazyLaminate that only calculates the
+            properties that are actually used.
 
     Additional properties:
         thickness: Thickness of the laminate in mm.
@@ -314,49 +613,176 @@ def laminate(name, layers):
     assert (
         isinstance(name, str) and len(name) > 0
     ), "laminate name must be a non-empty string"
-    orig_layers = layers
-    layers = tuple(la for la in layers if isinstance(la, Lamina))
-    thickness = sum(la.thickness for la in layers)
-    fiber_weight = sum(la.fiber_weight for la in layers)
-    ρ = sum(la.ρ * la.thickness for la in layers) / thickness
-    vf = sum(la.vf * la.thickness for la in layers) / thickness
-    resin_weight = sum(la.resin_weight for la in layers)
+    if lazy:
+        return LazyLaminate(name, layers)
+    symmetric = isinstance(layers, SymmetricLayers)
+    # A symmetric laminate is calculated from its lower half.
+    groups = _groups(
+        la for la in (layers.half if symmetric else layers) if isinstance(la, Lamina)
+    )
+    totals = _totals(groups, symmetric)
+    C, S = _stiffness(groups, totals[0] / 2 if symmetric else totals[0])
+    ABD, H, Nt, Ez = _plate(groups, totals[0], symmetric)
+    return _finish(name, layers, totals, C, S, ABD, H, Nt, Ez)
+
+
+def _finish(name, layers, totals, C, S, ABD, H, Nt, Ez):
+    """
+    Calculate the remaining properties and create the Laminate.
+
+    Arguments:
+        name: Name of the laminate.
+        layers: Sequence of laminae and comments.
+        totals: Return value of _totals.
+        C, S: Return values of _stiffness.
+        ABD, H, Nt, Ez: Return values of _plate.
+    """
+    thickness, fiber_weight, ρ, vf, resin_weight, wf = totals
+    abd, Ex, Ey, Gxy, νxy, νyx = _inplane(ABD, thickness)
+    h, Gyz, Gxz = _transverse(H, thickness)
+    αx, αy = _thermal(abd, Nt)
+    return Laminate(
+        name,
+        layers,
+        thickness,
+        fiber_weight,
+        ρ,
+        vf,
+        resin_weight,
+        ABD,
+        abd,
+        H,
+        h,
+        Ex,
+        Ey,
+        Ez,
+        Gxy,
+        Gyz,
+        Gxz,
+        νxy,
+        νyx,
+        αx,
+        αy,
+        wf,
+        C,
+        S,
+        *_tensor(S),
+    )
+
+
+def _groups(laminae):
+    """
+    Group consecutive identical laminae.
+
+    Laminae are identical when they are the same object, or when they are
+    made from the same fiber, resin, fiber weight, angle and vf.
+
+    Returns:
+        A list of (lamina, count) tuples.
+    """
+    rv = []
+    prev, count = None, 0
+    for la in laminae:
+        if prev is not None and _identical(la, prev):
+            count += 1
+            continue
+        if prev is not None:
+            rv.append((prev, count))
+        prev, count = la, 1
+    if prev is not None:
+        rv.append((prev, count))
+    return rv
+
+
+def _identical(a, b):
+    """Return True if laminae a and b are the same, see _groups."""
+    return a is b or (
+        a.fiber == b.fiber
+        and a.resin == b.resin
+        and a.fiber_weight == b.fiber_weight
+        and a.angle == b.angle
+        and a.vf == b.vf
+    )
+
+
+def _totals(groups, symmetric=False):
+    """
+    Calculate the totals and averages for the (lamina, count) groups.
+    If symmetric is True, the groups are the lower half of the laminate.
+
+    Returns:
+        thickness, fiber_weight, ρ, vf, resin_weight, wf
+    """
+    thickness = sum(la.thickness * k for la, k in groups)
+    fiber_weight = sum(la.fiber_weight * k for la, k in groups)
+    ρ = sum(la.ρ * la.thickness * k for la, k in groups) / thickness
+    vf = sum(la.vf * la.thickness * k for la, k in groups) / thickness
+    resin_weight = sum(la.resin_weight * k for la, k in groups)
     wf = fiber_weight / (fiber_weight + resin_weight)
-    # Set z-values for lamina.
+    if symmetric:
+        return 2 * thickness, 2 * fiber_weight, ρ, vf, 2 * resin_weight, wf
+    return thickness, fiber_weight, ρ, vf, resin_weight, wf
+
+
+def _stiffness(groups, thickness):
+    """
+    Calculate the 3D stiffness matrix C of the (lamina, count) groups as the
+    thickness-weighted average, and its inverse S.
+    """
+    C = lpm.Matrix.zeros(6)
+    for la, k in groups:
+        C.iadd_scaled(la.C, la.thickness * k / thickness)
+    C = C.iclean().tolist()
+    S = lpm.inv(C)
+    return C, S
+
+
+def _plate(groups, thickness, symmetric=False):
+    """
+    Integrate the (lamina, count) groups over the thickness. A group of
+    identical laminae is integrated as one thick layer.
+
+    If symmetric is True, the groups are the lower half of a laminate with
+    the given thickness. Only the lower half is integrated. Its contributions
+    to A, D and H are doubled and B is zero.
+
+    Returns:
+        The ABD matrix, the H matrix, the unit thermal stress resultants
+        (Ntx, Nty, Ntxy) and Ez.
+    """
+    # Set z-values for the groups.
     zs = -thickness / 2
-    lz2, lz3 = [], []
-    C = lpm.zeros(6)
-    for la in layers:
-        ze = zs + la.thickness
+    lt, lz2, lz3 = [], [], []
+    for la, k in groups:
+        t = la.thickness * k
+        ze = zs + t
+        lt.append(t)
         lz2.append((ze * ze - zs * zs) / 2)
         lz3.append((ze * ze * ze - zs * zs * zs) / 3)
         zs = ze
-        C = lpm.add(C, lpm.mul(la.C, la.thickness / thickness))
-    C = lpm.clean(C)
-    S = lpm.inv(C)
     Ntx, Nty, Ntxy = 0.0, 0.0, 0.0
     ABD = lpm.zeros(6)
     H = lpm.zeros(2)
     c3 = 0
-    for la, z2, z3 in zip(layers, lz2, lz3):
+    for (la, _), t, z2, z3 in zip(groups, lt, lz2, lz3):
         # first row
-        ABD[0][0] += la.Q̅11 * la.thickness  # Hyer:1998, p. 290
-        ABD[0][1] += la.Q̅12 * la.thickness
-        ABD[0][2] += la.Q̅16 * la.thickness
+        ABD[0][0] += la.Q̅11 * t  # Hyer:1998, p. 290
+        ABD[0][1] += la.Q̅12 * t
+        ABD[0][2] += la.Q̅16 * t
         ABD[0][3] += la.Q̅11 * z2
         ABD[0][4] += la.Q̅12 * z2
         ABD[0][5] += la.Q̅16 * z2
         # second row
-        ABD[1][0] += la.Q̅12 * la.thickness
-        ABD[1][1] += la.Q̅22 * la.thickness
-        ABD[1][2] += la.Q̅26 * la.thickness
+        ABD[1][0] += la.Q̅12 * t
+        ABD[1][1] += la.Q̅22 * t
+        ABD[1][2] += la.Q̅26 * t
         ABD[1][3] += la.Q̅12 * z2
         ABD[1][4] += la.Q̅22 * z2
         ABD[1][5] += la.Q̅26 * z2
         # third row
-        ABD[2][0] += la.Q̅16 * la.thickness
-        ABD[2][1] += la.Q̅26 * la.thickness
-        ABD[2][2] += la.Q̅66 * la.thickness
+        ABD[2][0] += la.Q̅16 * t
+        ABD[2][1] += la.Q̅26 * t
+        ABD[2][2] += la.Q̅66 * t
         ABD[2][3] += la.Q̅16 * z2
         ABD[2][4] += la.Q̅26 * z2
         ABD[2][5] += la.Q̅66 * z2
@@ -383,100 +809,459 @@ def laminate(name, layers):
         ABD[5][5] += la.Q̅66 * z3
         # Calculate unit thermal stress resultants.
         # Hyer:1998, p. 445
-        Ntx += (la.Q̅11 * la.αx + la.Q̅12 * la.αy + la.Q̅16 * la.αxy) * la.thickness
-        Nty += (la.Q̅12 * la.αx + la.Q̅22 * la.αy + la.Q̅26 * la.αxy) * la.thickness
-        Ntxy += (la.Q̅16 * la.αx + la.Q̅26 * la.αy + la.Q̅66 * la.αxy) * la.thickness
+        Ntx += (la.Q̅11 * la.αx + la.Q̅12 * la.αy + la.Q̅16 * la.αxy) * t
+        Nty += (la.Q̅12 * la.αx + la.Q̅22 * la.αy + la.Q̅26 * la.αxy) * t
+        Ntxy += (la.Q̅16 * la.αx + la.Q̅26 * la.αy + la.Q̅66 * la.αxy) * t
         # Calculate H matrix (derived from Barbero:2018, p. 181)
-        sb = 5 / 4 * (la.thickness - 4 * z3 / thickness**2)
+        sb = 5 / 4 * (t - 4 * z3 / thickness**2)
         H[0][0] += la.Q̅s44 * sb
         H[0][1] += la.Q̅s45 * sb
         H[1][0] += la.Q̅s45 * sb
         H[1][1] += la.Q̅s55 * sb
         # Calculate E3
-        c3 += la.thickness / la.E3
+        c3 += t / la.E3
+    if symmetric:
+        for i in range(3):
+            for j in range(3):
+                ABD[i][j] *= 2
+                ABD[i + 3][j + 3] *= 2
+                ABD[i][j + 3] = ABD[i + 3][j] = 0.0
+        H = [[2 * n for n in row] for row in H]
+        Ntx, Nty, Ntxy, c3 = 2 * Ntx, 2 * Nty, 2 * Ntxy, 2 * c3
     # Finish the matrices, discarding very small numbers in ABD and H.
     ABD = lpm.clean(ABD)
     H = lpm.clean(H)
-    abd = lpm.inv(ABD)
-    h = lpm.inv(H)
+    # All layers experience the same force in Z-direction.
+    Ez = thickness / c3
+    return ABD, H, (Ntx, Nty, Ntxy), Ez
+
+
+def _inplane(ABD, thickness):
+    """
+    Calculate the in-plane engineering properties from the ABD matrix.
+
+    Returns:
+        abd, Ex, Ey, Gxy, νxy, νyx
+    """
+    lu = lpm.LU(ABD)
+    abd = lpm.clean(lu.inv())
     # Calculate the engineering properties.
     # Nettles:1994, p. 34 e.v.
-    dABD = lpm.det(ABD)
-    dt1 = lpm.det(lpm.delete(ABD, 0, 0))
+    # The determinants of the minors follow from the cofactors of ABD.
+    dABD = lu.det()
+    dt1 = lu.cofactor(0, 0)
     Ex = dABD / (dt1 * thickness)
-    dt2 = lpm.det(lpm.delete(ABD, 1, 1))
+    dt2 = lu.cofactor(1, 1)
     Ey = dABD / (dt2 * thickness)
-    dt3 = lpm.det(lpm.delete(ABD, 2, 2))
+    dt3 = lu.cofactor(2, 2)
     Gxy = dABD / (dt3 * thickness)
-    dt4 = lpm.det(lpm.delete(ABD, 0, 1))
-    dt5 = lpm.det(lpm.delete(ABD, 1, 0))
+    dt4 = -lu.cofactor(0, 1)
+    dt5 = -lu.cofactor(1, 0)
     νxy = dt4 / dt1
     νyx = dt5 / dt2
+    return abd, Ex, Ey, Gxy, νxy, νyx
+
+
+def _transverse(H, thickness):
+    """
+    Calculate the transverse properties from the H matrix.
+
+    Returns:
+        h, Gyz, Gxz
+    """
+    h = lpm.inv(H)
     # See Barbero:2018, p. 197
     Gyz = H[0][0] / thickness
     Gxz = H[1][1] / thickness
-    # All layers experience the same force in Z-direction.
-    Ez = thickness / c3
-    # Calculate the coefficients of thermal expansion.
+    return h, Gyz, Gxz
+
+
+def _thermal(abd, Nt):
+    """Calculate the coefficients of thermal expansion αx and αy."""
+    Ntx, Nty, Ntxy = Nt
     # *Technically* only valid for a symmetric laminate!
     # Hyer:1998, p. 451, (11.86)
     αx = abd[0][0] * Ntx + abd[0][1] * Nty + abd[0][2] * Ntxy
     αy = abd[1][0] * Ntx + abd[1][1] * Nty + abd[1][2] * Ntxy
-    # Calculate tensor engineering properties
+    return αx, αy
+
+
+def _tensor(S):
+    """
+    Calculate tensor engineering properties from the compliance matrix S.
+
+    Returns:
+        tEx, tEy, tEz, tGxy, tGyz, tGxz, tνxy, tνxz, tνyz
+    """
     tEx, tEy, tEz = 1 / S[0][0], 1 / S[1][1], 1 / S[2][2]
     tGxy, tGxz, tGyz = 1 / S[5][5], 1 / S[4][4], 1 / S[3][3]
     tνxy, tνxz, tνyz = -S[1][0] / S[0][0], -S[2][0] / S[0][0], -S[2][1] / S[1][1]
-    return Laminate(
-        name,
-        orig_layers,
-        thickness,
-        fiber_weight,
-        ρ,
-        vf,
-        resin_weight,
-        ABD,
-        abd,
-        H,
-        h,
-        Ex,
-        Ey,
-        Ez,
-        Gxy,
-        Gyz,
-        Gxz,
-        νxy,
-        νyx,
-        αx,
-        αy,
-        wf,
-        C,
-        S,
-        tEx,
-        tEy,
-        tEz,
-        tGxy,
-        tGyz,
-        tGxz,
-        tνxy,
-        tνxz,
-        tνyz,
-    )
+    return tEx, tEy, tEz, tGxy, tGyz, tGxz, tνxy, tνxz, tνyz
+
+
+def _item(group, index):
+    """Return a property that reads item index of the attribute group."""
+    return property(lambda self: getattr(self, group)[index])
+
+
+class LazyLaminate:
+    """
+    Laminate that calculates its properties when they are first used.
+
+    It has the same attributes as a Laminate. Related properties are
+    calculated together and remembered. For example, reading ABD integrates
+    the layers, but does not invert any matrix.
+    """
+
+    def __init__(self, name, layers):
+        """Create a LazyLaminate; see laminate() for the arguments."""
+        self.name = name
+        self.layers = layers
+        self._symmetric = isinstance(layers, SymmetricLayers)
+        if self._symmetric:
+            layers = layers.half
+        self._groups = _groups(la for la in layers if isinstance(la, Lamina))
+
+    def tolaminate(self):
+        """Calculate all properties and return them as a Laminate."""
+        return Laminate(*(getattr(self, field) for field in Laminate._fields))
+
+    @cached_property
+    def _totals(self):
+        return _totals(self._groups, self._symmetric)
+
+    @cached_property
+    def _stiffness(self):
+        thickness = self.thickness
+        if self._symmetric:
+            thickness /= 2
+        return _stiffness(self._groups, thickness)
+
+    @cached_property
+    def _plate(self):
+        return _plate(self._groups, self.thickness, self._symmetric)
+
+    @cached_property
+    def _inplane(self):
+        return _inplane(self.ABD, self.thickness)
+
+    @cached_property
+    def _transverse(self):
+        return _transverse(self.H, self.thickness)
+
+    @cached_property
+    def _thermal(self):
+        return _thermal(self.abd, self._plate[2])
+
+    @cached_property
+    def _tensor(self):
+        return _tensor(self.S)
+
+    thickness = _item("_totals", 0)
+    fiber_weight = _item("_totals", 1)
+    ρ = _item("_totals", 2)
+    vf = _item("_totals", 3)
+    resin_weight = _item("_totals", 4)
+    wf = _item("_totals", 5)
+    C = _item("_stiffness", 0)
+    S = _item("_stiffness", 1)
+    ABD = _item("_plate", 0)
+    H = _item("_plate", 1)
+    Ez = _item("_plate", 3)
+    abd = _item("_inplane", 0)
+    Ex = _item("_inplane", 1)
+    Ey = _item("_inplane", 2)
+    Gxy = _item("_inplane", 3)
+    νxy = _item("_inplane", 4)
+    νyx = _item("_inplane", 5)
+    h = _item("_transverse", 0)
+    Gyz = _item("_transverse", 1)
+    Gxz = _item("_transverse", 2)
+    αx = _item("_thermal", 0)
+    αy = _item("_thermal", 1)
+    tEx = _item("_tensor", 0)
+    tEy = _item("_tensor", 1)
+    tEz = _item("_tensor", 2)
+    tGxy = _item("_tensor", 3)
+    tGyz = _item("_tensor", 4)
+    tGxz = _item("_tensor", 5)
+    tνxy = _item("_tensor", 6)
+    tνxz = _item("_tensor", 7)
+    tνyz = _item("_tensor", 8)
+
+
+class LaminateBuilder(MutableSequence):
+    """
+    Mutable list of layers, for changing a laminate one layer at a time.
+
+    The integrals over the thickness are kept as running sums. The moments
+    are taken about the bottom of the stack, so adding or removing a layer
+    only changes the layers above it. When the laminate is built, the
+    moments are shifted to the midplane. For a stack of thickness h:
+
+        B = B' - h/2·A
+        D = D' - h·B' + h²/4·A
+
+    Appending, popping the last layer and replacing a layer by one of the
+    same thickness take constant time. Other changes take a time
+    proportional to the number of layers above the change.
+
+    Subtracting the contributions of a layer from the sums is not exact. To
+    keep these rounding errors from accumulating, the sums are calculated
+    again from the layers by build() after every _REFRESH subtractions.
+
+    Comments (strings) are allowed in the list, like in laminate(). Slices
+    can be read, but not assigned or deleted.
+    """
+
+    # Number of subtractions after which the sums are recalculated.
+    _REFRESH = 1000
+
+    def __init__(self, layers=()):
+        """Create a LaminateBuilder, optionally filled with layers."""
+        self._layers = []
+        # Position of the bottom of each layer, measured from the bottom.
+        self._bottom = []
+        # For each of Q̅11, Q̅12, Q̅16, Q̅22, Q̅26, Q̅66, Q̅s44, Q̅s45, Q̅s55 the
+        # sums of Q·t, Q·Δz²/2 and Q·Δz³/3. Then Nt (3), fiber_weight,
+        # Σρ·t, Σvf·t, resin_weight and Σt/E3.
+        self._sums = [0.0] * 35
+        self._C = lpm.Matrix.zeros(6)
+        self.thickness = 0.0
+        self._subtractions = 0
+        self.extend(layers)
+
+    def __len__(self):
+        return len(self._layers)
+
+    def __getitem__(self, index):
+        return self._layers[index]
+
+    def __setitem__(self, index, layer):
+        index = self._index(index)
+        old = self._layers[index]
+        zb = self._bottom[index]
+        self._update(old, zb, -1)
+        self._layers[index] = layer
+        self._update(layer, zb, 1)
+        self._shift(index + 1, _thickness(layer) - _thickness(old))
+
+    def __delitem__(self, index):
+        index = self._index(index)
+        old = self._layers[index]
+        self._update(old, self._bottom[index], -1)
+        del self._layers[index]
+        del self._bottom[index]
+        self._shift(index, -_thickness(old))
+
+    def insert(self, index, layer):
+        """Insert layer before index."""
+        size = len(self._layers)
+        if index < 0:
+            index = max(0, index + size)
+        index = min(index, size)
+        if index < len(self._bottom):
+            zb = self._bottom[index]
+        else:
+            zb = self.thickness
+        self._layers.insert(index, layer)
+        self._bottom.insert(index, zb)
+        self._shift(index + 1, _thickness(layer))
+        self._update(layer, zb, 1)
+
+    def build(self, name):
+        """Return the current stack as a Laminate."""
+        layers = list(self._layers)
+        assert any(isinstance(la, Lamina) for la in layers), "no layers in the laminate"
+        assert (
+            isinstance(name, str) and len(name) > 0
+        ), "laminate name must be a non-empty string"
+        if self._subtractions > self._REFRESH:
+            self._recalculate()
+        t = self.thickness
+        s = self._sums
+        A, Bb, Db = s[0:27:3], s[1:27:3], s[2:27:3]
+        B = [b - t / 2 * a for a, b in zip(A, Bb)]
+        D = [d - t * b + t * t / 4 * a for a, b, d in zip(A, Bb, Db)]
+        # The shear factor sb from _plate, summed over the layers.
+        h44, h45, h55 = (5 / 4 * a - 5 / t**2 * d for a, d in zip(A[6:], D[6:]))
+        H = lpm.clean([[h44, h45], [h45, h55]])
+        A, B, D = _sym3(A), _sym3(B), _sym3(D)
+        ABD = lpm.clean([a + b for a, b in zip(A, B)] + [b + d for b, d in zip(B, D)])
+        fiber_weight, ρt, vft, resin_weight, c3 = s[30:]
+        totals = (
+            t,
+            fiber_weight,
+            ρt / t,
+            vft / t,
+            resin_weight,
+            fiber_weight / (fiber_weight + resin_weight),
+        )
+        C = lpm.Matrix.zeros(6)
+        C.iadd_scaled(self._C, 1 / t)
+        C = C.iclean().tolist()
+        S = lpm.inv(C)
+        return _finish(name, layers, totals, C, S, ABD, H, s[27:30], t / c3)
+
+    def _index(self, index):
+        if isinstance(index, slice):
+            raise TypeError("LaminateBuilder only changes one layer at a time")
+        if index < 0:
+            index += len(self._layers)
+        if not 0 <= index < len(self._layers):
+            raise IndexError("layer index out of range")
+        return index
+
+    def _shift(self, start, dz):
+        """Move the layers from start upwards by dz."""
+        self.thickness += dz
+        if dz == 0:
+            return
+        for n in range(start, len(self._layers)):
+            la, zb = self._layers[n], self._bottom[n]
+            self._update(la, zb, -1)
+            self._bottom[n] = zb + dz
+            self._update(la, zb + dz, 1)
+
+    def _recalculate(self):
+        """Calculate the sums and positions again from the layers."""
+        self._sums = [0.0] * 35
+        self._C = lpm.Matrix.zeros(6)
+        zb = 0.0
+        for n, la in enumerate(self._layers):
+            self._bottom[n] = zb
+            self._update(la, zb, 1)
+            zb += _thickness(la)
+        self.thickness = zb
+        self._subtractions = 0
+
+    def _update(self, la, zb, sign):
+        """Add (sign=1) or subtract (sign=-1) the contributions of layer la."""
+        if not isinstance(la, Lamina):
+            return
+        if sign < 0:
+            self._subtractions += 1
+        t = la.thickness
+        zt = zb + t
+        m1 = sign * t
+        m2 = sign * (zt * zt - zb * zb) / 2
+        m3 = sign * (zt * zt * zt - zb * zb * zb) / 3
+        s = self._sums
+        q = (la.Q̅11, la.Q̅12, la.Q̅16, la.Q̅22, la.Q̅26, la.Q̅66)
+        qs = (la.Q̅s44, la.Q̅s45, la.Q̅s55)
+        for k, v in enumerate(q + qs):
+            s[3 * k] += v * m1
+            s[3 * k + 1] += v * m2
+            s[3 * k + 2] += v * m3
+        s[27] += (la.Q̅11 * la.αx + la.Q̅12 * la.αy + la.Q̅16 * la.αxy) * m1
+        s[28] += (la.Q̅12 * la.αx + la.Q̅22 * la.αy + la.Q̅26 * la.αxy) * m1
+        s[29] += (la.Q̅16 * la.αx + la.Q̅26 * la.αy + la.Q̅66 * la.αxy) * m1
+        s[30] += sign * la.fiber_weight
+        s[31] += la.ρ * m1
+        s[32] += la.vf * m1
+        s[33] += sign * la.resin_weight
+        s[34] += m1 / la.E3
+        self._C.iadd_scaled(la.C, m1)
+
+
+def _thickness(layer):
+    """Return the thickness of a layer; 0 for comments."""
+    return layer.thickness if isinstance(layer, Lamina) else 0.0
+
+
+def _sym3(v):
+    """Return the rows of the symmetric 3×3 matrix with upper triangle v[:6]."""
+    return [[v[0], v[1], v[2]], [v[1], v[3], v[4]], [v[2], v[4], v[5]]]
+
+
+class SymmetricLayers(Sequence):
+    """
+    Read-only sequence of the layers of a symmetric laminate.
+
+    It is made from the lower half of the laminate. The upper half refers to
+    the same objects as the lower half; they are not copied. The comments
+    are placed in the upper half as described in doc/symmetric-laminates.rst.
+
+    laminate() only integrates the lower half of a SymmetricLayers.
+    """
+
+    def __init__(self, half):
+        """Create the symmetric layers from the lower half."""
+        self.half = tuple(half)
+        self.extension = tuple(_extended(self.half))
+        self._layers = self.half + self.extension
+
+    def __len__(self):
+        return len(self._layers)
+
+    def __getitem__(self, index):
+        return self._layers[index]
+
+    def __eq__(self, other):
+        if isinstance(other, (Sequence, list)) and not isinstance(other, str):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"SymmetricLayers({list(self.half)!r})"
+
+
+def _extended(original):
+    """
+    Create the extension to the `original` list to make the laminate symmetric.
+    The position of the comments is taken into account.
+    """
+    if sum(1 for la in original if isinstance(la, str)) == 0:
+        return original[::-1]
+    layers = list(original)
+    if not isinstance(layers[-1], str):
+        layers.append("__")
+    if not isinstance(layers[0], str):
+        layers.insert(0, "unknown")
+    idx = [n for n, v in enumerate(layers) if isinstance(v, str)]
+    pairs = list(zip(idx[:-1], idx[1:]))[::-1]
+    extension = []
+    for s, e in pairs:
+        if layers[s] == "__":
+            extension += layers[s + 1 : e][::-1]  # noqa
+        else:
+            extension += [layers[s]] + layers[s + 1 : e][::-1]  # noqa
+    return extension
 
 
 def tbar(degrees):
     """Matrix for rotating lamina coordinates around the z-axis."""
-    θ = math.radians(degrees)
-    c, s = math.cos(θ), math.sin(θ)
+    Tbar = rotation_cache.get(degrees, _rotation, degrees).Tbar
+    return [list(row) for row in Tbar]
+
+
+def _rotation(degrees):
+    """
+    Calculate the data for rotating lamina coordinates around the z-axis.
+    Multiples of 90° yield exact values.
+
+    Returns:
+        A Rotation tuple.
+    """
+    degrees = float(degrees)
+    if degrees % 90 == 0:
+        c, s = ((1.0, 0.0), (0.0, 1.0), (-1.0, 0.0), (0.0, -1.0))[
+            int(degrees // 90) % 4
+        ]
+    else:
+        θ = math.radians(degrees)
+        c, s = math.cos(θ), math.sin(θ)
+    c2, s2 = c * c, s * s
     # Barbero:2008 p. 12 & 15
-    Tbar = [
-        [c * c, s * s, 0, 0, 0, c * s],
-        [s * s, c * c, 0, 0, 0, -c * s],
-        [0, 0, 1, 0, 0, 0],
-        [0, 0, 0, c, -s, 0],
-        [0, 0, 0, s, c, 0],
-        [-2 * c * s, 2 * c * s, 0, 0, 0, c * c - s * s],
-    ]
-    return Tbar
+    Tbar = (
+        (c2, s2, 0.0, 0.0, 0.0, c * s),
+        (s2, c2, 0.0, 0.0, 0.0, -c * s),
+        (0.0, 0.0, 1.0, 0.0, 0.0, 0.0),
+        (0.0, 0.0, 0.0, c, -s, 0.0),
+        (0.0, 0.0, 0.0, s, c, 0.0),
+        (-2 * c * s, 2 * c * s, 0.0, 0.0, 0.0, c2 - s2),
+    )
+    return Rotation(c, s, c2, s2, c2 * c, s2 * s, c2 * c2, s2 * s2, Tbar)
 
 
 def isortho(C):
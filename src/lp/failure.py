@@ -0,0 +1,287 @@
+# file: failure.py
+# vim:fileencoding=utf-8:ft=python:fdm=marker
+#
+# Copyright © 2026 R.F. Smith <rsmith@xs4all.nl>. All rights reserved.
+# SPDX-License-Identifier: BSD-2-Clause
+# Created: 2026-10-17T01:31:55+0200
+# Last modified: 2026-10-17T14:31:02+0200
+"""
+First ply failure of laminates. This requires NumPy.
+
+The following failure criteria for plane stress in the material axes of a ply
+are supported:
+
+* "max-stress": maximum stress.
+* "tsai-wu": Tsai–Wu, with F12 = -√(F11·F22)/2.
+* "hashin": Hashin (1980), with the transverse shear strength equal to Yc/2.
+
+Every criterion consists of one or more failure modes. Every mode is of the
+form σᵀ·F·σ + g·σ = 1, possibly limited to a sign of σ1 or σ2. Along a ray
+σ = λ·a + b in stress space, that is a quadratic equation in the load factor
+λ. So the first ply failure load of all rays, plies and modes is calculated at
+once, without iteration.
+
+    env = envelope(lam, plane=("Nx", "Ny"), count=3600)
+    Nx, Ny = (env.directions * env.factor[:, None])[:, :2].T
+
+The strengths of the plies are Strength tuples. The parser attaches those
+given by "a:" directives to the fibers; see parser.allowables.
+"""
+
+import math
+
+from lp.loads import plies, solve, _influence
+from lp.parser import allowables as _allowables
+from lp.types import Envelope, Strength
+
+__all__ = ["CRITERIA", "LOADS", "strengths", "indices", "envelope"]
+
+CRITERIA = ("max-stress", "tsai-wu", "hashin")
+# Names of the components of a load vector.
+LOADS = ("Nx", "Ny", "Nxy", "Mx", "My", "Mxy")
+
+
+def strengths(layers, allowables=None):
+    """
+    Return the strengths of the plies in a laminate.
+
+    Arguments:
+        layers: The layers of a laminate. Comments are skipped.
+        allowables: A Strength for all plies, a dictionary of Strength keyed
+            by fiber name or a sequence of a Strength per ply. If None, the
+            strengths that the parser attached to the fibers are used, and
+            the generic strengths for fibers that have none.
+
+    Returns:
+        An array of shape (P, 5) with Xt, Xc, Yt, Yc and S of every ply.
+    """
+    import numpy as np
+
+    layers = [la for la in layers if not isinstance(la, str)]
+    if allowables is None:
+        generic, _ = _allowables(None)
+        allowables = [la.fiber.strength or generic.get(la.fiber.name) for la in layers]
+        for la, s in zip(layers, allowables):
+            if s is None:
+                raise ValueError(f"no strengths for fiber '{la.fiber.name}'")
+    if isinstance(allowables, Strength):
+        rv = [allowables] * len(layers)
+    elif isinstance(allowables, dict):
+        try:
+            rv = [allowables[la.fiber.name] for la in layers]
+        except KeyError as e:
+            raise ValueError(f"no strengths for fiber {e}") from None
+    else:
+        rv = list(allowables)
+        if len(rv) != len(layers):
+            raise ValueError("the number of strengths and plies differ")
+    return np.array([s[:5] for s in rv], dtype=float)
+
+
+def _modes(criterion, allowables):
+    """
+    Return the failure modes of a criterion.
+
+    Arguments:
+        criterion: Name of the criterion.
+        allowables: Array of strengths as returned by strengths.
+
+    Returns:
+        A list of (label, F, g, condition) tuples. F has shape (P, 3, 3) or
+        is None, g has shape (P, 3). The condition (index, sign) means that
+        the mode only applies if sign·σ[index] ≥ 0. It is None if the mode
+        always applies.
+    """
+    import numpy as np
+
+    Xt, Xc, Yt, Yc, S = allowables.T
+    P = len(allowables)
+    zero = np.zeros(P)
+
+    def vector(a=zero, b=zero, c=zero):
+        return np.column_stack([a, b, c])
+
+    def matrix(F11=zero, F22=zero, F66=zero, F12=zero):
+        F = np.zeros((P, 3, 3))
+        F[:, 0, 0], F[:, 1, 1], F[:, 2, 2] = F11, F22, F66
+        F[:, 0, 1] = F[:, 1, 0] = F12
+        return F
+
+    if criterion == "max-stress":
+        return [
+            ("σ1 tension", None, vector(a=1 / Xt), None),
+            ("σ1 compression", None, vector(a=-1 / Xc), None),
+            ("σ2 tension", None, vector(b=1 / Yt), None),
+            ("σ2 compression", None, vector(b=-1 / Yc), None),
+            ("τ12 positive", None, vector(c=1 / S), None),
+            ("τ12 negative", None, vector(c=-1 / S), None),
+        ]
+    if criterion == "tsai-wu":
+        F11, F22 = 1 / (Xt * Xc), 1 / (Yt * Yc)
+        F = matrix(F11, F22, 1 / S**2, -np.sqrt(F11 * F22) / 2)
+        return [("", F, vector(1 / Xt - 1 / Xc, 1 / Yt - 1 / Yc), None)]
+    if criterion == "hashin":
+        shear = 1 / S**2
+        return [
+            ("fiber tension", matrix(F11=1 / Xt**2, F66=shear), vector(), (0, 1)),
+            ("fiber compression", matrix(F11=1 / Xc**2), vector(), (0, -1)),
+            ("matrix tension", matrix(F22=1 / Yt**2, F66=shear), vector(), (1, 1)),
+            (
+                "matrix compression",
+                matrix(F22=1 / Yc**2, F66=shear),
+                vector(),
+                (1, -1),
+            ),
+        ]
+    raise ValueError(f'unknown criterion "{criterion}"')
+
+
+def indices(lam, loads, allowables=None, ΔT=0.0, criterion="tsai-wu"):
+    """
+    Calculate the failure indices of the plies for load cases.
+
+    Arguments:
+        lam: A Laminate.
+        loads: Array of load cases with shape (n, 6); see loads.solve.
+        allowables: The strengths of the plies; see strengths.
+        ΔT: Temperature difference; a number or an array of n numbers.
+        criterion: One of CRITERIA.
+
+    Returns:
+        An array of shape (n, P, 2) with the failure index at the bottom and
+        top of every ply. A ply fails when its index reaches 1. For the
+        maximum stress criterion the index is the largest stress ratio. For
+        the other criteria it is the value of the left hand side of the
+        criterion.
+    """
+    import numpy as np
+
+    modes = _modes(criterion, strengths(lam.layers, allowables))
+    σ = solve(plies(lam), loads, ΔT).material_stress
+    rv = np.zeros(σ.shape[:-1])
+    for _, F, g, condition in modes:
+        f = np.einsum("npki,pi->npk", σ, g)
+        if F is not None:
+            f += np.einsum("npki,pij,npkj->npk", σ, F, σ)
+        if condition is not None:
+            index, sign = condition
+            f = np.where(sign * σ[..., index] >= 0, f, 0.0)
+        np.maximum(rv, f, out=rv)
+    return rv
+
+
+def envelope(
+    lam, allowables=None, plane=("Nx", "Ny"), count=3600, criterion="tsai-wu", ΔT=0.0
+):
+    """
+    Calculate the first ply failure envelope of a laminate.
+
+    The loads are increased along count rays evenly distributed over a plane
+    in load space, until the first ply fails. A temperature difference is
+    applied before the loads.
+
+    Arguments:
+        lam: A Laminate.
+        allowables: The strengths of the plies; see strengths.
+        plane: Names of the two load components that span the plane; see
+            LOADS.
+        count: Number of rays.
+        criterion: One of CRITERIA, or a sequence of them. In the latter
+            case, the lowest failure load of the criteria is used.
+        ΔT: Temperature difference.
+
+    Returns:
+        An Envelope. Its directions are the unit load vectors of the rays,
+        with shape (count, 6). The load factor, the index of the critical ply
+        and face (0 for the bottom, 1 for the top) and the name of the
+        failure mode have shape (count,). The load factor is inf if no
+        ply fails along a ray, and 0 if a ply has already failed by ΔT.
+    """
+    import numpy as np
+
+    try:
+        first, second = (LOADS.index(p) for p in plane)
+    except ValueError:
+        raise ValueError(f"plane must be two of {', '.join(LOADS)}") from None
+    criteria = [criterion] if isinstance(criterion, str) else list(criterion)
+    allowables = strengths(lam.layers, allowables)
+    stack = plies(lam)
+    θ = np.arange(count) * (2 * math.pi / count)
+    directions = np.zeros((count, 6))
+    directions[:, first] = np.cos(θ)
+    directions[:, second] = np.sin(θ)
+    # Material stresses per unit load and for ΔT.
+    _, G = _influence(stack)
+    G = G.T.reshape(4, *stack.z.shape, 3, 7)[3]
+    a = np.einsum("pkim,nm->inpk", G[..., :6], directions)
+    b = ΔT * np.moveaxis(G[..., 6], -1, 0)
+    labels, factors = [], []
+    for name in criteria:
+        for label, F, g, condition in _modes(name, allowables):
+            labels.append(f"{name} {label}".strip())
+            factors.append(_factor(a, b, F, g, condition))
+    factors = np.stack(factors)
+    flat = factors.reshape(len(factors), count, -1)
+    index = np.argmin(flat.transpose(1, 0, 2).reshape(count, -1), axis=1)
+    mode, position = np.divmod(index, flat.shape[2])
+    ply, face = np.divmod(position, 2)
+    factor = flat[mode, np.arange(count), position]
+    return Envelope(directions, factor, ply, face, np.asarray(labels)[mode])
+
+
+def _factor(a, b, F, g, condition):
+    """
+    Solve the load factor λ where σ = λ·a + b satisfies σᵀ·F·σ + g·σ = 1.
+
+    Arguments:
+        a: Stresses per unit load, shape (3, n, P, 2).
+        b: Stresses at zero load, shape (3, P, 2).
+        F, g, condition: A failure mode; see _modes.
+
+    Returns:
+        The smallest λ ≥ 0 for every ray, ply and face, with shape (n, P, 2).
+        It is inf if there is no solution.
+    """
+    import numpy as np
+
+    # The forms are sparse, so they are expanded per component.
+    A = np.zeros(a.shape[1:])
+    B = np.zeros(a.shape[1:])
+    C = np.full(b.shape[1:], -1.0)
+    for i in range(3):
+        gi = g[:, i, None]
+        if gi.any():
+            B += gi * a[i]
+            C += gi * b[i]
+        if F is None:
+            continue
+        for j in range(3):
+            Fij = F[:, i, j, None]
+            if Fij.any():
+                A += Fij * a[i] * a[j]
+                B += 2 * Fij * a[i] * b[j]
+                C += Fij * b[i] * b[j]
+    C = np.broadcast_to(C, A.shape)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        disc = B * B - 4 * A * C
+        root = np.sqrt(np.where(disc >= 0, disc, np.nan))
+        # Numerically stable roots of a quadratic.
+        q = -(B + np.copysign(root, B)) / 2
+        linear = np.abs(A) <= 1e-12 * (np.abs(B) + np.abs(C))
+        roots = [np.where(linear, -C / B, q / A), np.where(linear, np.nan, C / q)]
+    rv = np.full(A.shape, np.inf)
+    for λ in roots:
+        valid = np.isfinite(λ) & (λ >= 0)
+        if condition is not None:
+            index, sign = condition
+            ai = a[index]
+            # Allow for rounding errors when the stress is zero at failure.
+            tolerance = 1e-9 * (np.abs(ai) * np.where(valid, λ, 0) + 1)
+            valid &= sign * (λ * ai + b[index]) >= -tolerance
+        rv = np.where(valid & (λ < rv), λ, rv)
+    # Already failed without load.
+    failed = C >= 0
+    if condition is not None:
+        index, sign = condition
+        failed = failed & (sign * b[index] >= 0)
+    return np.where(failed, 0.0, rv)
@@ -4,7 +4,7 @@
 # Copyright © 2022 R.F. Smith <rsmith@xs4all.nl>
 # SPDX-License-Identifier: MIT
 # Created: 2022-01-29T10:25:29+0100
-# Last modified: 2022-01-29T11:17:26+0100
+# Last modified: 2026-10-17T01:31:55+0200
 
 resins = [
     (-1, "r: 2900 0.25 40e-6   1.15 generic-epoxy"),
@@ -17,3 +17,10 @@ fibers = [
     (-1, "f: 230000 0.27 -0.38e-6 1.80 generic-carbon"),
     (-1, "f: 124000 0.36 -4.9e-6  1.44 generic-aramid49"),
 ]
+
+# Typical strengths of unidirectional plies: Xt Xc Yt Yc S, in MPa.
+allowables = [
+    (-1, "a: 1000 600  35 120 70 generic-e-glas"),
+    (-1, "a: 1500 1200 50 250 70 generic-carbon"),
+    (-1, "a: 1400 280  30 140 60 generic-aramid49"),
+]
@@ -0,0 +1,353 @@
+# file: kernels.py
+# vim:fileencoding=utf-8:ft=python
+#
+# Generated by tools/gen-kernels.py; do not edit.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+"""
+Straight-line matrix functions for 2×2, 3×3 and 6×6 matrices.
+
+These are used by lp.matrix when the size of the matrix matches.
+The arguments can be lists of lists or lp.matrix.Matrix.
+"""
+
+# fmt: off
+
+
+def det2(m):
+    """Determinant of a 2×2 matrix."""
+    (a00, a01), (a10, a11) = m
+    c00 = a11
+    c01 = -a10
+    d = a00 * c00 + a01 * c01
+    return d
+
+
+def invdet2(m):
+    """Inverse and determinant of a 2×2 matrix, or None if they cannot
+    be calculated with this method."""
+    (a00, a01), (a10, a11) = m
+    c00 = a11
+    c01 = -a10
+    c10 = -a01
+    c11 = a00
+    d = a00 * c00 + a01 * c01
+    if d == 0.0:
+        return None
+    r = 1.0 / d
+    i00 = c00 * r
+    i01 = c10 * r
+    i10 = c01 * r
+    i11 = c11 * r
+    return [
+        [i00, i01],
+        [i10, i11],
+    ], d
+
+
+def matmul2(a, b):
+    """Product of two 2×2 matrices."""
+    (a00, a01), (a10, a11) = a
+    (b00, b01), (b10, b11) = b
+    return [
+        [a00 * b00 + a01 * b10, a00 * b01 + a01 * b11],
+        [a10 * b00 + a11 * b10, a10 * b01 + a11 * b11],
+    ]
+
+
+def congruence2(t, c):
+    """Return tᵀ·c·t for 2×2 matrices."""
+    (t00, t01), (t10, t11) = t
+    (c00, c01), (c10, c11) = c
+    u00 = c00 * t00 + c01 * t10
+    u01 = c00 * t01 + c01 * t11
+    u10 = c10 * t00 + c11 * t10
+    u11 = c10 * t01 + c11 * t11
+    return [
+        [t00 * u00 + t10 * u10, t00 * u01 + t10 * u11],
+        [t01 * u00 + t11 * u10, t01 * u01 + t11 * u11],
+    ]
+
+
+def det3(m):
+    """Determinant of a 3×3 matrix."""
+    (a00, a01, a02), (a10, a11, a12), (a20, a21, a22) = m
+    c00 = a11 * a22 - a12 * a21
+    c01 = -(a10 * a22 - a12 * a20)
+    c02 = a10 * a21 - a11 * a20
+    d = a00 * c00 + a01 * c01 + a02 * c02
+    return d
+
+
+def invdet3(m):
+    """Inverse and determinant of a 3×3 matrix, or None if they cannot
+    be calculated with this method."""
+    (a00, a01, a02), (a10, a11, a12), (a20, a21, a22) = m
+    c00 = a11 * a22 - a12 * a21
+    c01 = -(a10 * a22 - a12 * a20)
+    c02 = a10 * a21 - a11 * a20
+    c10 = -(a01 * a22 - a02 * a21)
+    c11 = a00 * a22 - a02 * a20
+    c12 = -(a00 * a21 - a01 * a20)
+    c20 = a01 * a12 - a02 * a11
+    c21 = -(a00 * a12 - a02 * a10)
+    c22 = a00 * a11 - a01 * a10
+    d = a00 * c00 + a01 * c01 + a02 * c02
+    if d == 0.0:
+        return None
+    r = 1.0 / d
+    i00 = c00 * r
+    i01 = c10 * r
+    i02 = c20 * r
+    i10 = c01 * r
+    i11 = c11 * r
+    i12 = c21 * r
+    i20 = c02 * r
+    i21 = c12 * r
+    i22 = c22 * r
+    return [
+        [i00, i01, i02],
+        [i10, i11, i12],
+        [i20, i21, i22],
+    ], d
+
+
+def matmul3(a, b):
+    """Product of two 3×3 matrices."""
+    (a00, a01, a02), (a10, a11, a12), (a20, a21, a22) = a
+    (b00, b01, b02), (b10, b11, b12), (b20, b21, b22) = b
+    return [
+        [a00 * b00 + a01 * b10 + a02 * b20, a00 * b01 + a01 * b11 + a02 * b21, a00 * b02 + a01 * b12 + a02 * b22],
+        [a10 * b00 + a11 * b10 + a12 * b20, a10 * b01 + a11 * b11 + a12 * b21, a10 * b02 + a11 * b12 + a12 * b22],
+        [a20 * b00 + a21 * b10 + a22 * b20, a20 * b01 + a21 * b11 + a22 * b21, a20 * b02 + a21 * b12 + a22 * b22],
+    ]
+
+
+def congruence3(t, c):
+    """Return tᵀ·c·t for 3×3 matrices."""
+    (t00, t01, t02), (t10, t11, t12), (t20, t21, t22) = t
+    (c00, c01, c02), (c10, c11, c12), (c20, c21, c22) = c
+    u00 = c00 * t00 + c01 * t10 + c02 * t20
+    u01 = c00 * t01 + c01 * t11 + c02 * t21
+    u02 = c00 * t02 + c01 * t12 + c02 * t22
+    u10 = c10 * t00 + c11 * t10 + c12 * t20
+    u11 = c10 * t01 + c11 * t11 + c12 * t21
+    u12 = c10 * t02 + c11 * t12 + c12 * t22
+    u20 = c20 * t00 + c21 * t10 + c22 * t20
+    u21 = c20 * t01 + c21 * t11 + c22 * t21
+    u22 = c20 * t02 + c21 * t12 + c22 * t22
+    return [
+        [t00 * u00 + t10 * u10 + t20 * u20, t00 * u01 + t10 * u11 + t20 * u21, t00 * u02 + t10 * u12 + t20 * u22],
+        [t01 * u00 + t11 * u10 + t21 * u20, t01 * u01 + t11 * u11 + t21 * u21, t01 * u02 + t11 * u12 + t21 * u22],
+        [t02 * u00 + t12 * u10 + t22 * u20, t02 * u01 + t12 * u11 + t22 * u21, t02 * u02 + t12 * u12 + t22 * u22],
+    ]
+
+
+def det6(m):
+    """Determinant of a 6×6 matrix."""
+    (a00, a01, a02, a03, a04, a05), (a10, a11, a12, a13, a14, a15), (a20, a21, a22, a23, a24, a25), (a30, a31, a32, a33, a34, a35), (a40, a41, a42, a43, a44, a45), (a50, a51, a52, a53, a54, a55) = m
+    ps = max(abs(a00), abs(a01), abs(a02), abs(a10), abs(a11), abs(a12), abs(a20), abs(a21), abs(a22))
+    pc00 = a11 * a22 - a12 * a21
+    pc01 = -(a10 * a22 - a12 * a20)
+    pc02 = a10 * a21 - a11 * a20
+    pc10 = -(a01 * a22 - a02 * a21)
+    pc11 = a00 * a22 - a02 * a20
+    pc12 = -(a00 * a21 - a01 * a20)
+    pc20 = a01 * a12 - a02 * a11
+    pc21 = -(a00 * a12 - a02 * a10)
+    pc22 = a00 * a11 - a01 * a10
+    pd = a00 * pc00 + a01 * pc01 + a02 * pc02
+    if abs(pd) <= 1e-12 * ps * ps * ps:
+        return None
+    pr = 1.0 / pd
+    pi00 = pc00 * pr
+    pi01 = pc10 * pr
+    pi02 = pc20 * pr
+    pi10 = pc01 * pr
+    pi11 = pc11 * pr
+    pi12 = pc21 * pr
+    pi20 = pc02 * pr
+    pi21 = pc12 * pr
+    pi22 = pc22 * pr
+    y00 = pi00 * a03 + pi01 * a13 + pi02 * a23
+    y01 = pi00 * a04 + pi01 * a14 + pi02 * a24
+    y02 = pi00 * a05 + pi01 * a15 + pi02 * a25
+    y10 = pi10 * a03 + pi11 * a13 + pi12 * a23
+    y11 = pi10 * a04 + pi11 * a14 + pi12 * a24
+    y12 = pi10 * a05 + pi11 * a15 + pi12 * a25
+    y20 = pi20 * a03 + pi21 * a13 + pi22 * a23
+    y21 = pi20 * a04 + pi21 * a14 + pi22 * a24
+    y22 = pi20 * a05 + pi21 * a15 + pi22 * a25
+    z00 = a33 - (a30 * y00 + a31 * y10 + a32 * y20)
+    z01 = a34 - (a30 * y01 + a31 * y11 + a32 * y21)
+    z02 = a35 - (a30 * y02 + a31 * y12 + a32 * y22)
+    z10 = a43 - (a40 * y00 + a41 * y10 + a42 * y20)
+    z11 = a44 - (a40 * y01 + a41 * y11 + a42 * y21)
+    z12 = a45 - (a40 * y02 + a41 * y12 + a42 * y22)
+    z20 = a53 - (a50 * y00 + a51 * y10 + a52 * y20)
+    z21 = a54 - (a50 * y01 + a51 * y11 + a52 * y21)
+    z22 = a55 - (a50 * y02 + a51 * y12 + a52 * y22)
+    zc00 = z11 * z22 - z12 * z21
+    zc01 = -(z10 * z22 - z12 * z20)
+    zc02 = z10 * z21 - z11 * z20
+    zd = z00 * zc00 + z01 * zc01 + z02 * zc02
+    return pd * zd
+
+
+def invdet6(m):
+    """Inverse and determinant of a 6×6 matrix, or None if they cannot
+    be calculated with this method."""
+    (a00, a01, a02, a03, a04, a05), (a10, a11, a12, a13, a14, a15), (a20, a21, a22, a23, a24, a25), (a30, a31, a32, a33, a34, a35), (a40, a41, a42, a43, a44, a45), (a50, a51, a52, a53, a54, a55) = m
+    ps = max(abs(a00), abs(a01), abs(a02), abs(a10), abs(a11), abs(a12), abs(a20), abs(a21), abs(a22))
+    pc00 = a11 * a22 - a12 * a21
+    pc01 = -(a10 * a22 - a12 * a20)
+    pc02 = a10 * a21 - a11 * a20
+    pc10 = -(a01 * a22 - a02 * a21)
+    pc11 = a00 * a22 - a02 * a20
+    pc12 = -(a00 * a21 - a01 * a20)
+    pc20 = a01 * a12 - a02 * a11
+    pc21 = -(a00 * a12 - a02 * a10)
+    pc22 = a00 * a11 - a01 * a10
+    pd = a00 * pc00 + a01 * pc01 + a02 * pc02
+    if abs(pd) <= 1e-12 * ps * ps * ps:
+        return None
+    pr = 1.0 / pd
+    pi00 = pc00 * pr
+    pi01 = pc10 * pr
+    pi02 = pc20 * pr
+    pi10 = pc01 * pr
+    pi11 = pc11 * pr
+    pi12 = pc21 * pr
+    pi20 = pc02 * pr
+    pi21 = pc12 * pr
+    pi22 = pc22 * pr
+    y00 = pi00 * a03 + pi01 * a13 + pi02 * a23
+    y01 = pi00 * a04 + pi01 * a14 + pi02 * a24
+    y02 = pi00 * a05 + pi01 * a15 + pi02 * a25
+    y10 = pi10 * a03 + pi11 * a13 + pi12 * a23
+    y11 = pi10 * a04 + pi11 * a14 + pi12 * a24
+    y12 = pi10 * a05 + pi11 * a15 + pi12 * a25
+    y20 = pi20 * a03 + pi21 * a13 + pi22 * a23
+    y21 = pi20 * a04 + pi21 * a14 + pi22 * a24
+    y22 = pi20 * a05 + pi21 * a15 + pi22 * a25
+    z00 = a33 - (a30 * y00 + a31 * y10 + a32 * y20)
+    z01 = a34 - (a30 * y01 + a31 * y11 + a32 * y21)
+    z02 = a35 - (a30 * y02 + a31 * y12 + a32 * y22)
+    z10 = a43 - (a40 * y00 + a41 * y10 + a42 * y20)
+    z11 = a44 - (a40 * y01 + a41 * y11 + a42 * y21)
+    z12 = a45 - (a40 * y02 + a41 * y12 + a42 * y22)
+    z20 = a53 - (a50 * y00 + a51 * y10 + a52 * y20)
+    z21 = a54 - (a50 * y01 + a51 * y11 + a52 * y21)
+    z22 = a55 - (a50 * y02 + a51 * y12 + a52 * y22)
+    zc00 = z11 * z22 - z12 * z21
+    zc01 = -(z10 * z22 - z12 * z20)
+    zc02 = z10 * z21 - z11 * z20
+    zc10 = -(z01 * z22 - z02 * z21)
+    zc11 = z00 * z22 - z02 * z20
+    zc12 = -(z00 * z21 - z01 * z20)
+    zc20 = z01 * z12 - z02 * z11
+    zc21 = -(z00 * z12 - z02 * z10)
+    zc22 = z00 * z11 - z01 * z10
+    zd = z00 * zc00 + z01 * zc01 + z02 * zc02
+    if zd == 0.0:
+        return None
+    zr = 1.0 / zd
+    zi00 = zc00 * zr
+    zi01 = zc10 * zr
+    zi02 = zc20 * zr
+    zi10 = zc01 * zr
+    zi11 = zc11 * zr
+    zi12 = zc21 * zr
+    zi20 = zc02 * zr
+    zi21 = zc12 * zr
+    zi22 = zc22 * zr
+    x00 = a30 * pi00 + a31 * pi10 + a32 * pi20
+    x01 = a30 * pi01 + a31 * pi11 + a32 * pi21
+    x02 = a30 * pi02 + a31 * pi12 + a32 * pi22
+    x10 = a40 * pi00 + a41 * pi10 + a42 * pi20
+    x11 = a40 * pi01 + a41 * pi11 + a42 * pi21
+    x12 = a40 * pi02 + a41 * pi12 + a42 * pi22
+    x20 = a50 * pi00 + a51 * pi10 + a52 * pi20
+    x21 = a50 * pi01 + a51 * pi11 + a52 * pi21
+    x22 = a50 * pi02 + a51 * pi12 + a52 * pi22
+    w00 = y00 * zi00 + y01 * zi10 + y02 * zi20
+    w01 = y00 * zi01 + y01 * zi11 + y02 * zi21
+    w02 = y00 * zi02 + y01 * zi12 + y02 * zi22
+    w10 = y10 * zi00 + y11 * zi10 + y12 * zi20
+    w11 = y10 * zi01 + y11 * zi11 + y12 * zi21
+    w12 = y10 * zi02 + y11 * zi12 + y12 * zi22
+    w20 = y20 * zi00 + y21 * zi10 + y22 * zi20
+    w21 = y20 * zi01 + y21 * zi11 + y22 * zi21
+    w22 = y20 * zi02 + y21 * zi12 + y22 * zi22
+    return [
+        [pi00 + w00 * x00 + w01 * x10 + w02 * x20, pi01 + w00 * x01 + w01 * x11 + w02 * x21, pi02 + w00 * x02 + w01 * x12 + w02 * x22, -w00, -w01, -w02],
+        [pi10 + w10 * x00 + w11 * x10 + w12 * x20, pi11 + w10 * x01 + w11 * x11 + w12 * x21, pi12 + w10 * x02 + w11 * x12 + w12 * x22, -w10, -w11, -w12],
+        [pi20 + w20 * x00 + w21 * x10 + w22 * x20, pi21 + w20 * x01 + w21 * x11 + w22 * x21, pi22 + w20 * x02 + w21 * x12 + w22 * x22, -w20, -w21, -w22],
+        [-(zi00 * x00 + zi01 * x10 + zi02 * x20), -(zi00 * x01 + zi01 * x11 + zi02 * x21), -(zi00 * x02 + zi01 * x12 + zi02 * x22), zi00, zi01, zi02],
+        [-(zi10 * x00 + zi11 * x10 + zi12 * x20), -(zi10 * x01 + zi11 * x11 + zi12 * x21), -(zi10 * x02 + zi11 * x12 + zi12 * x22), zi10, zi11, zi12],
+        [-(zi20 * x00 + zi21 * x10 + zi22 * x20), -(zi20 * x01 + zi21 * x11 + zi22 * x21), -(zi20 * x02 + zi21 * x12 + zi22 * x22), zi20, zi21, zi22],
+    ], pd * zd
+
+
+def matmul6(a, b):
+    """Product of two 6×6 matrices."""
+    (a00, a01, a02, a03, a04, a05), (a10, a11, a12, a13, a14, a15), (a20, a21, a22, a23, a24, a25), (a30, a31, a32, a33, a34, a35), (a40, a41, a42, a43, a44, a45), (a50, a51, a52, a53, a54, a55) = a
+    (b00, b01, b02, b03, b04, b05), (b10, b11, b12, b13, b14, b15), (b20, b21, b22, b23, b24, b25), (b30, b31, b32, b33, b34, b35), (b40, b41, b42, b43, b44, b45), (b50, b51, b52, b53, b54, b55) = b
+    return [
+        [a00 * b00 + a01 * b10 + a02 * b20 + a03 * b30 + a04 * b40 + a05 * b50, a00 * b01 + a01 * b11 + a02 * b21 + a03 * b31 + a04 * b41 + a05 * b51, a00 * b02 + a01 * b12 + a02 * b22 + a03 * b32 + a04 * b42 + a05 * b52, a00 * b03 + a01 * b13 + a02 * b23 + a03 * b33 + a04 * b43 + a05 * b53, a00 * b04 + a01 * b14 + a02 * b24 + a03 * b34 + a04 * b44 + a05 * b54, a00 * b05 + a01 * b15 + a02 * b25 + a03 * b35 + a04 * b45 + a05 * b55],
+        [a10 * b00 + a11 * b10 + a12 * b20 + a13 * b30 + a14 * b40 + a15 * b50, a10 * b01 + a11 * b11 + a12 * b21 + a13 * b31 + a14 * b41 + a15 * b51, a10 * b02 + a11 * b12 + a12 * b22 + a13 * b32 + a14 * b42 + a15 * b52, a10 * b03 + a11 * b13 + a12 * b23 + a13 * b33 + a14 * b43 + a15 * b53, a10 * b04 + a11 * b14 + a12 * b24 + a13 * b34 + a14 * b44 + a15 * b54, a10 * b05 + a11 * b15 + a12 * b25 + a13 * b35 + a14 * b45 + a15 * b55],
+        [a20 * b00 + a21 * b10 + a22 * b20 + a23 * b30 + a24 * b40 + a25 * b50, a20 * b01 + a21 * b11 + a22 * b21 + a23 * b31 + a24 * b41 + a25 * b51, a20 * b02 + a21 * b12 + a22 * b22 + a23 * b32 + a24 * b42 + a25 * b52, a20 * b03 + a21 * b13 + a22 * b23 + a23 * b33 + a24 * b43 + a25 * b53, a20 * b04 + a21 * b14 + a22 * b24 + a23 * b34 + a24 * b44 + a25 * b54, a20 * b05 + a21 * b15 + a22 * b25 + a23 * b35 + a24 * b45 + a25 * b55],
+        [a30 * b00 + a31 * b10 + a32 * b20 + a33 * b30 + a34 * b40 + a35 * b50, a30 * b01 + a31 * b11 + a32 * b21 + a33 * b31 + a34 * b41 + a35 * b51, a30 * b02 + a31 * b12 + a32 * b22 + a33 * b32 + a34 * b42 + a35 * b52, a30 * b03 + a31 * b13 + a32 * b23 + a33 * b33 + a34 * b43 + a35 * b53, a30 * b04 + a31 * b14 + a32 * b24 + a33 * b34 + a34 * b44 + a35 * b54, a30 * b05 + a31 * b15 + a32 * b25 + a33 * b35 + a34 * b45 + a35 * b55],
+        [a40 * b00 + a41 * b10 + a42 * b20 + a43 * b30 + a44 * b40 + a45 * b50, a40 * b01 + a41 * b11 + a42 * b21 + a43 * b31 + a44 * b41 + a45 * b51, a40 * b02 + a41 * b12 + a42 * b22 + a43 * b32 + a44 * b42 + a45 * b52, a40 * b03 + a41 * b13 + a42 * b23 + a43 * b33 + a44 * b43 + a45 * b53, a40 * b04 + a41 * b14 + a42 * b24 + a43 * b34 + a44 * b44 + a45 * b54, a40 * b05 + a41 * b15 + a42 * b25 + a43 * b35 + a44 * b45 + a45 * b55],
+        [a50 * b00 + a51 * b10 + a52 * b20 + a53 * b30 + a54 * b40 + a55 * b50, a50 * b01 + a51 * b11 + a52 * b21 + a53 * b31 + a54 * b41 + a55 * b51, a50 * b02 + a51 * b12 + a52 * b22 + a53 * b32 + a54 * b42 + a55 * b52, a50 * b03 + a51 * b13 + a52 * b23 + a53 * b33 + a54 * b43 + a55 * b53, a50 * b04 + a51 * b14 + a52 * b24 + a53 * b34 + a54 * b44 + a55 * b54, a50 * b05 + a51 * b15 + a52 * b25 + a53 * b35 + a54 * b45 + a55 * b55],
+    ]
+
+
+def congruence6(t, c):
+    """Return tᵀ·c·t for 6×6 matrices."""
+    (t00, t01, t02, t03, t04, t05), (t10, t11, t12, t13, t14, t15), (t20, t21, t22, t23, t24, t25), (t30, t31, t32, t33, t34, t35), (t40, t41, t42, t43, t44, t45), (t50, t51, t52, t53, t54, t55) = t
+    (c00, c01, c02, c03, c04, c05), (c10, c11, c12, c13, c14, c15), (c20, c21, c22, c23, c24, c25), (c30, c31, c32, c33, c34, c35), (c40, c41, c42, c43, c44, c45), (c50, c51, c52, c53, c54, c55) = c
+    u00 = c00 * t00 + c01 * t10 + c02 * t20 + c03 * t30 + c04 * t40 + c05 * t50
+    u01 = c00 * t01 + c01 * t11 + c02 * t21 + c03 * t31 + c04 * t41 + c05 * t51
+    u02 = c00 * t02 + c01 * t12 + c02 * t22 + c03 * t32 + c04 * t42 + c05 * t52
+    u03 = c00 * t03 + c01 * t13 + c02 * t23 + c03 * t33 + c04 * t43 + c05 * t53
+    u04 = c00 * t04 + c01 * t14 + c02 * t24 + c03 * t34 + c04 * t44 + c05 * t54
+    u05 = c00 * t05 + c01 * t15 + c02 * t25 + c03 * t35 + c04 * t45 + c05 * t55
+    u10 = c10 * t00 + c11 * t10 + c12 * t20 + c13 * t30 + c14 * t40 + c15 * t50
+    u11 = c10 * t01 + c11 * t11 + c12 * t21 + c13 * t31 + c14 * t41 + c15 * t51
+    u12 = c10 * t02 + c11 * t12 + c12 * t22 + c13 * t32 + c14 * t42 + c15 * t52
+    u13 = c10 * t03 + c11 * t13 + c12 * t23 + c13 * t33 + c14 * t43 + c15 * t53
+    u14 = c10 * t04 + c11 * t14 + c12 * t24 + c13 * t34 + c14 * t44 + c15 * t54
+    u15 = c10 * t05 + c11 * t15 + c12 * t25 + c13 * t35 + c14 * t45 + c15 * t55
+    u20 = c20 * t00 + c21 * t10 + c22 * t20 + c23 * t30 + c24 * t40 + c25 * t50
+    u21 = c20 * t01 + c21 * t11 + c22 * t21 + c23 * t31 + c24 * t41 + c25 * t51
+    u22 = c20 * t02 + c21 * t12 + c22 * t22 + c23 * t32 + c24 * t42 + c25 * t52
+    u23 = c20 * t03 + c21 * t13 + c22 * t23 + c23 * t33 + c24 * t43 + c25 * t53
+    u24 = c20 * t04 + c21 * t14 + c22 * t24 + c23 * t34 + c24 * t44 + c25 * t54
+    u25 = c20 * t05 + c21 * t15 + c22 * t25 + c23 * t35 + c24 * t45 + c25 * t55
+    u30 = c30 * t00 + c31 * t10 + c32 * t20 + c33 * t30 + c34 * t40 + c35 * t50
+    u31 = c30 * t01 + c31 * t11 + c32 * t21 + c33 * t31 + c34 * t41 + c35 * t51
+    u32 = c30 * t02 + c31 * t12 + c32 * t22 + c33 * t32 + c34 * t42 + c35 * t52
+    u33 = c30 * t03 + c31 * t13 + c32 * t23 + c33 * t33 + c34 * t43 + c35 * t53
+    u34 = c30 * t04 + c31 * t14 + c32 * t24 + c33 * t34 + c34 * t44 + c35 * t54
+    u35 = c30 * t05 + c31 * t15 + c32 * t25 + c33 * t35 + c34 * t45 + c35 * t55
+    u40 = c40 * t00 + c41 * t10 + c42 * t20 + c43 * t30 + c44 * t40 + c45 * t50
+    u41 = c40 * t01 + c41 * t11 + c42 * t21 + c43 * t31 + c44 * t41 + c45 * t51
+    u42 = c40 * t02 + c41 * t12 + c42 * t22 + c43 * t32 + c44 * t42 + c45 * t52
+    u43 = c40 * t03 + c41 * t13 + c42 * t23 + c43 * t33 + c44 * t43 + c45 * t53
+    u44 = c40 * t04 + c41 * t14 + c42 * t24 + c43 * t34 + c44 * t44 + c45 * t54
+    u45 = c40 * t05 + c41 * t15 + c42 * t25 + c43 * t35 + c44 * t45 + c45 * t55
+    u50 = c50 * t00 + c51 * t10 + c52 * t20 + c53 * t30 + c54 * t40 + c55 * t50
+    u51 = c50 * t01 + c51 * t11 + c52 * t21 + c53 * t31 + c54 * t41 + c55 * t51
+    u52 = c50 * t02 + c51 * t12 + c52 * t22 + c53 * t32 + c54 * t42 + c55 * t52
+    u53 = c50 * t03 + c51 * t13 + c52 * t23 + c53 * t33 + c54 * t43 + c55 * t53
+    u54 = c50 * t04 + c51 * t14 + c52 * t24 + c53 * t34 + c54 * t44 + c55 * t54
+    u55 = c50 * t05 + c51 * t15 + c52 * t25 + c53 * t35 + c54 * t45 + c55 * t55
+    return [
+        [t00 * u00 + t10 * u10 + t20 * u20 + t30 * u30 + t40 * u40 + t50 * u50, t00 * u01 + t10 * u11 + t20 * u21 + t30 * u31 + t40 * u41 + t50 * u51, t00 * u02 + t10 * u12 + t20 * u22 + t30 * u32 + t40 * u42 + t50 * u52, t00 * u03 + t10 * u13 + t20 * u23 + t30 * u33 + t40 * u43 + t50 * u53, t00 * u04 + t10 * u14 + t20 * u24 + t30 * u34 + t40 * u44 + t50 * u54, t00 * u05 + t10 * u15 + t20 * u25 + t30 * u35 + t40 * u45 + t50 * u55],
+        [t01 * u00 + t11 * u10 + t21 * u20 + t31 * u30 + t41 * u40 + t51 * u50, t01 * u01 + t11 * u11 + t21 * u21 + t31 * u31 + t41 * u41 + t51 * u51, t01 * u02 + t11 * u12 + t21 * u22 + t31 * u32 + t41 * u42 + t51 * u52, t01 * u03 + t11 * u13 + t21 * u23 + t31 * u33 + t41 * u43 + t51 * u53, t01 * u04 + t11 * u14 + t21 * u24 + t31 * u34 + t41 * u44 + t51 * u54, t01 * u05 + t11 * u15 + t21 * u25 + t31 * u35 + t41 * u45 + t51 * u55],
+        [t02 * u00 + t12 * u10 + t22 * u20 + t32 * u30 + t42 * u40 + t52 * u50, t02 * u01 + t12 * u11 + t22 * u21 + t32 * u31 + t42 * u41 + t52 * u51, t02 * u02 + t12 * u12 + t22 * u22 + t32 * u32 + t42 * u42 + t52 * u52, t02 * u03 + t12 * u13 + t22 * u23 + t32 * u33 + t42 * u43 + t52 * u53, t02 * u04 + t12 * u14 + t22 * u24 + t32 * u34 + t42 * u44 + t52 * u54, t02 * u05 + t12 * u15 + t22 * u25 + t32 * u35 + t42 * u45 + t52 * u55],
+        [t03 * u00 + t13 * u10 + t23 * u20 + t33 * u30 + t43 * u40 + t53 * u50, t03 * u01 + t13 * u11 + t23 * u21 + t33 * u31 + t43 * u41 + t53 * u51, t03 * u02 + t13 * u12 + t23 * u22 + t33 * u32 + t43 * u42 + t53 * u52, t03 * u03 + t13 * u13 + t23 * u23 + t33 * u33 + t43 * u43 + t53 * u53, t03 * u04 + t13 * u14 + t23 * u24 + t33 * u34 + t43 * u44 + t53 * u54, t03 * u05 + t13 * u15 + t23 * u25 + t33 * u35 + t43 * u45 + t53 * u55],
+        [t04 * u00 + t14 * u10 + t24 * u20 + t34 * u30 + t44 * u40 + t54 * u50, t04 * u01 + t14 * u11 + t24 * u21 + t34 * u31 + t44 * u41 + t54 * u51, t04 * u02 + t14 * u12 + t24 * u22 + t34 * u32 + t44 * u42 + t54 * u52, t04 * u03 + t14 * u13 + t24 * u23 + t34 * u33 + t44 * u43 + t54 * u53, t04 * u04 + t14 * u14 + t24 * u24 + t34 * u34 + t44 * u44 + t54 * u54, t04 * u05 + t14 * u15 + t24 * u25 + t34 * u35 + t44 * u45 + t54 * u55],
+        [t05 * u00 + t15 * u10 + t25 * u20 + t35 * u30 + t45 * u40 + t55 * u50, t05 * u01 + t15 * u11 + t25 * u21 + t35 * u31 + t45 * u41 + t55 * u51, t05 * u02 + t15 * u12 + t25 * u22 + t35 * u32 + t45 * u42 + t55 * u52, t05 * u03 + t15 * u13 + t25 * u23 + t35 * u33 + t45 * u43 + t55 * u53, t05 * u04 + t15 * u14 + t25 * u24 + t35 * u34 + t45 * u44 + t55 * u54, t05 * u05 + t15 * u15 + t25 * u25 + t35 * u35 + t45 * u45 + t55 * u55],
+    ]
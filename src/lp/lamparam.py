@@ -0,0 +1,196 @@
+# file: lamparam.py
+# vim:fileencoding=utf-8:ft=python:fdm=marker
+#
+# Copyright © 2026 R.F. Smith <rsmith@xs4all.nl>. All rights reserved.
+# SPDX-License-Identifier: BSD-2-Clause
+# Created: 2026-10-16T20:31:44+0200
+# Last modified: 2026-10-16T20:31:44+0200
+"""
+In-plane stiffness of laminates from lamination parameters.
+
+For a stack of plies of a single material, the A, B and D matrices are linear
+in the twelve lamination parameters. These only depend on the angles and
+thicknesses of the plies. The material enters through the five Tsai–Pagano
+invariants U1–U5.
+
+Calculating the invariants once per material and the lamination parameters
+per stack is much cheaper than laminate(). That makes this module suitable
+for optimizing stacking sequences.
+
+    inv = invariants(fiber, resin, vf)
+    par = parameters(angles, thicknesses)
+    ABD = abd(inv, par)
+    abd, Ex, Ey, Gxy, νxy, νyx = engineering(inv, par)
+
+The functions with a _batch suffix do the same for many stacks at once.
+They require numpy.
+"""
+
+from lp.types import Invariants, LaminationParameters
+from lp.cache import LRUCache
+from lp.core import onaxis_cache, rotation_cache, _onaxis, _rotation, _inplane
+import lp.matrix as lpm
+
+invariant_cache = LRUCache(maxsize=1024)
+
+
+def invariants(fiber, resin, vf):
+    """
+    Return the Tsai–Pagano invariants of the in-plane stiffness Q of a
+    lamina, as used by core.lamina.
+
+    Arguments:
+        fiber: The Fiber used in the lamina.
+        resin: The Resin used in the lamina.
+        vf: Fiber volume fraction.
+
+    Returns:
+        An Invariants tuple.
+    """
+    return invariant_cache.get((fiber, resin, vf), _invariants, fiber, resin, vf)
+
+
+def _invariants(fiber, resin, vf):
+    p = onaxis_cache.get((fiber, resin, vf), _onaxis, fiber, resin, vf)
+    Q11, Q12, Q22, Q66 = p.Q11, p.Q12, p.Q22, p.Q66
+    return Invariants(
+        (3 * Q11 + 3 * Q22 + 2 * Q12 + 4 * Q66) / 8,
+        (Q11 - Q22) / 2,
+        (Q11 + Q22 - 2 * Q12 - 4 * Q66) / 8,
+        (Q11 + Q22 + 6 * Q12 - 4 * Q66) / 8,
+        (Q11 + Q22 - 2 * Q12 + 4 * Q66) / 8,
+    )
+
+
+def _trig(degrees):
+    """Return cos 2θ, cos 4θ, sin 2θ and sin 4θ."""
+    r = rotation_cache.get(degrees, _rotation, degrees)
+    c2, s2 = r.m2 - r.n2, 2 * r.m * r.n
+    return c2, c2 * c2 - s2 * s2, s2, 2 * s2 * c2
+
+
+def parameters(angles, thicknesses):
+    """
+    Calculate the lamination parameters of a stack.
+
+    Arguments:
+        angles: Sequence of ply angles in degrees, from bottom to top.
+        thicknesses: Sequence of ply thicknesses in mm, or a single number
+            if all plies have the same thickness.
+
+    Returns:
+        A LaminationParameters tuple. The parameters ξA, ξB and ξD are
+        normalized with h, h²/4 and h³/12 respectively, so that they lie
+        between -1 and 1.
+    """
+    if isinstance(thicknesses, (int, float)):
+        thicknesses = [thicknesses] * len(angles)
+    h = sum(thicknesses)
+    sa, sb, sd = [0.0] * 4, [0.0] * 4, [0.0] * 4
+    zs = -h / 2
+    for angle, t in zip(angles, thicknesses):
+        ze = zs + t
+        z2 = (ze * ze - zs * zs) / 2
+        z3 = (ze * ze * ze - zs * zs * zs) / 3
+        for k, f in enumerate(_trig(angle)):
+            sa[k] += f * t
+            sb[k] += f * z2
+            sd[k] += f * z3
+        zs = ze
+    fa, fb, fd = 1 / h, 4 / (h * h), 12 / (h * h * h)
+    return LaminationParameters(
+        h, *(v * fa for v in sa), *(v * fb for v in sb), *(v * fd for v in sd)
+    )
+
+
+def _block(inv, ξ0, ξ1, ξ2, ξ3, ξ4, f):
+    """Return the symmetric 3×3 block for one set of lamination parameters."""
+    U1, U2, U3, U4, U5 = inv
+    a11 = f * (U1 * ξ0 + U2 * ξ1 + U3 * ξ2)
+    a22 = f * (U1 * ξ0 - U2 * ξ1 + U3 * ξ2)
+    a12 = f * (U4 * ξ0 - U3 * ξ2)
+    a66 = f * (U5 * ξ0 - U3 * ξ2)
+    a16 = f * (U2 / 2 * ξ3 + U3 * ξ4)
+    a26 = f * (U2 / 2 * ξ3 - U3 * ξ4)
+    return [[a11, a12, a16], [a12, a22, a26], [a16, a26, a66]]
+
+
+def abd(inv, par):
+    """
+    Assemble the ABD matrix from the invariants and lamination parameters.
+    Very small numbers are discarded, like in core.laminate.
+    """
+    h = par.thickness
+    A = _block(inv, 1.0, *par[1:5], h)
+    B = _block(inv, 0.0, *par[5:9], h * h / 4)
+    D = _block(inv, 1.0, *par[9:13], h * h * h / 12)
+    return lpm.clean([a + b for a, b in zip(A, B)] + [b + d for b, d in zip(B, D)])
+
+
+def engineering(inv, par):
+    """
+    Calculate the in-plane engineering properties.
+
+    Returns:
+        abd, Ex, Ey, Gxy, νxy, νyx
+    """
+    return _inplane(abd(inv, par), par.thickness)
+
+
+def parameters_batch(angles, thicknesses):
+    """
+    Calculate the lamination parameters of many stacks with the same number
+    of plies.
+
+    Arguments:
+        angles: Array of ply angles in degrees with shape (stacks, plies).
+        thicknesses: Array of ply thicknesses that can be broadcast to the
+            shape of angles.
+
+    Returns:
+        An array of shape (stacks, 13), in the order of LaminationParameters.
+    """
+    import numpy as np
+
+    θ = np.radians(np.asarray(angles, dtype=float))
+    t = np.broadcast_to(np.asarray(thicknesses, dtype=float), θ.shape)
+    ze = np.cumsum(t, axis=1)
+    h = ze[:, -1:]
+    ze = ze - h / 2
+    zs = ze - t
+    w = (t, (ze**2 - zs**2) / 2, (ze**3 - zs**3) / 3)
+    trig = (np.cos(2 * θ), np.cos(4 * θ), np.sin(2 * θ), np.sin(4 * θ))
+    rv = np.empty((θ.shape[0], 13))
+    rv[:, 0] = h[:, 0]
+    for n, (wk, f) in enumerate(zip(w, (1 / h, 4 / h**2, 12 / h**3))):
+        for k, tr in enumerate(trig):
+            rv[:, 1 + 4 * n + k] = np.sum(tr * wk, axis=1) * f[:, 0]
+    return rv
+
+
+def abd_batch(inv, par):
+    """
+    Assemble the ABD matrices for an array of lamination parameters as
+    returned by parameters_batch.
+
+    Returns:
+        An array of shape (stacks, 6, 6).
+    """
+    import numpy as np
+
+    par = np.asarray(par, dtype=float)
+    h = par[:, 0]
+    rv = np.zeros((len(par), 6, 6))
+    for (r, c), ξ0, first, f in (
+        ((0, 0), 1.0, 1, h),
+        ((0, 3), 0.0, 5, h * h / 4),
+        ((3, 0), 0.0, 5, h * h / 4),
+        ((3, 3), 1.0, 9, h * h * h / 12),
+    ):
+        ξ = [par[:, first + k] for k in range(4)]
+        block = _block(inv, ξ0, *ξ, f)
+        for i in range(3):
+            for j in range(3):
+                rv[:, r + i, c + j] = block[i][j]
+    rv[np.abs(rv) < lpm._LIMIT] = 0.0
+    return rv
@@ -0,0 +1,147 @@
+# file: loads.py
+# vim:fileencoding=utf-8:ft=python:fdm=marker
+#
+# Copyright © 2026 R.F. Smith <rsmith@xs4all.nl>. All rights reserved.
+# SPDX-License-Identifier: BSD-2-Clause
+# Created: 2026-10-17T01:02:48+0200
+# Last modified: 2026-10-17T01:02:48+0200
+"""
+Strains and stresses in the plies of a laminate for many load cases at once.
+This requires NumPy.
+
+A load case consists of the stress resultants (Nx, Ny, Nxy) in N/mm, the
+moment resultants (Mx, My, Mxy) in N·mm/mm and a temperature difference ΔT
+in K. All load cases are solved with the abd matrix of the laminate in one
+vectorized operation.
+
+    stack = plies(lam)
+    res = solve(stack, loads, ΔT)
+    σ1 = res.material_stress[..., 0]
+
+The strains and stresses are calculated at the bottom and the top of every
+ply. Strains are the total strains, including the free thermal expansion.
+Stresses follow from the mechanical strains ε - α·ΔT.
+"""
+
+from lp.core import rotation_cache, _rotation
+from lp.types import Plies, LoadResponse
+
+__all__ = ["plies", "thermal", "solve"]
+
+
+def plies(lam):
+    """
+    Collect the data of the plies of a laminate as arrays.
+
+    Arguments:
+        lam: A Laminate.
+
+    Returns:
+        A Plies tuple. Q̅ has shape (P, 3, 3), α (P, 3) and z (P, 2) for
+        the bottom and top of every ply. Ts and Te (P, 3, 3) transform
+        stresses and strains from the global to the material axes. abd is
+        the inverse of the ABD matrix.
+    """
+    import numpy as np
+
+    layers = [la for la in lam.layers if not isinstance(la, str)]
+    if not layers:
+        raise ValueError("laminate has no plies")
+    Q = np.array(
+        [
+            [
+                [la.Q̅11, la.Q̅12, la.Q̅16],
+                [la.Q̅12, la.Q̅22, la.Q̅26],
+                [la.Q̅16, la.Q̅26, la.Q̅66],
+            ]
+            for la in layers
+        ]
+    )
+    α = np.array([[la.αx, la.αy, la.αxy] for la in layers])
+    t = np.array([la.thickness for la in layers])
+    ze = np.cumsum(t) - t.sum() / 2
+    z = np.column_stack([ze - t, ze])
+    Ts, Te = [], []
+    for la in layers:
+        r = rotation_cache.get(la.angle, _rotation, la.angle)
+        m, n, m2, n2 = r.m, r.n, r.m2, r.n2
+        mn = m * n
+        # Transformation of stress and strain from global to material axes.
+        Ts.append([[m2, n2, 2 * mn], [n2, m2, -2 * mn], [-mn, mn, m2 - n2]])
+        Te.append([[m2, n2, mn], [n2, m2, -mn], [-2 * mn, 2 * mn, m2 - n2]])
+    return Plies(Q, α, z, np.array(Ts), np.array(Te), np.array(lam.abd))
+
+
+def thermal(stack):
+    """
+    Return the thermal stress and moment resultants for ΔT = 1 K as an
+    array (Ntx, Nty, Ntxy, Mtx, Mty, Mtxy).
+    """
+    import numpy as np
+
+    Qα = np.einsum("pij,pj->pi", stack.Q̅, stack.α)
+    zs, ze = stack.z[:, 0], stack.z[:, 1]
+    Nt = np.einsum("pi,p->i", Qα, ze - zs)
+    Mt = np.einsum("pi,p->i", Qα, (ze * ze - zs * zs) / 2)
+    return np.concatenate([Nt, Mt])
+
+
+def solve(stack, loads, ΔT=0.0):
+    """
+    Calculate the response of a laminate to load cases.
+
+    Arguments:
+        stack: A Plies tuple as returned by plies.
+        loads: Array of load cases with shape (n, 6). The columns are Nx,
+            Ny, Nxy, Mx, My and Mxy.
+        ΔT: Temperature difference; a number or an array of n numbers.
+
+    Returns:
+        A LoadResponse. The midplane strains (εx, εy, γxy) and the curvatures
+        (κx, κy, κxy) have shape (n, 3). The ply strains and stresses have
+        shape (n, P, 2, 3); the third index is 0 for the bottom and 1 for the
+        top of the ply. In the global axes the last index is x, y, xy and in
+        the material axes it is 1, 2, 12. Shear strains are engineering
+        strains.
+    """
+    import numpy as np
+
+    loads = np.atleast_2d(np.asarray(loads, dtype=float))
+    if loads.ndim != 2 or loads.shape[1] != 6:
+        raise ValueError("loads must have shape (n, 6)")
+    ΔT = np.broadcast_to(np.asarray(ΔT, dtype=float), loads.shape[:1])
+    # All results are linear in (Nx, Ny, Nxy, Mx, My, Mxy, ΔT). So they are
+    # calculated with a single matrix product.
+    u = np.column_stack([loads, ΔT])
+    D, G = _influence(stack)
+    deformation = u @ D.T
+    count = len(u)
+    out = (u @ G).reshape(count, 4, *stack.z.shape, 3)
+    return LoadResponse(
+        deformation[:, :3], deformation[:, 3:], *out.transpose(1, 0, 2, 3, 4)
+    )
+
+
+def _influence(stack):
+    """
+    Calculate the influence matrices for loads and ΔT.
+
+    Returns:
+        D with shape (6, 7), which gives the midplane strains and curvatures,
+        and G with shape (7, 4·P·2·3), which gives the strains and stresses in
+        the global and material axes.
+    """
+    import numpy as np
+
+    D = np.column_stack([stack.abd, stack.abd @ thermal(stack)])
+    ε = D[None, None, :3, :] + stack.z[:, :, None, None] * D[None, None, 3:, :]
+    mechanical = ε.copy()
+    mechanical[..., 6] -= stack.α[:, None, :]
+    σ = np.einsum("pij,pkjm->pkim", stack.Q̅, mechanical)
+    parts = (
+        ε,
+        σ,
+        np.einsum("pij,pkjm->pkim", stack.Te, ε),
+        np.einsum("pij,pkjm->pkim", stack.Ts, σ),
+    )
+    return D, np.stack(parts).reshape(-1, 7).T
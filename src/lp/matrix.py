@@ -5,11 +5,23 @@
 # Copyright © 2018-2021 R.F. Smith <rsmith@xs4all.nl>. All rights reserved.
 # SPDX-License-Identifier: BSD-2-Clause
 # Created: 2018-12-28T23:06:35+0100
-# Last modified: 2021-01-03T23:03:17+0100
+# Last modified: 2026-10-17T13:41:27+0200
+"""
+Functions for small square matrices.
 
-from copy import deepcopy
+The functions work on lists of lists. For 2×2, 3×3 and 6×6 matrices the
+generated straight-line functions from kernels.py are used where possible.
+"""
+
+from array import array
+from . import kernels as _k
 
 _LIMIT = 1e-10  # Numbers smaller than abs(_LIMIT) are set to 0.
+# Fixed-size functions, keyed by the size of the matrix.
+_DET = {2: _k.det2, 3: _k.det3, 6: _k.det6}
+_INVDET = {2: _k.invdet2, 3: _k.invdet3, 6: _k.invdet6}
+_MATMUL = {2: _k.matmul2, 3: _k.matmul3, 6: _k.matmul6}
+_CONGRUENCE = {2: _k.congruence2, 3: _k.congruence3, 6: _k.congruence6}
 
 
 def ident(num):
@@ -32,36 +44,132 @@ def zeros(num):
 
 def det(m):
     """Calculate the determinant of a matrix."""
-    tr, _ = _topright(m)
-    d = _diag(tr)
-    rv = 1
-    for j in d:
-        rv *= j
-    return rv
+    kernel = _DET.get(_square_size(m))
+    if kernel:
+        rv = kernel(m)
+        if rv is not None:
+            return rv
+    return LU(m).det()
 
 
 def inv(m):
     """Calculate the inverse of a matrix"""
-    size = _square_size(m)
-    # Empty left-bottom triangle
-    copy, rv = _topright(m)
-    # Empty top-right triangle.
-    for k in range(size - 1, -1, -1):
-        for p in range(k - 1, -1, -1):
-            fact = copy[p][k] / copy[k][k]
-            for j in range(size):
-                copy[p][j] -= fact * copy[k][j]
-                if abs(copy[p][j]) < _LIMIT:
-                    copy[p][j] = 0.0
-                rv[p][j] -= fact * rv[k][j]
-    # Divide by the diagonals.
-    for r in range(size):
-        for k in range(size):
-            rv[r][k] /= copy[r][r]
+    kernel = _INVDET.get(_square_size(m))
+    rv = kernel(m) if kernel else None
+    if rv is None:
+        rv = LU(m).inv()
+    else:
+        rv = rv[0]
     # Discard small numbers.
     return clean(rv)
 
 
+class LU:
+    """
+    LU factorization with partial pivoting of a square matrix.
+
+    The factorization is done once, when the object is created. After that,
+    the determinant, the inverse, solutions and cofactors can be retrieved
+    without further elimination. For 2×2, 3×3 and 6×6 matrices the functions
+    from kernels.py take the place of the elimination. They yield the inverse
+    and the determinant directly. Only if they cannot be used, the matrix is
+    factorized.
+
+    For a singular matrix the determinant is 0, and the other methods raise
+    a ValueError.
+    """
+
+    def __init__(self, m):
+        """Factorize the square matrix m."""
+        size = _square_size(m)
+        self.size = size
+        kernel = _INVDET.get(size)
+        rv = kernel(m) if kernel else None
+        if rv is not None:
+            self._inv, self._det = rv
+            self._lu = None
+            return
+        self._inv = self._det = None
+        lu = [[float(n) for n in row] for row in m]
+        perm = list(range(size))
+        sign = 1
+        singular = False
+        for k in range(size):
+            # Use the largest remaining number in column k as the pivot.
+            p = max(range(k, size), key=lambda r: abs(lu[r][k]))
+            if p != k:
+                lu[k], lu[p] = lu[p], lu[k]
+                perm[k], perm[p] = perm[p], perm[k]
+                sign = -sign
+            rowk = lu[k]
+            pivot = rowk[k]
+            if pivot == 0.0:
+                singular = True
+                continue
+            for r in range(k + 1, size):
+                row = lu[r]
+                fact = row[k] / pivot
+                row[k] = fact
+                if fact != 0.0:
+                    for j in range(k + 1, size):
+                        row[j] -= fact * rowk[j]
+        self._lu = lu
+        self._perm = perm
+        self._sign = sign
+        self._singular = singular
+
+    def det(self):
+        """Return the determinant of the matrix."""
+        if self._det is not None:
+            return self._det
+        rv = self._sign
+        for j in range(self.size):
+            rv *= self._lu[j][j]
+        return rv
+
+    def solve(self, b):
+        """Return x as a list so that m·x = b, where b is a sequence."""
+        lu, size = self._lu, self.size
+        if lu is None:
+            return [sum(r * float(n) for r, n in zip(row, b)) for row in self._inv]
+        if self._singular:
+            raise ValueError("singular matrix")
+        x = [float(b[p]) for p in self._perm]
+        # Forward substitution, L has unit diagonal.
+        for r in range(1, size):
+            row = lu[r]
+            x[r] -= sum(row[j] * x[j] for j in range(r))
+        # Back substitution.
+        for r in range(size - 1, -1, -1):
+            row = lu[r]
+            x[r] = (x[r] - sum(row[j] * x[j] for j in range(r + 1, size))) / row[r]
+        return x
+
+    def inv(self):
+        """Return the inverse of the matrix."""
+        if self._inv is None:
+            if self._singular:
+                raise ValueError("singular matrix")
+            size = self.size
+            columns = [self.solve(col) for col in ident(size)]
+            self._inv = [[columns[j][i] for j in range(size)] for i in range(size)]
+        return [row[:] for row in self._inv]
+
+    def cofactor(self, i, j):
+        """
+        Return the (i, j) cofactor of the matrix.
+        That is (-1)**(i+j) times the determinant of the matrix with row i and
+        column j deleted.
+        """
+        if self._inv is None:
+            self.inv()
+        return self.det() * self._inv[j][i]
+
+    def adjugate(self):
+        """Return the adjugate (transpose of the cofactor matrix)."""
+        return mul(self.inv(), self.det())
+
+
 def add(a, b):
     """Return the sum of square matrices a and b."""
     s, sb = _square_size(a), _square_size(b)
@@ -79,6 +187,9 @@ def matmul(a, b):
     s, sb = _square_size(a), _square_size(b)
     if s != sb:
         raise ValueError("matrices cannot be multiplied")
+    kernel = _MATMUL.get(s)
+    if kernel:
+        return kernel(a, b)
     res = zeros(s)
     for i in range(s):
         for j in range(s):
@@ -87,6 +198,17 @@ def matmul(a, b):
     return res
 
 
+def congruence(t, m):
+    """Returns the congruence transform tᵀ·m·t of square matrix m."""
+    s, sb = _square_size(t), _square_size(m)
+    if s != sb:
+        raise ValueError("matrices cannot be multiplied")
+    kernel = _CONGRUENCE.get(s)
+    if kernel:
+        return kernel(t, m)
+    return matmul(matmul(transp(t), m), t)
+
+
 def mul(m, sc):
     """Multiply matrix m by scalar sc."""
     s = _square_size(m)
@@ -114,43 +236,156 @@ def delete(m, r, k):
         raise ValueError("invalid row")
     if k < 0 or k > size - 1:
         raise ValueError("invalid column")
-    rv = deepcopy(m)
-    rv.pop(r)
-    for r in rv:
-        r.pop(k)
-    return rv
+    return [
+        [n for j, n in enumerate(row) if j != k] for i, row in enumerate(m) if i != r
+    ]
 
 
 def clean(m):
     """Set matrix numbers < _LIMIT with 0."""
-    rv = deepcopy(m)
-    sz = len(rv)
-    for i in range(sz):
-        for j in range(sz):
-            if abs(rv[i][j]) < _LIMIT:
-                rv[i][j] = 0.0
-    return rv
+    return [[0.0 if abs(n) < _LIMIT else n for n in row] for row in m]
 
 
-def _topright(m):
-    """Return the top-right triangular matrix."""
-    size = _square_size(m)
-    copy = deepcopy(m)
-    rv = ident(size)
-    for k in range(size):
-        for p in range(k + 1, size):
-            fact = copy[p][k] / copy[k][k]
-            for j in range(size):
-                copy[p][j] -= fact * copy[k][j]
-                if abs(copy[p][j]) < _LIMIT:
-                    copy[p][j] = 0
-                rv[p][j] -= fact * rv[k][j]
-    return copy, rv
-
-
-def _diag(m):
-    """Return the diagonal of a matrix."""
-    return [m[j][j] for j in range(len(m))]
+class Matrix:
+    """
+    Square matrix of floats, stored row by row in a flat array.
+
+    Indexing as m[i][j] works like it does for a list of lists; m[i] returns
+    a view of row i, not a copy. So all functions in this module can be used
+    on a Matrix.
+    """
+
+    __slots__ = ("size", "data")
+
+    def __init__(self, m=None, size=None):
+        """
+        Create a Matrix.
+
+        Arguments:
+            m: A square matrix (list of lists or Matrix) to copy. If None,
+                a size×size matrix filled with zeros is created.
+            size: The size of the matrix when m is None.
+        """
+        if m is None:
+            self.size = size
+            self.data = array("d", bytes(8 * size * size))
+        elif isinstance(m, Matrix):
+            self.size = m.size
+            self.data = array("d", m.data)
+        else:
+            self.size = _square_size(m)
+            self.data = array("d", (n for row in m for n in row))
+
+    @classmethod
+    def zeros(cls, num):
+        """Create a num×num 0-filled Matrix."""
+        return cls(size=num)
+
+    @classmethod
+    def fromflat(cls, num, values):
+        """Create a num×num Matrix from num*num values in row order."""
+        rv = cls.__new__(cls)
+        rv.size = num
+        rv.data = array("d", values)
+        if len(rv.data) != num * num:
+            raise ValueError("invalid number of values")
+        return rv
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, i):
+        size = self.size
+        if i < 0:
+            i += size
+        if i < 0 or i >= size:
+            raise IndexError("row index out of range")
+        return memoryview(self.data)[i * size : (i + 1) * size]  # noqa
+
+    def __iter__(self):
+        view, size = memoryview(self.data), self.size
+        for start in range(0, size * size, size):
+            yield view[start : start + size]  # noqa
+
+    def __eq__(self, other):
+        """
+        A Matrix is equal to another Matrix or to a nested sequence, like a
+        list of lists, with the same numbers.
+        """
+        if isinstance(other, Matrix):
+            return self.size == other.size and self.data == other.data
+        try:
+            return len(other) == self.size and all(
+                len(row) == self.size and list(row) == list(mine)
+                for row, mine in zip(other, self)
+            )
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self):
+        return f"Matrix({self.tolist()})"
+
+    def tolist(self):
+        """Return the contents as a list of lists."""
+        return [list(row) for row in self]
+
+    def iadd_scaled(self, other, factor):
+        """
+        Add other×factor to this matrix in place.
+
+        Arguments:
+            other: A square matrix of the same size.
+            factor: Scalar multiplier for other.
+        """
+        data = self.data
+        if isinstance(other, Matrix):
+            values = other.data
+        else:
+            values = [n for row in other for n in row]
+        if len(values) != len(data):
+            raise ValueError("matrices cannot be added")
+        for k, n in enumerate(values):
+            data[k] += n * factor
+        return self
+
+    def iclean(self):
+        """Set numbers < _LIMIT to 0 in place."""
+        data = self.data
+        for k, n in enumerate(data):
+            if abs(n) < _LIMIT:
+                data[k] = 0.0
+        return self
+
+    def minor(self, r, k):
+        """Return a view of this matrix without row r and column k."""
+        return _Minor(self, r, k)
+
+
+class _Minor:
+    """Read-only view of a Matrix with one row and one column left out."""
+
+    __slots__ = ("size", "_parent", "_rows", "_cols")
+
+    def __init__(self, parent, r, k):
+        size = parent.size
+        if r < 0 or r > size - 1:
+            raise ValueError("invalid row")
+        if k < 0 or k > size - 1:
+            raise ValueError("invalid column")
+        self.size = size - 1
+        self._parent = parent
+        self._rows = [i for i in range(size) if i != r]
+        self._cols = [j for j in range(size) if j != k]
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, i):
+        row = self._parent[self._rows[i]]
+        return [row[j] for j in self._cols]
+
+    def __iter__(self):
+        return (self[i] for i in range(self.size))
 
 
 def _square_size(m):
@@ -0,0 +1,191 @@
+# file: montecarlo.py
+# vim:fileencoding=utf-8:ft=python:fdm=marker
+#
+# Copyright © 2026 R.F. Smith <rsmith@xs4all.nl>. All rights reserved.
+# SPDX-License-Identifier: BSD-2-Clause
+# Created: 2026-10-16T23:31:02+0200
+# Last modified: 2026-10-16T23:31:02+0200
+"""
+Monte Carlo analysis of the scatter in laminate properties. This requires
+NumPy.
+
+The nominal values of the inputs are taken from the layers of a laminate.
+The scatter of an input is described by a Distribution. For example:
+
+    scatter = {
+        "fiber.E1": normal(0.03, relative=True),
+        "vf": uniform(-0.02, 0.02),
+        "angle": normal(1.0),
+    }
+    result = montecarlo(layers, scatter, 100000, seed=42)
+    print(result.statistics["Ex"])
+
+The inputs are:
+    fiber.E1, fiber.ν12, fiber.α1, fiber.ρ: Drawn once per sample for every
+        fiber, so all layers with the same fiber get the same value.
+    resin.E, resin.ν, resin.α, resin.ρ: Likewise for every resin.
+    vf, fiber_weight, angle: Drawn for every layer of every sample.
+
+The samples are calculated in chunks with core.laminate_batch. Every chunk
+gets its own random stream, spawned from the seed. So the results only
+depend on the seed and the chunk size, not on the number of workers.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+from lp.core import laminate_batch
+from lp.types import Distribution, Fiber, Lamina, Resin, Statistics, MonteCarloResult
+
+__all__ = ["normal", "uniform", "montecarlo", "PROPERTIES"]
+
+# Properties that are reported.
+PROPERTIES = (
+    "thickness",
+    "fiber_weight",
+    "ρ",
+    "vf",
+    "resin_weight",
+    "wf",
+    "Ex",
+    "Ey",
+    "Gxy",
+    "νxy",
+    "νyx",
+    "αx",
+    "αy",
+)
+_FIBER = ("E1", "ν12", "α1", "ρ")
+_RESIN = ("E", "ν", "α", "ρ")
+_LAYER = ("vf", "fiber_weight", "angle")
+
+
+def normal(sd, relative=False):
+    """
+    Normal distribution around the nominal value, with standard deviation sd.
+    If relative is True, sd is a fraction of the nominal value.
+    """
+    return Distribution("normal", 0.0, sd, relative)
+
+
+def uniform(low, high, relative=False):
+    """
+    Uniform distribution between nominal+low and nominal+high.
+    If relative is True, low and high are fractions of the nominal value.
+    """
+    return Distribution("uniform", low, high, relative)
+
+
+def _draw(rng, dist, nominal, shape):
+    """Draw samples of the given shape around the nominal value(s)."""
+    if dist.kind == "normal":
+        delta = rng.normal(dist.a, dist.b, shape)
+    elif dist.kind == "uniform":
+        delta = rng.uniform(dist.a, dist.b, shape)
+    else:
+        raise ValueError(f'unknown distribution "{dist.kind}"')
+    if dist.relative:
+        return nominal * (1 + delta)
+    return nominal + delta
+
+
+def montecarlo(
+    layers,
+    scatter,
+    samples,
+    seed=None,
+    percentiles=(1, 5, 50, 95, 99),
+    chunksize=4096,
+    workers=1,
+):
+    """
+    Calculate the scatter in the properties of a laminate.
+
+    Arguments:
+        layers: Sequence of laminae (and comments), from bottom to top.
+        scatter: Dictionary of Distributions, keyed by input name.
+        samples: Number of samples.
+        seed: Seed for numpy.random.SeedSequence. Use the same seed to get
+            the same results.
+        percentiles: The percentiles to report.
+        chunksize: Number of samples that are calculated at once.
+        workers: Number of processes to use.
+
+    Returns:
+        A MonteCarloResult. Its statistics is a dictionary of Statistics, and
+        its samples a dictionary of arrays, both keyed by property.
+    """
+    import numpy as np
+
+    for key in scatter:
+        kind, _, name = key.rpartition(".")
+        valid = {"fiber": _FIBER, "resin": _RESIN, "": _LAYER}.get(kind, ())
+        if name not in valid:
+            raise ValueError(f'unknown input "{key}"')
+    laminae = [la for la in layers if isinstance(la, Lamina)]
+    if not laminae:
+        raise ValueError("no layers in the laminate")
+    fibers = list(dict.fromkeys(la.fiber for la in laminae))
+    resins = list(dict.fromkeys(la.resin for la in laminae))
+    stack = (
+        fibers,
+        resins,
+        [fibers.index(la.fiber) for la in laminae],
+        [resins.index(la.resin) for la in laminae],
+        {name: [getattr(la, name) for la in laminae] for name in _LAYER},
+    )
+    sizes = [min(chunksize, samples - n) for n in range(0, samples, chunksize)]
+    streams = np.random.SeedSequence(seed).spawn(len(sizes))
+    jobs = [(stack, scatter, s, n) for s, n in zip(streams, sizes)]
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_chunk, jobs))
+    else:
+        parts = [_chunk(job) for job in jobs]
+    values = {p: np.concatenate([part[p] for part in parts]) for p in PROPERTIES}
+    statistics = {}
+    for p, v in values.items():
+        pv = np.percentile(v, percentiles)
+        statistics[p] = Statistics(
+            float(np.mean(v)),
+            float(np.std(v, ddof=1)) if len(v) > 1 else 0.0,
+            dict(zip(percentiles, pv.tolist())),
+        )
+    return MonteCarloResult(statistics, values)
+
+
+def _chunk(job):
+    """Calculate the properties of a chunk of samples."""
+    import numpy as np
+
+    (fibers, resins, fi, ri, nominal), scatter, stream, count = job
+    rng = np.random.default_rng(stream)
+    plies = len(fi)
+
+    def materials(components, fields, index, kind):
+        # Draw once per material and sample, and spread over the plies.
+        values = []
+        for name in fields:
+            key = f"{kind}.{name}"
+            column = np.empty((count, len(components)))
+            for n, comp in enumerate(components):
+                nom = getattr(comp, name)
+                if key in scatter:
+                    column[:, n] = _draw(rng, scatter[key], nom, count)
+                else:
+                    column[:, n] = nom
+            values.append(column[:, index].ravel())
+        return values
+
+    fiber = Fiber(*materials(fibers, _FIBER, fi, "fiber"), "sample")
+    resin = Resin(*materials(resins, _RESIN, ri, "resin"), "sample")
+    layer = {}
+    for name in _LAYER:
+        nom = np.asarray(nominal[name], dtype=float)
+        if name in scatter:
+            layer[name] = _draw(rng, scatter[name], nom, (count, plies))
+        else:
+            layer[name] = np.broadcast_to(nom, (count, plies))
+    res = laminate_batch(
+        fiber, resin, layer["fiber_weight"], layer["angle"], layer["vf"]
+    )
+    return {p: getattr(res, p) for p in PROPERTIES}
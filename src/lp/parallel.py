@@ -0,0 +1,289 @@
+# file: parallel.py
+# vim:fileencoding=utf-8:ft=python:fdm=marker
+#
+# Copyright © 2026 R.F. Smith <rsmith@xs4all.nl>. All rights reserved.
+# SPDX-License-Identifier: BSD-2-Clause
+# Created: 2026-10-16T22:14:03+0200
+# Last modified: 2026-10-17T15:02:18+0200
+"""
+Calculate many laminates in parallel with a pool of processes.
+
+The laminae are sent to the worker processes as (fiber, resin, fiber weight,
+angle, vf) tuples that refer to a table of fibers and resins. The workers
+re-create them with lamina(), which gives identical results. The workers
+return the properties of a laminate packed in a single array, without the
+layers. The original layers are put back in the main process.
+
+For large numbers of laminates, evaluate_shared lets the workers write
+selected properties into a block of shared memory instead. The main process
+reads them without copying.
+"""
+
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+import os
+import weakref
+
+from lp.core import lamina, laminate, SymmetricLayers
+from lp.types import Lamina, Laminate
+
+__all__ = ["evaluate_many", "evaluate_shared", "SharedResults"]
+
+# Sizes of the matrices in a Laminate.
+_SIZES = {"ABD": 6, "abd": 6, "H": 2, "h": 2, "C": 6, "S": 6}
+
+
+def evaluate_many(stacks, workers=None, chunksize=None, threshold=200):
+    """
+    Create many laminates, using several processes.
+
+    Arguments:
+        stacks: Sequence of (name, layers) tuples, the arguments for laminate().
+        workers: Number of worker processes. Defaults to the number of CPUs.
+        chunksize: Number of laminates sent to a worker at once. By default
+            the stacks are divided in four chunks per worker.
+        threshold: Smaller numbers of stacks are calculated in this process,
+            because starting the workers would take longer.
+
+    Returns:
+        A list of Laminates, in the same order as stacks.
+    """
+    stacks = list(stacks)
+    workers, chunksize = _pool_size(len(stacks), workers, chunksize, threshold)
+    if workers < 2:
+        return [laminate(name, layers) for name, layers in stacks]
+    fibers, resins, encoded = _encode(stacks)
+    chunks = [
+        (fibers, resins, encoded[start : start + chunksize])  # noqa
+        for start in range(0, len(encoded), chunksize)
+    ]
+    rv = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for packed in pool.map(_evaluate, chunks):
+            rv.extend(packed)
+    return [_unpack(name, layers, p) for (name, layers), p in zip(stacks, rv)]
+
+
+class SharedResults:
+    """
+    Properties of laminates, stored as columns in shared memory.
+
+    results["Ex"] is a memoryview of the Ex values of all laminates, in the
+    order of the stacks. It refers to the shared memory; nothing is copied.
+    The available columns are listed in COLUMNS. ABDij is element (i-1, j-1)
+    of the ABD matrix.
+
+    The shared memory is released by close(), at the end of a with block, or
+    else when the object is garbage collected. The column views are released
+    as well; using them afterwards raises a ValueError. Arrays returned by
+    asarray should be deleted before that.
+    """
+
+    COLUMNS = ("Ex", "Ey", "Gxy", "νxy", "αx", "αy", "ρ", "thickness") + tuple(
+        f"ABD{i}{j}" for i in range(1, 7) for j in range(1, 7)
+    )
+
+    def __init__(self, count):
+        """Create shared memory for count laminates."""
+        self._count = count
+        size = max(8, 8 * count * len(self.COLUMNS))
+        self._shm = SharedMemory(create=True, size=size)
+        self.name = self._shm.name
+        # The views are created once; _release releases them in reverse order.
+        self._data = self._shm.buf[:]
+        doubles = self._data.cast("d")
+        self._columns = {
+            c: doubles[n * count : (n + 1) * count]  # noqa
+            for n, c in enumerate(self.COLUMNS)
+        }
+        self._views = [self._data, doubles, *self._columns.values()]
+        self._finalizer = weakref.finalize(self, _release, self._shm, self._views)
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, column):
+        if not self._finalizer.alive:
+            raise ValueError("the shared memory has been released")
+        return self._columns[column]
+
+    def asarray(self):
+        """
+        Return a numpy array of shape (len(COLUMNS), count) that refers to
+        the shared memory.
+        """
+        import numpy as np
+
+        if not self._finalizer.alive:
+            raise ValueError("the shared memory has been released")
+        shape = (len(self.COLUMNS), self._count)
+        return np.ndarray(shape, dtype=float, buffer=self._data)
+
+    def close(self):
+        """Release the shared memory."""
+        self._finalizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _release(shm, views):
+    """Release the views, and close and remove a shared memory block."""
+    try:
+        for view in reversed(views):
+            view.release()
+        shm.close()
+    except BufferError:
+        # Arrays still refer to the memory; it is unmapped when they are gone.
+        pass
+    try:
+        shm.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def evaluate_shared(stacks, workers=None, chunksize=None, threshold=200):
+    """
+    Calculate many laminates, and store their properties in shared memory.
+
+    The arguments are the same as for evaluate_many. The workers write the
+    properties listed in SharedResults.COLUMNS directly into shared memory,
+    so no Laminate is sent back to this process.
+
+    If a worker fails, the shared memory is released and the exception is
+    raised.
+
+    Returns:
+        A SharedResults. Use it in a with block, or call its close method.
+    """
+    stacks = list(stacks)
+    workers, chunksize = _pool_size(len(stacks), workers, chunksize, threshold)
+    fibers, resins, encoded = _encode(stacks)
+    results = SharedResults(len(stacks))
+    count = len(stacks)
+    jobs = [
+        (results.name, count, n, fibers, resins, encoded[n : n + chunksize])  # noqa
+        for n in range(0, count, chunksize)
+    ]
+    try:
+        if workers < 2:
+            for job in jobs:
+                _fill(job)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                for _ in pool.map(_fill, jobs):
+                    pass
+    except BaseException:
+        results.close()
+        raise
+    return results
+
+
+def _pool_size(count, workers, chunksize, threshold):
+    """
+    Determine the number of workers and the chunk size.
+    A single worker means that the work is done in this process.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if count < max(threshold, 2):
+        workers = 1
+    if chunksize is None:
+        chunksize = max(1, -(-count // (4 * workers)))
+    return workers, chunksize
+
+
+def _fill(job):
+    """Calculate encoded stacks and write their properties to shared memory."""
+    name, count, start, fibers, resins, encoded = job
+    shm = SharedMemory(name=name)
+    try:
+        data = shm.buf.cast("d")
+        try:
+            for row, lam in enumerate(_laminates(fibers, resins, encoded), start):
+                values = [getattr(lam, c) for c in SharedResults.COLUMNS[:8]]
+                values += [n for r in lam.ABD for n in r]
+                for col, value in enumerate(values):
+                    data[col * count + row] = value
+        finally:
+            data.release()
+    finally:
+        shm.close()
+    return len(encoded)
+
+
+def _encode(stacks):
+    """
+    Convert the stacks to a compact form.
+
+    Returns:
+        A list of fibers, a list of resins and a list of
+        (name, symmetric, layers) tuples. Laminae in the layers are replaced
+        by (fiber index, resin index, fiber_weight, angle, vf) tuples.
+    """
+    fibers, resins = {}, {}
+    encoded = []
+    for name, layers in stacks:
+        symmetric = isinstance(layers, SymmetricLayers)
+        if symmetric:
+            layers = layers.half
+        items = []
+        for la in layers:
+            if isinstance(la, Lamina):
+                fi = fibers.setdefault(la.fiber, len(fibers))
+                ri = resins.setdefault(la.resin, len(resins))
+                la = (fi, ri, la.fiber_weight, la.angle, la.vf)
+            items.append(la)
+        encoded.append((name, symmetric, items))
+    return list(fibers), list(resins), encoded
+
+
+def _laminates(fibers, resins, encoded):
+    """Generate the laminates for a list of encoded stacks."""
+    for name, symmetric, items in encoded:
+        layers = [
+            la if isinstance(la, str) else lamina(fibers[la[0]], resins[la[1]], *la[2:])
+            for la in items
+        ]
+        if symmetric:
+            layers = SymmetricLayers(layers)
+        yield laminate(name, layers)
+
+
+def _evaluate(chunk):
+    """Calculate a chunk of encoded stacks in a worker process."""
+    return [_pack(lam) for lam in _laminates(*chunk)]
+
+
+def _pack(lam):
+    """Pack all numbers of a Laminate into an array."""
+    values = array("d")
+    for field in Laminate._fields[2:]:
+        value = getattr(lam, field)
+        if field in _SIZES:
+            values.extend(n for row in value for n in row)
+        else:
+            values.append(value)
+    return values
+
+
+def _unpack(name, layers, values):
+    """Re-create a Laminate from its name, layers and packed numbers."""
+    items = [name, layers]
+    pos = 0
+    for field in Laminate._fields[2:]:
+        size = _SIZES.get(field)
+        if size is None:
+            items.append(values[pos])
+            pos += 1
+            continue
+        flat = values[pos : pos + size * size]  # noqa
+        pos += size * size
+        items.append(
+            [list(flat[r * size : (r + 1) * size]) for r in range(size)]  # noqa
+        )
+    return Laminate(*items)
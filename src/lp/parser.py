@@ -3,12 +3,13 @@
 # Copyright © 2014-2021 R.F. Smith <rsmith@xs4all.nl>. All rights reserved.
 # SPDX-License-Identifier: BSD-2-Clause
 # Created: 2014-02-21 21:35:41 +0100
-# Last modified: 2022-01-29T14:01:33+0100
+# Last modified: 2026-10-17T14:20:33+0200
 """Parser for lamprop files."""
 
-import copy
-from .core import fiber, resin, lamina, laminate
+from .core import fiber, resin, lamina, laminate, SymmetricLayers
 from .generic import resins as generic_resins, fibers as generic_fibers
+from .generic import allowables as generic_allowables
+from .types import Event, Strength
 
 info = []
 warn = []
@@ -28,17 +29,17 @@ def parse(filename):
     warn.clear()
     try:
         info.append(f'Reading file "{filename}".')
-        rd, fd, ld = _directives(filename)
-        rd = generic_resins + rd
-        fd = generic_fibers + fd
+        rd, fd, ld, ad = _directives(filename)
     except IOError:
         warn.append(f'Cannot read "{filename}".')
         return []
-    fdict = _get_components(fd, fiber)
+    sdict = _get_strengths(generic_allowables, warn)
+    sdict.update(_get_strengths(ad, warn))
+    fdict = _add_strengths(_get_materials(generic_fibers, fd, fiber), sdict)
     info.append(
         f"Found {len(fdict)} fibers, including {len(generic_fibers)} generic fibers."
     )
-    rdict = _get_components(rd, resin)
+    rdict = _get_materials(generic_resins, rd, resin)
     info.append(
         f"Found {len(rdict)} resins, including {len(generic_resins)} generic resins."
     )
@@ -55,33 +56,198 @@ def parse(filename):
     return laminates
 
 
-def _directives(filename):
+def parse_iter(filename, events=None):
     """
-    Read the directives from a lamprop file.
+    Parse a lamprop file, yielding every laminate as soon as it is complete.
+
+    The file is read once, line by line, and only the current laminate is kept
+    in memory. So unlike parse, fibers and resins must be defined before the
+    end of the laminate that uses them. The same holds for the strengths in
+    a-directives. Otherwise they are handled like in parse; see
+    _get_materials.
+
+    Arguments:
+        filename: The name of the file to parse, or a file-like object.
+        events: Optional function that is called with an Event for every
+            informational message or warning, as it occurs. The line of the
+            Event is that of the directive, or that of the t-directive for
+            messages about a laminate. These messages are not added to info
+            and warn.
+
+    Yields:
+        types.Laminate tuples.
+    """
+
+    def emit(line):
+        if events is not None:
+            for kind, messages in (("info", info), ("warning", warn)):
+                for message in messages:
+                    events(Event(kind, line, message))
+        info.clear()
+        warn.clear()
+
+    def finish(block):
+        lam = _laminate(block, rdict, fdict)
+        emit(block[0][0])
+        return lam
+
+    info.clear()
+    warn.clear()
+    sdict = _get_strengths(generic_allowables, warn)
+    fdict = _add_strengths(_get_components(generic_fibers, fiber), sdict)
+    rdict = _get_components(generic_resins, resin)
+    # Names of the materials and strengths defined in the file.
+    defined, strengths = set(), set()
+    try:
+        df = open(filename, encoding="utf-8") if isinstance(filename, str) else filename
+    except IOError:
+        warn.append(f'Cannot read "{filename}".')
+        emit(0)
+        return
+    block = []
+    try:
+        for num, ln in enumerate(df, start=1):
+            ln = ln.strip()
+            if len(ln) < 2 or ln[1] != ":" or ln[0] not in "tmlscfra":
+                continue
+            directive = (num, ln)
+            kind = ln[0]
+            if kind in "fr":
+                components, tp = (fdict, fiber) if kind == "f" else (rdict, resin)
+                new = _get_components([directive], tp, defined)
+                if kind == "f":
+                    new = _add_strengths(new, sdict)
+                components.update(new)
+                defined.update(new)
+                emit(num)
+            elif kind == "a":
+                new = _get_strengths([directive], warn, strengths)
+                sdict.update(new)
+                strengths.update(new)
+                known = {n: fdict[n] for n in new if n in fdict}
+                fdict.update(_add_strengths(known, new))
+                emit(num)
+            elif kind == "t":
+                if block:
+                    lam = finish(block)
+                    if lam:
+                        yield lam
+                block = [directive]
+            elif block:
+                block.append(directive)
+            else:
+                warn.append(f'No "t" directive before line {num}; line ignored.')
+                emit(num)
+        if block:
+            lam = finish(block)
+            if lam:
+                yield lam
+    finally:
+        if df is not filename:
+            df.close()
+
+
+def materials(filename):
+    """
+    Read the fibers and resins from a lamprop file.
+    The generic fibers and resins are included. The strengths from the
+    a-directives are added to the fibers.
 
     Arguments:
         filename: The name of the file to parse, or a file-like object.
+            If None, only the generic materials are returned.
 
     Returns:
-        A 3-tuple (resin directives, fiber directives, laminate directives)
+        A 2-tuple of dictionaries (fibers, resins), keyed by name.
     """
+    info.clear()
+    warn.clear()
+    try:
+        rd, fd, _, ad = _directives(filename) if filename else ([], [], [], [])
+    except IOError:
+        warn.append(f'Cannot read "{filename}".')
+        rd, fd, ad = [], [], []
+    sdict = _get_strengths(generic_allowables, warn)
+    sdict.update(_get_strengths(ad, warn))
+    fdict = _add_strengths(_get_materials(generic_fibers, fd, fiber), sdict)
+    rdict = _get_materials(generic_resins, rd, resin)
+    return fdict, rdict
+
+
+def allowables(filename):
+    """
+    Read the strengths of plies from the a-directives in a lamprop file.
+    The strengths of the generic fibers are included. Unlike parse, this
+    does not change info and warn.
+
+    An a-directive contains the tensile and compressive strength along the
+    fibers, the tensile and compressive strength transverse to the fibers and
+    the in-plane shear strength, all in MPa, followed by the name of the
+    fiber. For example:
+
+        a: 1500 1200 50 250 70 generic-carbon
+
+    parse adds these strengths to the fibers of the laminae.
+
+    Arguments:
+        filename: The name of the file to parse, or a file-like object.
+            If None, only the generic strengths are returned.
+
+    Returns:
+        A 2-tuple of a dictionary of Strength tuples keyed by fiber name, and
+        a list of warnings.
+    """
+    messages = []
+    try:
+        data = _lines(filename) if filename else []
+    except IOError:
+        messages.append(f'Cannot read "{filename}".')
+        data = []
+    ad = [
+        (num, ln)
+        for num, ln in enumerate(data, start=1)
+        if len(ln) > 1 and ln[:2] == "a:"
+    ]
+    rv = _get_strengths(generic_allowables, messages)
+    rv.update(_get_strengths(ad, messages))
+    return rv, messages
+
+
+def _lines(filename):
+    """Return the stripped lines of a file name or file-like object."""
     if isinstance(filename, str):
         df = open(filename, encoding="utf-8")
     else:
         df = filename
     data = [ln.strip() for ln in df]
     df.close()
+    return data
+
+
+def _directives(filename):
+    """
+    Read the directives from a lamprop file.
+
+    Arguments:
+        filename: The name of the file to parse, or a file-like object.
+
+    Returns:
+        A 4-tuple (resin directives, fiber directives, laminate directives,
+        strength directives)
+    """
+    data = _lines(filename)
     # Filter out lines with directives.
     directives = [
         (num, ln)
         for num, ln in enumerate(data, start=1)
-        if len(ln) > 1 and ln[1] == ":" and ln[0] in "tmlscfr"
+        if len(ln) > 1 and ln[1] == ":" and ln[0] in "tmlscfra"
     ]
     info.append(f"Found {len(directives)} directives")
     rd = [(num, ln) for num, ln in directives if ln[0] == "r"]
     fd = [(num, ln) for num, ln in directives if ln[0] == "f"]
     ld = [(num, ln) for num, ln in directives if ln[0] in "tmlsc"]
-    return rd, fd, ld
+    ad = [(num, ln) for num, ln in directives if ln[0] == "a"]
+    return rd, fd, ld, ad
 
 
 def _get_numbers(directive):
@@ -134,6 +300,9 @@ def _laminate(ld, resins, fibers):
     else:
         warn.append(f'No "t" directive on line {ld[0][0]}; line ignored.')
         return None
+    if len(ld) < 2:
+        warn.append(f'Empty laminate "{lname}" ignored.')
+        return None
     if not ld[1][1].startswith("m"):
         warn.append(f'No valid "m" directive on line {ld[1][0]}; line ignored.')
         return None
@@ -162,46 +331,47 @@ def _laminate(ld, resins, fibers):
         return None
     if sym:
         info.append(f'Laminate "{lname}" is symmetric.')
-        llist = llist + _extended(llist)
+        llist = SymmetricLayers(llist)
     return laminate(lname, llist)
 
 
-def _extended(original):
+def _get_materials(generic, directives, tp):
     """
-    Create the extension to the `original` list to make the laminate symmetric.
-    The position of the comments is taken into account.
+    Parse the fiber or resin lines from a file, and add them to the generic
+    fibers or resins.
+
+    A fiber or resin from the file replaces a generic one with the same
+    name. If a name is defined more than once in the file, the first
+    definition is used.
+
+    Arguments:
+        generic: A sequence of (number, line) tuples of the generic materials.
+        directives: A sequence of (number, line) tuples from the file.
+        tp: The conversion function to use. Either core.fiber or core.resin
+
+    Returns:
+        A dictionary of fibers or resins, keyed by their names.
     """
-    if sum(1 for la in original if isinstance(la, str)) == 0:
-        return original[::-1]
-    layers = copy.deepcopy(original)
-    if not isinstance(layers[-1], str):
-        layers.append("__")
-    if not isinstance(layers[0], str):
-        layers.insert(0, "unknown")
-    idx = [n for n, v in enumerate(layers) if isinstance(v, str)]
-    pairs = list(zip(idx[:-1], idx[1:]))[::-1]
-    extension = []
-    for s, e in pairs:
-        if layers[s] == "__":
-            extension += layers[s + 1 : e][::-1]  # noqa
-        else:
-            extension += [layers[s]] + layers[s + 1 : e][::-1]  # noqa
-    return extension
-
-
-def _get_components(directives, tp):
+    rv = _get_components(generic, tp)
+    rv.update(_get_components(directives, tp))
+    return rv
+
+
+def _get_components(directives, tp, names=()):
     """
     Parse fiber and resin lines.
 
     Arguments:
         directives: A sequence of (number, line) tuples describing fibers/resins.
         tp: The conversion function to use. Either core.fiber or core.resin
+        names: Names that are already defined. Lines that define them again
+            are ignored.
 
     Returns:
-        A list of fiber dictionaries
+        A dictionary of fibers or resins, keyed by their names.
     """
     rv = []
-    names = []
+    names = set(names)
     tname = tp.__name__
     for directive in directives:
         ln = directive[0]
@@ -231,10 +401,58 @@ def _get_components(directives, tp):
                 f"Poisson's ratio on line {ln} should be  >0 and <0.5; line ignored."
             )
             continue
+        names.add(name)
         rv.append(tp(*numbers, name))
     return {comp.name: comp for comp in rv}
 
 
+def _get_strengths(directives, messages, names=()):
+    """
+    Parse strength lines.
+
+    Arguments:
+        directives: A sequence of (number, line) tuples of a-directives.
+        messages: A list to which the warnings are appended.
+        names: Names of fibers that already have strengths. Lines for them
+            are ignored.
+
+    Returns:
+        A dictionary of Strength tuples, keyed by fiber name.
+    """
+    rv = {}
+    for directive in directives:
+        ln = directive[0]
+        numbers, name = _get_numbers(directive)
+        if len(numbers) != 5:
+            messages.append(
+                f"Expected 5 numbers for strengths on line {ln},"
+                f" found {len(numbers)}; line ignored."
+            )
+            continue
+        if not name:
+            messages.append(f"Missing fiber name on line {ln}; line ignored.")
+            continue
+        if name in names or name in rv:
+            messages.append(f'Duplicate strengths "{name}" on line {ln} ignored.')
+            continue
+        if min(numbers) <= 0:
+            messages.append(f"Strengths must be >0 on line {ln}; line ignored.")
+            continue
+        rv[name] = Strength(*numbers, name)
+    return rv
+
+
+def _add_strengths(fibers, strengths):
+    """
+    Return a copy of the dictionary of fibers, where the fibers for which
+    there are strengths in the dictionary strengths have them.
+    """
+    return {
+        name: f._replace(strength=strengths[name]) if name in strengths else f
+        for name, f in fibers.items()
+    }
+
+
 def _get_lamina(directive, fibers, resin, vf):
     """
     Parse a lamina line.
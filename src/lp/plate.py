@@ -0,0 +1,138 @@
+# file: plate.py
+# vim:fileencoding=utf-8:ft=python:fdm=marker
+#
+# Copyright © 2026 R.F. Smith <rsmith@xs4all.nl>. All rights reserved.
+# SPDX-License-Identifier: BSD-2-Clause
+# Created: 2026-10-17T02:05:16+0200
+# Last modified: 2026-10-17T02:05:16+0200
+"""
+Buckling loads and natural frequencies of simply supported rectangular
+plates. This requires NumPy.
+
+The closed-form solutions for specially orthotropic plates are used, see
+Whitney (1987). They only use D11, D12, D22 and D66. The bending–twisting
+terms D16 and D26 are ignored; for balanced symmetric laminates with many
+plies they are small. They are reported by stiffness so that they can be
+checked. The in-plane length a of the plate is in the x-direction and the
+width b in the y-direction.
+
+All arguments can be arrays, which are broadcast against each other. So
+many panel sizes, load ratios and laminates can be calculated at once.
+
+    p = stiffness(lam)
+    N = buckling(p, a, b, k).N
+    f = frequency(p, a, b)
+
+Units: lengths in mm, D in N·mm, loads in N/mm, the areal mass in kg/m² and
+frequencies in Hz.
+"""
+
+import math
+
+from lp.types import PlateStiffness, Buckling
+
+__all__ = ["stiffness", "buckling", "frequency"]
+
+
+def stiffness(lam):
+    """
+    Return the bending stiffness and areal mass of laminates.
+
+    Arguments:
+        lam: A Laminate or a LaminateBatch.
+
+    Returns:
+        A PlateStiffness. For a Laminate the fields are floats, for a
+        LaminateBatch they are arrays.
+    """
+    import numpy as np
+
+    D = np.asarray(lam.ABD, dtype=float)[..., 3:, 3:]
+    # ρ in g/cm³ and thickness in mm.
+    mass = np.asarray(lam.ρ) * np.asarray(lam.thickness)
+    values = [D[..., i, j] for i, j in ((0, 0), (0, 1), (1, 1), (2, 2), (0, 2), (1, 2))]
+    values.append(mass)
+    if D.ndim == 2:
+        values = [float(v) for v in values]
+    return PlateStiffness(*values)
+
+
+def buckling(p, a, b, k=0.0, modes=(10, 10)):
+    """
+    Calculate the critical buckling load of plates under biaxial compression.
+
+    The compressive loads are Nx = N and Ny = k·N. The minimum over the mode
+    numbers m = 1…modes[0] (half-waves in x) and n = 1…modes[1] (half-waves
+    in y) is returned.
+
+    Arguments:
+        p: A PlateStiffness.
+        a: Length of the plate in mm.
+        b: Width of the plate in mm.
+        k: Ratio Ny/Nx. A negative ratio means tension in the y-direction.
+        modes: The largest mode numbers (m, n) to try.
+
+    Returns:
+        A Buckling with the critical compressive load N in N/mm and the mode
+        numbers m and n. N is inf if the plate does not buckle in the modes
+        that were tried.
+    """
+    import numpy as np
+
+    D11, D12, D22, D66 = (np.asarray(d) for d in p[:4])
+    H = D12 + 2 * D66
+    a, b, k = (np.asarray(v, dtype=float) for v in (a, b, k))
+    shape = np.broadcast_shapes(
+        D11.shape, H.shape, D22.shape, a.shape, b.shape, k.shape
+    )
+    N = np.full(shape, np.inf)
+    M = np.zeros(shape, dtype=int)
+    Nm = np.zeros(shape, dtype=int)
+    for n in range(1, modes[1] + 1):
+        β = (n * math.pi / b) ** 2
+        c = k * β
+        # As a function of α = (mπ/a)², the load is D11·(α + c) + L + K/(α + c)
+        # for α + c > 0. Its minimum is at α + c = √(K/D11), so only the mode
+        # numbers around that point have to be tried. If K < 0, the load
+        # increases with α.
+        K = D11 * c * c - 2 * H * β * c + D22 * β * β
+        with np.errstate(invalid="ignore"):
+            best = a / math.pi * np.sqrt(-c + np.sqrt(K / D11))
+        first = np.clip(np.floor(np.nan_to_num(best, nan=1.0)), 1, modes[0])
+        for m in (first, np.minimum(first + 1, modes[0])):
+            α = (m * math.pi / a) ** 2
+            # Whitney (1987), biaxial compression of a specially orthotropic plate.
+            num = D11 * α * α + 2 * H * α * β + D22 * β * β
+            den = α + c
+            with np.errstate(divide="ignore", invalid="ignore"):
+                Nmn = np.where(den > 0, num / den, np.inf)
+            lower = Nmn < N
+            N = np.where(lower, Nmn, N)
+            M = np.where(lower, m, M)
+            Nm = np.where(lower, n, Nm)
+    return Buckling(N, M, Nm)
+
+
+def frequency(p, a, b, m=1, n=1):
+    """
+    Calculate the natural frequency of plates.
+
+    Arguments:
+        p: A PlateStiffness.
+        a: Length of the plate in mm.
+        b: Width of the plate in mm.
+        m: Number of half-waves in the x-direction.
+        n: Number of half-waves in the y-direction.
+
+    Returns:
+        The frequency in Hz. For m = n = 1 it is the lowest frequency.
+    """
+    import numpy as np
+
+    D11, D12, D22, D66 = (np.asarray(d) for d in p[:4])
+    α = (np.asarray(m) * math.pi / np.asarray(a, dtype=float)) ** 2
+    β = (np.asarray(n) * math.pi / np.asarray(b, dtype=float)) ** 2
+    stiffness = D11 * α * α + 2 * (D12 + 2 * D66) * α * β + D22 * β * β
+    # D·α² is in N/mm³, the mass in kg/m² is 1e-6 kg/mm², and 1 N = 1e3 kg·mm/s².
+    ω = np.sqrt(stiffness * 1e9 / np.asarray(p.mass))
+    return ω / (2 * math.pi)
@@ -0,0 +1,184 @@
+# file: polar.py
+# vim:fileencoding=utf-8:ft=python:fdm=marker
+#
+# Copyright © 2026 R.F. Smith <rsmith@xs4all.nl>. All rights reserved.
+# SPDX-License-Identifier: BSD-2-Clause
+# Created: 2026-10-17T02:31:40+0200
+# Last modified: 2026-10-17T14:53:02+0200
+"""
+Polar diagrams of the in-plane properties of a laminate. This requires
+NumPy.
+
+Rotating all plies of a laminate over an angle θ is the same as rotating its
+ABD matrix. With the in-plane part t(θ) of core.tbar, every 3×3 block X of
+ABD becomes t(θ)ᵀ·X·t(θ), and every block x of abd becomes
+t(-θ)·x·t(-θ)ᵀ. So the properties for all angles follow from a single
+laminate without recalculating the plies.
+
+    p = polar(lam, step=1)
+    rows = zip(p.angles, p.Ex, p.Gxy)
+
+This module can also be used from the command line; run
+"python -m lp.polar -h" for the options.
+"""
+
+import argparse
+import csv
+import sys
+
+from lp.core import _rotation_array
+from lp.parser import parse, warn
+from lp.svg import polarplot
+from lp.types import Polar
+
+__all__ = ["PROPERTIES", "rotations", "polar", "plot", "main"]
+
+PROPERTIES = ("Ex", "Ey", "Gxy", "νxy", "νyx")
+
+
+def rotations(angles):
+    """
+    Return the in-plane parts of core.tbar for an array of angles in degrees,
+    as an array with shape (n, 3, 3). Multiples of 90° yield exact values.
+    """
+    import numpy as np
+
+    r = _rotation_array(np.asarray(angles, dtype=float))
+    mn = r.m * r.n
+    # Rows and columns 0, 1 and 5 of Tbar.
+    return np.stack(
+        [
+            np.stack([r.m2, r.n2, mn], axis=-1),
+            np.stack([r.n2, r.m2, -mn], axis=-1),
+            np.stack([-2 * mn, 2 * mn, r.m2 - r.n2], axis=-1),
+        ],
+        axis=-2,
+    )
+
+
+def _blocks(t, m, inverse=False):
+    """
+    Rotate the 3×3 blocks of the 6×6 matrix m with the array of rotations t.
+    If inverse is True, t·x·tᵀ is used per block x, else tᵀ·x·t.
+    """
+    import numpy as np
+
+    T = np.zeros((len(t), 6, 6))
+    T[:, :3, :3] = T[:, 3:, 3:] = t
+    if inverse:
+        return T @ m @ T.transpose(0, 2, 1)
+    return T.transpose(0, 2, 1) @ m @ T
+
+
+def polar(lam, step=1):
+    """
+    Calculate the in-plane properties of a laminate that is rotated in its
+    plane.
+
+    Arguments:
+        lam: A Laminate.
+        step: Step of the angle in degrees.
+
+    Returns:
+        A Polar. Its angles run from 0 up to 360° (exclusive). The ABD and abd
+        matrices have shape (n, 6, 6). The properties have shape (n,). The
+        values for angle θ equal those of the laminate with θ added to the
+        angle of every ply.
+    """
+    import numpy as np
+
+    angles = np.arange(0, 360, step, dtype=float)
+    ABD = _blocks(rotations(angles), np.asarray(lam.ABD, dtype=float))
+    abd = _blocks(rotations(-angles), np.asarray(lam.abd, dtype=float), inverse=True)
+    h = lam.thickness
+    # See core._inplane.
+    return Polar(
+        angles,
+        ABD,
+        abd,
+        1 / (abd[:, 0, 0] * h),
+        1 / (abd[:, 1, 1] * h),
+        1 / (abd[:, 2, 2] * h),
+        -abd[:, 1, 0] / abd[:, 0, 0],
+        -abd[:, 0, 1] / abd[:, 1, 1],
+    )
+
+
+def plot(p, properties=("Ex", "Ey", "Gxy"), title=""):
+    """
+    Create a polar diagram of properties as SVG.
+
+    Arguments:
+        p: A Polar, as returned by polar.
+        properties: Names of the properties to plot. They should have the
+            same unit.
+        title: Title of the plot.
+
+    Returns:
+        The SVG document as a string.
+    """
+    series = []
+    for name in properties:
+        if name not in PROPERTIES:
+            raise ValueError(f'unknown property "{name}"')
+        series.append((name, p.angles, getattr(p, name)))
+    return polarplot(series, title)
+
+
+def main(argv=None):
+    """Entry point for the polar command-line program."""
+    opts = argparse.ArgumentParser(
+        prog="python -m lp.polar",
+        description="Calculate polar diagrams of laminate properties.",
+    )
+    opts.add_argument("file", help="lamprop file to read")
+    opts.add_argument(
+        "-l", "--laminate", help="name of the laminate (default the first one)"
+    )
+    opts.add_argument(
+        "-s", "--step", type=float, default=1, help="step of the angle in degrees"
+    )
+    opts.add_argument("-o", "--output", help="CSV file to write (default stdout)")
+    opts.add_argument("--svg", help="SVG file to write the polar diagram to")
+    opts.add_argument(
+        "-p",
+        "--properties",
+        default="Ex,Ey,Gxy",
+        help=f"comma separated properties to plot from {', '.join(PROPERTIES)}",
+    )
+    args = opts.parse_args(argv)
+    laminates = parse(args.file)
+    for ln in warn:
+        print(ln, file=sys.stderr)
+    if args.laminate:
+        laminates = [lam for lam in laminates if lam.name == args.laminate]
+    if not laminates:
+        opts.error("no laminate found")
+    lam = laminates[0]
+    p = polar(lam, args.step)
+    names = ["angle", *PROPERTIES]
+    out = (
+        open(args.output, "w", encoding="utf-8", newline="")
+        if args.output
+        else sys.stdout
+    )
+    try:
+        writer = csv.writer(out)
+        writer.writerow(names)
+        columns = [p.angles] + [getattr(p, n) for n in PROPERTIES]
+        writer.writerows(zip(*(c.tolist() for c in columns)))
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    if args.svg:
+        properties = [n.strip() for n in args.properties.split(",")]
+        try:
+            svg = plot(p, properties, lam.name)
+        except ValueError as e:
+            opts.error(str(e))
+        with open(args.svg, "w", encoding="utf-8") as f:
+            f.write(svg)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+# file: sensitivity.py
+# vim:fileencoding=utf-8:ft=python:fdm=marker
+#
+# Copyright © 2026 R.F. Smith <rsmith@xs4all.nl>. All rights reserved.
+# SPDX-License-Identifier: BSD-2-Clause
+# Created: 2026-10-17T00:20:13+0200
+# Last modified: 2026-10-17T00:20:13+0200
+"""
+Exact derivatives of laminate properties with respect to the angle, fiber
+weight and fiber volume fraction of every ply.
+
+The derivatives are calculated in a single pass with forward-mode automatic
+differentiation. A Dual holds a value and its derivatives with respect to
+all parameters. Since core._onaxis and core._rotated only use arithmetic,
+they work on Dual numbers. For the inverse of the ABD matrix the relation
+d(abd) = -abd·d(ABD)·abd is used.
+
+    s = sensitivity(layers)
+    for (ply, name), d in zip(s.parameters, s.Ex.grad):
+        print(f"∂Ex/∂{name} of ply {ply}: {d}")
+"""
+
+import math
+
+from lp.core import _onaxis, _rotated, _rotation
+from lp.types import Lamina, Rotation, Sensitivity
+import lp.matrix as lpm
+
+__all__ = ["Dual", "sensitivity"]
+
+# The parameters of every ply, in order.
+_PARAMETERS = ("angle", "fiber_weight", "vf")
+
+
+class Dual:
+    """
+    Number with its derivatives with respect to several parameters.
+
+    Attributes:
+        value: The value of the number.
+        grad: Tuple of the derivatives.
+    """
+
+    __slots__ = ("value", "grad")
+
+    def __init__(self, value, grad):
+        self.value = value
+        self.grad = tuple(grad)
+
+    @classmethod
+    def variable(cls, value, index, count):
+        """Create parameter number index of count parameters."""
+        return cls(value, (1.0 if n == index else 0.0 for n in range(count)))
+
+    def __repr__(self):
+        return f"Dual({self.value!r}, {self.grad!r})"
+
+    def __float__(self):
+        return float(self.value)
+
+    def __neg__(self):
+        return Dual(-self.value, (-a for a in self.grad))
+
+    def __add__(self, other):
+        if isinstance(other, Dual):
+            return Dual(
+                self.value + other.value, (a + b for a, b in zip(self.grad, other.grad))
+            )
+        return Dual(self.value + other, self.grad)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, Dual):
+            return Dual(
+                self.value - other.value, (a - b for a, b in zip(self.grad, other.grad))
+            )
+        return Dual(self.value - other, self.grad)
+
+    def __rsub__(self, other):
+        return Dual(other - self.value, (-a for a in self.grad))
+
+    def __mul__(self, other):
+        if isinstance(other, Dual):
+            u, v = self.value, other.value
+            return Dual(u * v, (a * v + u * b for a, b in zip(self.grad, other.grad)))
+        return Dual(self.value * other, (a * other for a in self.grad))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, Dual):
+            u, v = self.value, other.value
+            return Dual(
+                u / v,
+                ((a * v - u * b) / (v * v) for a, b in zip(self.grad, other.grad)),
+            )
+        return Dual(self.value / other, (a / other for a in self.grad))
+
+    def __rtruediv__(self, other):
+        v = self.value
+        f = -other / (v * v)
+        return Dual(other / v, (f * a for a in self.grad))
+
+    def __pow__(self, n):
+        if isinstance(n, Dual):
+            raise TypeError("only numbers are supported as exponent")
+        f = n * self.value ** (n - 1)
+        return Dual(self.value**n, (f * a for a in self.grad))
+
+
+def sensitivity(layers):
+    """
+    Calculate the properties of a laminate and their derivatives.
+
+    Arguments:
+        layers: Sequence of laminae (and comments), from bottom to top.
+
+    Returns:
+        A Sensitivity. Its parameters is a list of (ply, name) tuples, where
+        ply is the index of a lamina in the layers (not counting comments)
+        and name is "angle", "fiber_weight" or "vf". The other fields are
+        Duals, or 6×6 lists of Duals for ABD and abd. The derivatives in
+        their grad are in the order of the parameters. Angles are in
+        degrees.
+    """
+    laminae = [la for la in layers if isinstance(la, Lamina)]
+    if not laminae:
+        raise ValueError("no layers in the laminate")
+    count = len(_PARAMETERS) * len(laminae)
+    parameters = [(n, name) for n in range(len(laminae)) for name in _PARAMETERS]
+    plies = []
+    for n, la in enumerate(laminae):
+        angle, weight, vf = (
+            Dual.variable(getattr(la, name), 3 * n + k, count)
+            for k, name in enumerate(_PARAMETERS)
+        )
+        plies.append(_ply(la.fiber, la.resin, weight, angle, vf))
+    thickness = sum((t for t, _, _ in plies), Dual(0.0, [0.0] * count))
+    # Integrate over the thickness, like core._plate.
+    ABD = [[0.0] * 6 for _ in range(6)]
+    Nt = [0.0, 0.0, 0.0]
+    zs = -thickness / 2
+    for t, Q, α in plies:
+        ze = zs + t
+        z2 = (ze * ze - zs * zs) / 2
+        z3 = (ze * ze * ze - zs * zs * zs) / 3
+        for i in range(3):
+            for j in range(3):
+                ABD[i][j] += Q[i][j] * t
+                ABD[i][j + 3] += Q[i][j] * z2
+                ABD[i + 3][j] += Q[i][j] * z2
+                ABD[i + 3][j + 3] += Q[i][j] * z3
+            Nt[i] += (Q[i][0] * α[0] + Q[i][1] * α[1] + Q[i][2] * α[2]) * t
+        zs = ze
+    abd = _inverse(ABD, count)
+    # See core._inplane and core._thermal.
+    Ex = 1 / (abd[0][0] * thickness)
+    Ey = 1 / (abd[1][1] * thickness)
+    Gxy = 1 / (abd[2][2] * thickness)
+    νxy = -abd[1][0] / abd[0][0]
+    νyx = -abd[0][1] / abd[1][1]
+    αx = abd[0][0] * Nt[0] + abd[0][1] * Nt[1] + abd[0][2] * Nt[2]
+    αy = abd[1][0] * Nt[0] + abd[1][1] * Nt[1] + abd[1][2] * Nt[2]
+    return Sensitivity(parameters, thickness, ABD, abd, Ex, Ey, Gxy, νxy, νyx, αx, αy)
+
+
+def _ply(fiber, resin, fiber_weight, angle, vf):
+    """
+    Calculate the properties of a ply that are needed for the laminate,
+    like core.lamina does.
+
+    Returns:
+        The thickness, the Q̅ matrix and (αx, αy, αxy).
+    """
+    p = _onaxis(fiber, resin, vf)
+    thickness = fiber_weight / (fiber.ρ * 1000) * p.ft
+    props, _ = _rotated(p, _rotation_dual(angle))
+    αx, αy, αxy, Q11, Q12, Q16, Q22, Q26, Q66 = props[:9]
+    Q = [[Q11, Q12, Q16], [Q12, Q22, Q26], [Q16, Q26, Q66]]
+    return thickness, Q, (αx, αy, αxy)
+
+
+def _rotation_dual(angle):
+    """Return the Rotation for an angle in degrees that is a Dual."""
+    r = _rotation(angle.value)
+    f = math.pi / 180
+    c = Dual(r.m, (-r.n * f * a for a in angle.grad))
+    s = Dual(r.n, (r.m * f * a for a in angle.grad))
+    c2, s2 = c * c, s * s
+    return Rotation(c, s, c2, s2, c2 * c, s2 * s, c2 * c2, s2 * s2, None)
+
+
+def _inverse(m, count):
+    """
+    Return the inverse of a matrix of Duals.
+    Elements that do not depend on any parameter can be floats.
+    """
+    size = len(m)
+    value = [[float(n) for n in row] for row in m]
+    inv = lpm.LU(value).inv()
+    grads = []
+    for k in range(count):
+        dm = [[n.grad[k] if isinstance(n, Dual) else 0.0 for n in row] for row in m]
+        grads.append(lpm.mul(lpm.matmul(lpm.matmul(inv, dm), inv), -1))
+    return [
+        [Dual(inv[i][j], (g[i][j] for g in grads)) for j in range(size)]
+        for i in range(size)
+    ]
@@ -0,0 +1,220 @@
+# file: svg.py
+# vim:fileencoding=utf-8:ft=python:fdm=marker
+#
+# Copyright © 2026 R.F. Smith <rsmith@xs4all.nl>. All rights reserved.
+# SPDX-License-Identifier: BSD-2-Clause
+# Created: 2026-10-17T00:41:27+0200
+# Last modified: 2026-10-17T02:31:40+0200
+"""
+Simple line plots and polar plots as SVG, without dependencies.
+
+    series = [("0%", xs, ys), ("10%", xs2, ys2)]
+    with open("plot.svg", "w") as f:
+        f.write(lineplot(series, "x label", "y label", "title"))
+"""
+
+from html import escape
+import math
+
+__all__ = ["lineplot", "polarplot"]
+
+# Line colors; they are re-used when there are more series.
+COLORS = (
+    "#1f77b4",
+    "#ff7f0e",
+    "#2ca02c",
+    "#d62728",
+    "#9467bd",
+    "#8c564b",
+    "#e377c2",
+    "#7f7f7f",
+    "#bcbd22",
+    "#17becf",
+)
+# Margins around the plot area: left, right, top, bottom.
+_MARGINS = (80, 100, 40, 50)
+
+
+def lineplot(series, xlabel="", ylabel="", title="", width=640, height=480):
+    """
+    Create a line plot.
+
+    Arguments:
+        series: Sequence of (label, xs, ys) tuples. Every series is drawn as
+            a line and labeled at its last point.
+        xlabel: Label for the horizontal axis.
+        ylabel: Label for the vertical axis.
+        title: Title of the plot.
+        width: Width of the image in pixels.
+        height: Height of the image in pixels.
+
+    Returns:
+        The SVG document as a string.
+    """
+    series = [(label, list(xs), list(ys)) for label, xs, ys in series]
+    xall = [x for _, xs, _ in series for x in xs]
+    yall = [y for _, _, ys in series for y in ys]
+    if not xall:
+        raise ValueError("no data to plot")
+    xticks = _ticks(min(xall), max(xall))
+    yticks = _ticks(min(yall), max(yall))
+    left, right, top, bottom = _MARGINS
+    pw, ph = width - left - right, height - top - bottom
+
+    def px(x):
+        return left + (x - xticks[0]) / (xticks[-1] - xticks[0]) * pw
+
+    def py(y):
+        return top + ph - (y - yticks[0]) / (yticks[-1] - yticks[0]) * ph
+
+    lines = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" '
+        f'height="{height}" viewBox="0 0 {width} {height}" '
+        'font-family="sans-serif" font-size="12">',
+        f'<rect width="{width}" height="{height}" fill="white"/>',
+        '<g stroke="#dddddd" stroke-width="1">',
+    ]
+    for x in xticks:
+        lines.append(_line(px(x), top, px(x), top + ph))
+    for y in yticks:
+        lines.append(_line(left, py(y), left + pw, py(y)))
+    lines.append("</g>")
+    lines.append(
+        f'<rect x="{left}" y="{top}" width="{pw}" height="{ph}" '
+        'fill="none" stroke="black"/>'
+    )
+    lines.append('<g text-anchor="middle">')
+    for x in xticks:
+        lines.append(_text(px(x), top + ph + 16, _format(x)))
+    lines.append(_text(left + pw / 2, height - 10, xlabel))
+    lines.append(_text(width / 2, top - 16, title, 'font-size="14"'))
+    lines.append("</g>")
+    lines.append('<g text-anchor="end">')
+    for y in yticks:
+        lines.append(_text(left - 6, py(y) + 4, _format(y)))
+    lines.append("</g>")
+    lines.append(
+        _text(
+            16,
+            top + ph / 2,
+            ylabel,
+            f'text-anchor="middle" transform="rotate(-90 16 {top + ph / 2:.1f})"',
+        )
+    )
+    for n, (label, xs, ys) in enumerate(series):
+        if not xs:
+            continue
+        color = COLORS[n % len(COLORS)]
+        points = " ".join(f"{px(x):.1f},{py(y):.1f}" for x, y in zip(xs, ys))
+        lines.append(
+            f'<polyline points="{points}" fill="none" stroke="{color}" '
+            'stroke-width="1.5"/>'
+        )
+        lines.append(_text(px(xs[-1]) + 4, py(ys[-1]) + 4, label, f'fill="{color}"'))
+    lines.append("</svg>")
+    return "\n".join(lines) + "\n"
+
+
+def polarplot(series, title="", size=480):
+    """
+    Create a polar plot.
+
+    Arguments:
+        series: Sequence of (label, angles, values) tuples. The angles are in
+            degrees, counter-clockwise from the positive x-axis. The values
+            are the distances from the center and should not be negative.
+        title: Title of the plot.
+        size: Height of the image in pixels. The width includes the legend.
+
+    Returns:
+        The SVG document as a string.
+    """
+    series = [(label, list(angles), list(values)) for label, angles, values in series]
+    vall = [v for _, _, values in series for v in values]
+    if not vall:
+        raise ValueError("no data to plot")
+    rings = [v for v in _ticks(0, max(vall), 5) if v > 0]
+    top = _MARGINS[2]
+    radius = (size - 2 * top) / 2
+    cx, cy = top + radius, top + radius
+    width = size + _MARGINS[1] + 40
+
+    def point(angle, value):
+        θ = math.radians(angle)
+        r = value / rings[-1] * radius
+        return cx + r * math.cos(θ), cy - r * math.sin(θ)
+
+    lines = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" '
+        f'height="{size}" viewBox="0 0 {width} {size}" '
+        'font-family="sans-serif" font-size="12">',
+        f'<rect width="{width}" height="{size}" fill="white"/>',
+        '<g stroke="#dddddd" stroke-width="1" fill="none">',
+    ]
+    for v in rings:
+        r = v / rings[-1] * radius
+        lines.append(f'<circle cx="{cx:.1f}" cy="{cy:.1f}" r="{r:.1f}"/>')
+    for angle in range(0, 360, 30):
+        lines.append(_line(cx, cy, *point(angle, rings[-1])))
+    lines.append("</g>")
+    lines.append('<g text-anchor="middle">')
+    for angle in range(0, 360, 30):
+        x, y = point(angle, rings[-1] * 1.06)
+        lines.append(_text(x, y + 4, f"{angle}°"))
+    lines.append(_text(width / 2, top / 2, title, 'font-size="14"'))
+    lines.append("</g>")
+    lines.append('<g text-anchor="start" fill="#777777">')
+    for v in rings:
+        x, y = point(0, v)
+        lines.append(_text(x + 2, y - 4, _format(v)))
+    lines.append("</g>")
+    for n, (label, angles, values) in enumerate(series):
+        if not angles:
+            continue
+        color = COLORS[n % len(COLORS)]
+        points = " ".join(
+            "{:.1f},{:.1f}".format(*point(a, v)) for a, v in zip(angles, values)
+        )
+        lines.append(
+            f'<polygon points="{points}" fill="none" stroke="{color}" '
+            'stroke-width="1.5"/>'
+        )
+        ly = top + 16 * (n + 1)
+        lines.append(_line(size + 10, ly - 4, size + 30, ly - 4, f'stroke="{color}"'))
+        lines.append(_text(size + 34, ly, label, f'fill="{color}"'))
+    lines.append("</svg>")
+    return "\n".join(lines) + "\n"
+
+
+def _ticks(low, high, count=6):
+    """Return about count evenly spaced round numbers that span low–high."""
+    if high == low:
+        delta = abs(low) / 10 or 1.0
+        low, high = low - delta, high + delta
+    raw = (high - low) / (count - 1)
+    magnitude = 10 ** math.floor(math.log10(raw))
+    step = next(m * magnitude for m in (1, 2, 2.5, 5, 10) if m * magnitude >= raw)
+    first = math.floor(low / step + 1e-9)
+    last = math.ceil(high / step - 1e-9)
+    return [n * step for n in range(first, last + 1)]
+
+
+def _format(value):
+    """Format a tick value."""
+    return f"{value:.6g}"
+
+
+def _line(x1, y1, x2, y2, attributes=""):
+    if attributes:
+        attributes = " " + attributes
+    return (
+        f'<line x1="{x1:.1f}" y1="{y1:.1f}" x2="{x2:.1f}" y2="{y2:.1f}"{attributes}/>'
+    )
+
+
+def _text(x, y, text, attributes=""):
+    if attributes:
+        attributes = " " + attributes
+    return f'<text x="{x:.1f}" y="{y:.1f}"{attributes}>{escape(text)}</text>'
@@ -0,0 +1,258 @@
+# file: sweep.py
+# vim:fileencoding=utf-8:ft=python:fdm=marker
+#
+# Copyright © 2026 R.F. Smith <rsmith@xs4all.nl>. All rights reserved.
+# SPDX-License-Identifier: BSD-2-Clause
+# Created: 2026-10-16T21:31:09+0200
+# Last modified: 2026-10-17T14:53:40+0200
+"""
+Sweeps over the design space of laminates. This requires NumPy.
+
+A sweep calculates the properties of every combination of
+
+* a stack template like "0 a -a 90 s", where the symbol a is an angle,
+* a fiber and resin pair,
+* a fiber volume fraction,
+* a fiber weight (the same for all plies),
+* a value for every symbol in the template.
+
+The laminates are calculated in batches with core.laminate_batch. The
+results are yielded in chunks of at most chunksize laminates, so the memory
+use does not depend on the size of the grid.
+
+This module can also be used from the command line; run
+"python -m lp.sweep -h" for the options.
+"""
+
+import argparse
+import csv
+import math
+import sys
+
+from lp.core import laminate_batch
+from lp.parser import materials, warn
+from lp.types import LaminateBatch, Template, SweepChunk
+
+# Properties that can be selected; the matrices are not included.
+PROPERTIES = tuple(f for f in LaminateBatch._fields if f not in ("ABD", "abd"))
+DEFAULT = ("Ex", "Ey", "Gxy", "νxy", "αx", "αy", "ρ", "thickness")
+
+
+def template(text, name=None):
+    """
+    Create a stack template.
+
+    Arguments:
+        text: The angles of the plies from bottom to top, separated by
+            whitespace. An angle is a number, a symbol or a symbol preceded by
+            "-". If the last item is "s", the stack is made symmetric.
+        name: The name of the template. Defaults to text.
+
+    Returns:
+        A Template.
+    """
+    items = text.split()
+    if items and items[-1] == "s":
+        items = items[:-1]
+        items += items[::-1]
+    if not items:
+        raise ValueError("empty template")
+    plies = []
+    for item in items:
+        try:
+            plies.append(float(item))
+        except ValueError:
+            if not item.lstrip("-").isidentifier():
+                raise ValueError(f'invalid angle "{item}" in template')
+            plies.append(item)
+    symbols = tuple(sorted({p.lstrip("-") for p in plies if isinstance(p, str)}))
+    return Template(name or text, tuple(plies), symbols)
+
+
+def sweep(
+    templates,
+    pairs,
+    vfs,
+    fiber_weights,
+    symbols=None,
+    properties=DEFAULT,
+    chunksize=10000,
+):
+    """
+    Calculate the properties of all combinations of the arguments.
+
+    Arguments:
+        templates: Sequence of Template or strings.
+        pairs: Sequence of (Fiber, Resin) tuples.
+        vfs: Sequence of fiber volume fractions.
+        fiber_weights: Sequence of fiber weights in g/m².
+        symbols: Dictionary of the angles for every symbol used in the
+            templates.
+        properties: Names of the properties to return. See PROPERTIES.
+        chunksize: The maximum number of laminates per chunk.
+
+    Yields:
+        SweepChunk tuples. The columns are a dictionary of arrays for "vf",
+        "fiber_weight", the symbols in the template and the properties.
+    """
+    import numpy as np
+
+    if symbols is None:
+        symbols = {}
+    for p in properties:
+        if p not in PROPERTIES:
+            raise ValueError(f'unknown property "{p}"')
+    for tpl in templates:
+        if isinstance(tpl, str):
+            tpl = template(tpl)
+        missing = [s for s in tpl.symbols if s not in symbols]
+        if missing:
+            raise ValueError(f'no values for {", ".join(missing)} in "{tpl.name}"')
+        grids = [np.asarray(vfs, dtype=float), np.asarray(fiber_weights, dtype=float)]
+        grids += [np.asarray(symbols[s], dtype=float) for s in tpl.symbols]
+        shape = tuple(len(g) for g in grids)
+        total = math.prod(shape)
+        for fiber, resin in pairs:
+            for start in range(0, total, chunksize):
+                index = np.arange(start, min(total, start + chunksize))
+                values = [g[i] for g, i in zip(grids, np.unravel_index(index, shape))]
+                vf, weight = values[:2]
+                angles = dict(zip(tpl.symbols, values[2:]))
+                stack = np.column_stack(
+                    [
+                        (
+                            _angle(ply, angles)
+                            if isinstance(ply, str)
+                            else np.full(len(index), ply)
+                        )
+                        for ply in tpl.plies
+                    ]
+                )
+                res = laminate_batch(fiber, resin, weight[:, None], stack, vf[:, None])
+                columns = {"vf": vf, "fiber_weight": weight, **angles}
+                columns.update((p, getattr(res, p)) for p in properties)
+                yield SweepChunk(tpl.name, fiber.name, resin.name, columns)
+
+
+def _angle(ply, angles):
+    """Return the angles for a symbolic ply."""
+    if ply.startswith("-"):
+        return -angles[ply[1:]]
+    return angles[ply]
+
+
+def _values(text):
+    """
+    Convert a string to a list of numbers.
+    It is either a comma separated list or a range start:stop:step that
+    includes stop.
+    """
+    if ":" in text:
+        start, stop, step = (float(n) for n in text.split(":"))
+        count = int(math.floor((stop - start) / step + 1e-9)) + 1
+        return [start + n * step for n in range(count)]
+    return [float(n) for n in text.split(",")]
+
+
+def main(argv=None):
+    """Entry point for the sweep command-line program."""
+    opts = argparse.ArgumentParser(
+        prog="python -m lp.sweep",
+        description="Calculate laminate properties over a grid of parameters.",
+    )
+    opts.add_argument(
+        "-m", "--materials", help="lamprop file to read fibers and resins from"
+    )
+    opts.add_argument(
+        "-t",
+        "--template",
+        action="append",
+        required=True,
+        help='stack template, e.g. "0 a -a 90 s"; can be repeated',
+    )
+    opts.add_argument(
+        "-f",
+        "--fiber",
+        action="append",
+        required=True,
+        help="fiber name; can be repeated",
+    )
+    opts.add_argument(
+        "-r",
+        "--resin",
+        action="append",
+        required=True,
+        help="resin name; can be repeated",
+    )
+    opts.add_argument(
+        "--vf", default="0.5", help="fiber volume fractions, list or start:stop:step"
+    )
+    opts.add_argument(
+        "-w", "--weight", default="200", help="fiber weights, list or start:stop:step"
+    )
+    opts.add_argument(
+        "-a",
+        "--angle",
+        action="append",
+        default=[],
+        help="values of a symbol, e.g. a=0:90:15; can be repeated",
+    )
+    opts.add_argument(
+        "-p",
+        "--properties",
+        default=",".join(DEFAULT),
+        help=f"comma separated properties from {', '.join(PROPERTIES)}",
+    )
+    opts.add_argument(
+        "-c", "--chunksize", type=int, default=10000, help="laminates per chunk"
+    )
+    opts.add_argument("-o", "--output", help="CSV file to write (default stdout)")
+    args = opts.parse_args(argv)
+    fibers, resins = materials(args.materials)
+    for ln in warn:
+        print(ln, file=sys.stderr)
+    try:
+        pairs = [(fibers[f], resins[r]) for f in args.fiber for r in args.resin]
+    except KeyError as e:
+        opts.error(f"unknown material {e}")
+    symbols = {}
+    for item in args.angle:
+        name, _, values = item.partition("=")
+        symbols[name.strip()] = _values(values)
+    properties = [p.strip() for p in args.properties.split(",")]
+    templates = [template(t) for t in args.template]
+    names = sorted({s for t in templates for s in t.symbols})
+    out = (
+        open(args.output, "w", encoding="utf-8", newline="")
+        if args.output
+        else sys.stdout
+    )
+    try:
+        writer = csv.writer(out)
+        writer.writerow(
+            ["template", "fiber", "resin", "vf", "fiber_weight"] + names + properties
+        )
+        for chunk in sweep(
+            templates,
+            pairs,
+            _values(args.vf),
+            _values(args.weight),
+            symbols,
+            properties,
+            args.chunksize,
+        ):
+            c = chunk.columns
+            cols = [c["vf"], c["fiber_weight"]]
+            cols += [c.get(n, [""] * len(c["vf"])) for n in names]
+            cols += [c[p] for p in properties]
+            for row in zip(*cols):
+                writer.writerow([chunk.template, chunk.fiber, chunk.resin, *row])
+    except ValueError as e:
+        opts.error(str(e))
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -4,11 +4,12 @@
 # Copyright © 2023 R.F. Smith <rsmith@xs4all.nl>
 # SPDX-License-Identifier: MIT
 # Created: 2023-12-03T00:12:51+0100
-# Last modified: 2023-12-03T00:45:40+0100
+# Last modified: 2026-10-17T14:20:33+0200
 
 from collections import namedtuple
 
-Fiber = namedtuple("Fiber", "E1 ν12 α1 ρ name")
+# The strength of a fiber is a Strength or None. See parser.allowables.
+Fiber = namedtuple("Fiber", "E1 ν12 α1 ρ name strength", defaults=(None,))
 Resin = namedtuple("Resin", "E ν α ρ name")
 Lamina = namedtuple(
     "Lamina",
@@ -16,6 +17,59 @@ Lamina = namedtuple(
     "G12 G13 G23 ν12 ν13 ν23 αx αy αxy Q̅11 Q̅12 Q̅16 Q̅22 Q̅26 Q̅66 Q̅s44 Q̅s55 "
     "Q̅s45 ρ C",
 )
+# Structure of arrays for many laminae. See core.lamina_batch.
+LaminaBatch = namedtuple("LaminaBatch", Lamina._fields)
+# Properties of a lamina in its own coordinate system. See core._onaxis.
+OnAxis = namedtuple(
+    "OnAxis",
+    "vm ft E1 E2 E3 G12 G13 G23 ν12 ν13 ν23 α1 α2 Q11 Q12 Q22 Q66 Qs44 Qs55 "
+    "C11 C12 C13 C22 C23 C33 C44 C55 C66 ρ",
+)
+# Rotation around the z-axis. See core._rotation.
+Rotation = namedtuple("Rotation", "m n m2 n2 m3 n3 m4 n4 Tbar")
+# In-plane properties of many laminates. See core.laminate_batch.
+LaminateBatch = namedtuple(
+    "LaminateBatch",
+    "thickness fiber_weight ρ vf resin_weight wf ABD abd Ex Ey Gxy νxy νyx αx αy",
+)
+# Stack of plies with symbolic angles. See sweep.template.
+Template = namedtuple("Template", "name plies symbols")
+# Part of the results of a sweep. See sweep.sweep.
+SweepChunk = namedtuple("SweepChunk", "template fiber resin columns")
+# Scatter of an input. See montecarlo.normal and montecarlo.uniform.
+Distribution = namedtuple("Distribution", "kind a b relative")
+# Summary of the samples of a property. See montecarlo.montecarlo.
+Statistics = namedtuple("Statistics", "mean std percentiles")
+MonteCarloResult = namedtuple("MonteCarloResult", "statistics samples")
+# Derivatives of laminate properties. See sensitivity.sensitivity.
+Sensitivity = namedtuple(
+    "Sensitivity", "parameters thickness ABD abd Ex Ey Gxy νxy νyx αx αy"
+)
+# Message from the parser. See parser.parse_iter.
+Event = namedtuple("Event", "kind line message")
+# Strengths of a ply in MPa, for a fiber. See parser.allowables.
+Strength = namedtuple("Strength", "Xt Xc Yt Yc S name")
+# First ply failure loads along rays. See failure.envelope.
+Envelope = namedtuple("Envelope", "directions factor ply face mode")
+# Bending stiffness and areal mass of plates. See plate.stiffness.
+PlateStiffness = namedtuple("PlateStiffness", "D11 D12 D22 D66 D16 D26 mass")
+# Critical buckling load and mode. See plate.buckling.
+Buckling = namedtuple("Buckling", "N m n")
+# Properties of a laminate rotated in its plane. See polar.polar.
+Polar = namedtuple("Polar", "angles ABD abd Ex Ey Gxy νxy νyx")
+# Ply data as arrays. See loads.plies.
+Plies = namedtuple("Plies", "Q̅ α z Ts Te abd")
+# Strains and stresses for load cases. See loads.solve.
+LoadResponse = namedtuple(
+    "LoadResponse", "ε0 κ strain stress material_strain material_stress"
+)
+# Tsai–Pagano invariants of the in-plane stiffness. See lamparam.invariants.
+Invariants = namedtuple("Invariants", "U1 U2 U3 U4 U5")
+# Lamination parameters of a stack. See lamparam.parameters.
+LaminationParameters = namedtuple(
+    "LaminationParameters",
+    "thickness ξA1 ξA2 ξA3 ξA4 ξB1 ξB2 ξB3 ξB4 ξD1 ξD2 ξD3 ξD4",
+)
 Laminate = namedtuple(
     "Laminate",
     "name layers thickness fiber_weight ρ vf resin_weight ABD abd H h Ex Ey Ez "
@@ -0,0 +1,52 @@
+# file: test_cache.py
+# vim:fileencoding=utf-8:fdm=marker:ft=python
+#
+# Author: R.F. Smith <rsmith@xs4all.nl>
+# Created: 2026-10-16T15:30:12+0200
+# Last modified: 2026-10-17T11:14:52+0200
+"""Test of the LRU cache and its use in lamina()."""
+
+from lp.cache import LRUCache
+from lp.core import fiber, resin, lamina, tbar, isortho, onaxis_cache, rotation_cache
+
+
+def test_lru():  # {{{1
+    c = LRUCache(maxsize=2)
+    assert c.get("a", str.upper, "a") == "A"
+    assert c.get("b", str.upper, "b") == "B"
+    assert c.get("a", str.upper, "x") == "A"  # hit, so "b" is now the oldest.
+    assert c.get("c", str.upper, "c") == "C"
+    assert "b" not in c and "a" in c
+    assert c.info() == (1, 3, 1, 2, 2)
+    c.clear()
+    assert len(c) == 0 and c.info().hits == 0
+
+
+def test_lamina_cache():  # {{{1
+    f = fiber(230000, 0.30, -0.41e-6, 1.76, "T300")
+    r = resin(2900, 0.36, 41.4e-6, 1.15, "Epikote04908")
+    onaxis_cache.clear()
+    layers = [lamina(f, r, 100, angle, 0.5) for angle in (0, 45, -45, 90)]
+    assert onaxis_cache.info().misses == 1
+    assert onaxis_cache.info().hits == 3
+    lamina(f, r, 200, 0, 0.55)
+    assert onaxis_cache.info().misses == 2
+    # The cached data must not change the result.
+    onaxis_cache.clear()
+    assert lamina(f, r, 100, 45, 0.5) == layers[1]
+
+
+def test_rotation_cache():  # {{{1
+    rotation_cache.clear()
+    T = tbar(90)
+    assert T[0][:2] == [0.0, 1.0] and T[5][5] == -1.0
+    # Every call returns a new matrix from the cached values.
+    T[0][0] = 2.0
+    assert tbar(90.0) == [[0.0, 1.0, 0, 0, 0, 0.0]] + T[1:]
+    assert rotation_cache.info().hits == 1
+    assert tbar(-270)[0][5] == 0.0
+    f = fiber(230000, 0.30, -0.41e-6, 1.76, "T300")
+    r = resin(2900, 0.36, 41.4e-6, 1.15, "Epikote04908")
+    la = lamina(f, r, 100, 90, 0.5)
+    assert la.Q̅16 == 0.0 and la.Q̅26 == 0.0
+    assert isortho(la.C)
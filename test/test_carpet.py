@@ -0,0 +1,61 @@
+# file: test_carpet.py
+# vim:fileencoding=utf-8:fdm=marker:ft=python
+#
+# Author: R.F. Smith <rsmith@xs4all.nl>
+# Created: 2026-10-17T00:41:27+0200
+# Last modified: 2026-10-17T00:41:27+0200
+"""Test of the carpet plots."""
+
+import csv
+import xml.dom.minidom
+
+import pytest
+
+from lp.core import fiber, resin, lamina, laminate
+from lp.carpet import grid, carpet, plot, main
+from lp.svg import _ticks
+
+np = pytest.importorskip("numpy")
+
+hf = fiber(233000, 0.2, -0.54e-6, 1.76, "Hyer's carbon fiber")
+hr = resin(4620, 0.36, 41.4e-6, 1.1, "Hyer's resin")
+
+
+def test_grid():  # {{{1
+    p0, p45, p90 = grid(1)
+    assert len(p0) == 5151
+    assert np.all(p0 + p45 + p90 == 100)
+    assert np.all(p90 >= 0)
+    with pytest.raises(ValueError):
+        grid(3)
+
+
+def test_carpet():  # {{{1
+    c = carpet(hf, hr, 0.5, 10)
+    # 50% 0°, 40% ±45°, 10% 90°, symmetric.
+    angles = [0] * 5 + [45, -45, -45, 45] + [90]
+    layers = [lamina(hf, hr, 100, a, 0.5) for a in angles]
+    lam = laminate("test", layers + layers[::-1])
+    (i,) = np.nonzero((c["p0"] == 50) & (c["p45"] == 40))[0]
+    for prop in ("Ex", "Ey", "Gxy", "νxy", "νyx", "αx", "αy"):
+        assert c[prop][i] == pytest.approx(getattr(lam, prop))
+
+
+def test_plot():  # {{{1
+    assert _ticks(0, 100) == [0, 20, 40, 60, 80, 100]
+    c = carpet(hf, hr, 0.5, 5)
+    doc = xml.dom.minidom.parseString(plot(c, "Gxy", 25, "<test>"))
+    assert len(doc.getElementsByTagName("polyline")) == 5
+    with pytest.raises(ValueError):
+        plot(c, "ρ")
+
+
+def test_main(tmp_path):  # {{{1
+    out, svg = tmp_path / "carpet.csv", tmp_path / "carpet.svg"
+    args = ["-f", "generic-carbon", "-r", "generic-epoxy", "-s", "10"]
+    main(args + ["-o", str(out), "--svg", str(svg)])
+    with open(out, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 66
+    assert rows[0]["p90"] == "100"
+    assert svg.read_text().startswith("<?xml")
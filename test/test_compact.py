@@ -0,0 +1,40 @@
+# file: test_compact.py
+# vim:fileencoding=utf-8:fdm=marker:ft=python
+#
+# Author: R.F. Smith <rsmith@xs4all.nl>
+# Created: 2026-10-16T18:20:45+0200
+# Last modified: 2026-10-17T10:12:40+0200
+"""Test of the compact Lamina and Laminate."""
+
+from lp.core import fiber, resin, lamina, laminate
+from lp.compact import compact, sizeof, CompactLamina
+from lp.text import out as text_out
+
+hf = fiber(233000, 0.2, -0.54e-6, 1.76, "Hyer's carbon fiber")
+hr = resin(4620, 0.36, 41.4e-6, 1.1, "Hyer's resin")
+layers = [lamina(hf, hr, 100, a, 0.5) for a in (0, 90, 45, -45)]
+
+
+def test_compact_lamina():  # {{{1
+    la = layers[2]
+    for keep in (True, False):
+        c = compact(la, keep)
+        assert c == la
+        assert c.tolamina() == la
+        assert c.Q̅16 == la.Q̅16 and c.C == la.C
+    assert sizeof(compact(la)) < sizeof(compact(la, True)) < sizeof(la)
+    # Fibers and resins are shared, so they are not counted.
+    assert sizeof(hf) == sizeof(hr) == 0
+    assert sizeof(la) == sizeof(lamina(hf, hr, 100, 45, 0.5))
+
+
+def test_compact_laminate():  # {{{1
+    lam = laminate("qi", ["top"] + layers + layers[::-1])
+    memo = {}
+    c = compact(lam, memo=memo)
+    assert c == lam
+    assert c.tolaminate() == lam
+    assert c.layers[0] == "top" and c.layers[1] is c.layers[8]
+    assert isinstance(c.layers[1], CompactLamina) and len(memo) == 4
+    assert text_out(c, True, True, True) == text_out(lam, True, True, True)
+    assert sizeof(c) < sizeof(lam) / 2
@@ -3,17 +3,21 @@
 #
 # Author: R.F. Smith <rsmith@xs4all.nl>
 # Created: 2015-04-05 23:36:32 +0200
-# Last modified: 2023-10-11T22:25:10+0200
+# Last modified: 2026-10-17T13:41:27+0200
 """Test for lamprop types"""
 
 import sys
 import math
+import random
+import pytest
 
 # Inserting the path is needed to make sure that the module here is loaded,
 # not an installed version!
 sys.path.insert(1, ".")
 
-from lp.core import fiber, resin, lamina, laminate  # noqa
+from lp.core import fiber, resin, lamina, lamina_batch, laminate, tbar  # noqa
+from lp.core import LaminateBuilder, SymmetricLayers, laminate_batch, _groups  # noqa
+import lp.matrix as lpm  # noqa
 
 hf = fiber(233000, 0.2, -0.54e-6, 1.76, "Hyer's carbon fiber")
 hr = resin(4620, 0.36, 41.4e-6, 1.1, "Hyer's resin")
@@ -24,6 +28,49 @@ def areclose(a, b):
         assert math.isclose(x, y, rel_tol=0.01)
 
 
+def areequal(lam, ref, tol):
+    """Compare the properties of two laminates to relative tolerance tol."""
+    for name in ref._fields[2:]:
+        x, y = getattr(lam, name), getattr(ref, name)
+        if isinstance(y, float):
+            assert math.isclose(x, y, rel_tol=tol, abs_tol=tol * 1e-3)
+        else:
+            scale = max(abs(n) for row in y for n in row)
+            for rx, ry in zip(x, y):
+                for nx, ny in zip(rx, ry):
+                    assert abs(nx - ny) <= tol * scale
+
+
+def per_ply(layers):
+    """Return ABD and H, integrated ply by ply like laminate() used to do."""
+    plies = [la for la in layers if not isinstance(la, str)]
+    thickness = sum(la.thickness for la in plies)
+    ABD, H = lpm.zeros(6), lpm.zeros(2)
+    zs = -thickness / 2
+    for la in plies:
+        ze = zs + la.thickness
+        z2 = (ze * ze - zs * zs) / 2
+        z3 = (ze * ze * ze - zs * zs * zs) / 3
+        Q = [
+            [la.Q̅11, la.Q̅12, la.Q̅16],
+            [la.Q̅12, la.Q̅22, la.Q̅26],
+            [la.Q̅16, la.Q̅26, la.Q̅66],
+        ]
+        for i in range(3):
+            for j in range(3):
+                ABD[i][j] += Q[i][j] * la.thickness
+                ABD[i][j + 3] += Q[i][j] * z2
+                ABD[i + 3][j] += Q[i][j] * z2
+                ABD[i + 3][j + 3] += Q[i][j] * z3
+        sb = 5 / 4 * (la.thickness - 4 * z3 / thickness**2)
+        Qs = [[la.Q̅s44, la.Q̅s45], [la.Q̅s45, la.Q̅s55]]
+        for i in range(2):
+            for j in range(2):
+                H[i][j] += Qs[i][j] * sb
+        zs = ze
+    return lpm.clean(ABD), lpm.clean(H)
+
+
 def test_lamina():  # {{{1
     f = fiber(230000, 0.30, -0.41e-6, 1.76, "T300")
     r = resin(2900, 0.36, 41.4e-6, 1.15, "Epikote04908")
@@ -153,3 +200,162 @@ def test_qi():  # {{{1
     assert math.isclose(qi.tνxy, 0.32283, rel_tol=0.01)
     assert math.isclose(qi.tνxz, 0.31239, rel_tol=0.01)
     assert math.isclose(qi.tνyz, 0.31239, rel_tol=0.01)
+
+
+def test_lamina_stiffness():  # {{{1
+    """Compare the closed-form stiffness to Tbarᵀ·Sp⁻¹·Tbar."""
+    for angle in (-75, -30, 0, 15, 45, 90, 120):
+        for vf in (0.3, 0.5, 0.7):
+            la = lamina(hf, hr, 100, angle, vf)
+            E1, E2, G12, G23 = la.E1, la.E2, la.G12, la.G23
+            Sp = [
+                [1 / E1, -la.ν12 / E1, -la.ν13 / E1, 0, 0, 0],
+                [-la.ν12 / E1, 1 / E2, -la.ν23 / E2, 0, 0, 0],
+                [-la.ν13 / E1, -la.ν23 / E2, 1 / la.E3, 0, 0, 0],
+                [0, 0, 0, 1 / G23, 0, 0],
+                [0, 0, 0, 0, 1 / la.G13, 0],
+                [0, 0, 0, 0, 0, 1 / G12],
+            ]
+            T = tbar(angle)
+            ref = lpm.matmul(lpm.matmul(lpm.transp(T), lpm.LU(Sp).inv()), T)
+            scale = max(abs(n) for row in ref for n in row)
+            for i in range(6):
+                for j in range(6):
+                    assert abs(la.C[i][j] - ref[i][j]) <= 1e-12 * scale
+    # The matrices of laminae and laminates are lists of lists.
+    lam = laminate("cross", [la, lamina(hf, hr, 100, 90, 0.5)])
+    for m in (la.C, lam.C, lam.S, lam.ABD, lam.abd, lam.H, lam.h):
+        assert type(m) is list and type(m[0]) is list
+
+
+def test_lamina_batch():  # {{{1
+    pytest.importorskip("numpy")
+    weights = [100, 200, 300, 150, 100]
+    angles = [0, 90, -45, 30, 45]
+    vfs = [0.5, 0.5, 0.55, 0.4, 0.6]
+    batch = lamina_batch(hf, hr, weights, angles, vfs)
+    assert len(batch.E1) == 5 and batch.C.shape == (5, 6, 6)
+    for i, args in enumerate(zip(weights, angles, vfs)):
+        la = lamina(hf, hr, *args)
+        for name in la._fields[5:-1]:
+            assert getattr(batch, name)[i] == getattr(la, name)
+        assert batch.C[i].tolist() == la.C
+
+
+def test_lazy_laminate():  # {{{1
+    A = lamina(hf, hr, 100, 0, 0.5)
+    B = lamina(hf, hr, 200, 45, 0.5)
+    layers = [A, "comment", B, A]
+    lazy = laminate("lazy", layers, lazy=True)
+    assert lazy.ABD[0][0] > 0
+    # Reading ABD does not invert anything.
+    assert "_plate" in vars(lazy) and "_inplane" not in vars(lazy)
+    assert "_stiffness" not in vars(lazy)
+    lam = laminate("lazy", layers)
+    assert lazy.tolaminate() == lam
+    for name in lam._fields:
+        assert getattr(lazy, name) == getattr(lam, name)
+
+
+def test_laminate_builder():  # {{{1
+    A = lamina(hf, hr, 100, 0, 0.5)
+    B = lamina(hf, hr, 200, 45, 0.5)
+    C = lamina(hf, hr, 150, -30, 0.6)
+    layers = [A, B, "comment", B, A]
+    b = LaminateBuilder(layers)
+    for edit in (b, layers):
+        edit.append(C)
+        edit[1] = lamina(hf, hr, 200, -45, 0.5)  # same thickness
+        edit[0] = C  # different thickness
+        edit.insert(2, A)
+        del edit[-3]
+        edit.pop()
+        edit.insert(-1, B)
+    assert list(b) == layers
+    ref = laminate("edited", layers)
+    lam = b.build("edited")
+    assert lam.layers == ref.layers
+    areequal(lam, ref, 1e-9)
+
+
+def test_laminate_builder_edits():  # {{{1
+    """Rounding errors of many edits do not accumulate."""
+    rng = random.Random(11)
+    plies = [lamina(hf, hr, w, a, 0.5) for w in (100, 300, 600) for a in (0, 45, 90)]
+    layers = rng.choices(plies, k=8)
+    b = LaminateBuilder(layers)
+    for _ in range(2000):
+        op = rng.random()
+        if op < 0.3 or len(layers) < 4:
+            index, la = rng.randint(0, len(layers)), rng.choice(plies)
+            b.insert(index, la)
+            layers.insert(index, la)
+        elif op < 0.7:
+            index, la = rng.randrange(len(layers)), rng.choice(plies)
+            b[index] = la
+            layers[index] = la
+        else:
+            index = rng.randrange(len(layers))
+            del b[index]
+            del layers[index]
+    lam = b.build("edited")
+    assert b._subtractions == 0
+    assert list(b) == layers
+    areequal(lam, laminate("edited", layers), 1e-12)
+    assert b[1:3] == layers[1:3]
+    with pytest.raises(TypeError):
+        b[1:3] = plies[:2]
+    with pytest.raises(TypeError):
+        del b[1:3]
+
+
+def test_symmetric():  # {{{1
+    A = lamina(hf, hr, 100, 0, 0.5)
+    B = lamina(hf, hr, 200, 45, 0.5)
+    C = lamina(hf, hr, 150, -45, 0.6)
+    half = ["outer", A, "core", B, C]
+    sl = SymmetricLayers(half)
+    assert sl == ["outer", A, "core", B, C, "core", C, B, "outer", A]
+    assert sl[6] is C and sl[-1] is A
+    sym = laminate("sym", sl)
+    full = laminate("sym", list(sl))
+    assert all(n == 0.0 for row in sym.ABD[:3] for n in row[3:])
+    assert sym.layers is sl
+    areequal(sym, full, 1e-12)
+    lazy = laminate("sym", sl, lazy=True)
+    assert lazy.tolaminate() == sym
+
+
+def test_grouped_plies():  # {{{1
+    A = lamina(hf, hr, 600, 0, 0.5)
+    A2 = lamina(hf, hr, 600, 0, 0.5)
+    B = lamina(hf, hr, 300, 45, 0.5)
+    layers = [A] * 5 + ["comment", A2] + [B, B, A] * 2 + [A] * 3
+    counts = [k for _, k in _groups(la for la in layers if la != "comment")]
+    assert counts == [6, 2, 1, 2, 4]
+    lam = laminate("blocks", layers)
+    assert lam.layers == layers
+    ABD, H = per_ply(layers)
+    for x, y in ((lam.ABD, ABD), (lam.H, H)):
+        scale = max(abs(n) for row in y for n in row)
+        for rx, ry in zip(x, y):
+            for nx, ny in zip(rx, ry):
+                assert abs(nx - ny) <= 1e-9 * scale
+    # Same constituents and layup, but a different fiber.
+    other = lamina(hf._replace(name="other"), hr, 600, 0, 0.5)
+    assert [k for _, k in _groups([A, other, A2])] == [1, 1, 1]
+
+
+def test_laminate_batch():  # {{{1
+    np = pytest.importorskip("numpy")
+    angles = np.array([[0, 45, -45, 90], [30, -60, 15, 0]])
+    weights = np.array([100, 200, 200, 300])
+    batch = laminate_batch(hf, hr, weights, angles, 0.5)
+    assert batch.ABD.shape == (2, 6, 6)
+    for i, stack in enumerate(angles.tolist()):
+        ref = laminate(
+            "ref", [lamina(hf, hr, w, a, 0.5) for w, a in zip(weights, stack)]
+        )
+        for name in batch._fields:
+            x, y = np.asarray(getattr(batch, name)[i]), np.asarray(getattr(ref, name))
+            assert np.max(np.abs(x - y)) <= 1e-12 * np.max(np.abs(y))
@@ -0,0 +1,64 @@
+# file: test_failure.py
+# vim:fileencoding=utf-8:fdm=marker:ft=python
+#
+# Author: R.F. Smith <rsmith@xs4all.nl>
+# Created: 2026-10-17T01:31:55+0200
+# Last modified: 2026-10-17T14:38:40+0200
+"""Test of the first ply failure envelopes."""
+
+import pytest
+
+from lp.core import fiber, resin, lamina, laminate
+from lp.failure import CRITERIA, strengths, indices, envelope
+from lp.types import Strength
+
+np = pytest.importorskip("numpy")
+
+cf = fiber(230000, 0.27, -0.38e-6, 1.80, "generic-carbon")
+ep = resin(2900, 0.25, 40e-6, 1.15, "generic-epoxy")
+ud = laminate("ud", [lamina(cf, ep, 200, 0, 0.5)] * 4)
+qi = laminate("qi", [lamina(cf, ep, 200, a, 0.5) for a in (0, 45, -45, 90) * 5])
+
+
+def test_strengths():  # {{{1
+    s = Strength(1000, 800, 40, 150, 60, "test")
+    assert strengths(qi.layers, s).shape == (20, 5)
+    assert strengths(qi.layers)[0, 0] == 1500
+    with pytest.raises(ValueError):
+        strengths(qi.layers, {"other": s})
+    # Strengths attached to the fibers are used instead of the generic ones.
+    sf = fiber(230000, 0.27, -0.38e-6, 1.80, "generic-carbon", s)
+    layers = [lamina(sf, ep, 200, 0, 0.5)] * 2
+    assert strengths(layers)[0, 0] == 1000
+    other = fiber(230000, 0.27, -0.38e-6, 1.80, "other")
+    with pytest.raises(ValueError):
+        strengths([lamina(other, ep, 200, 0, 0.5)])
+
+
+def test_unidirectional():  # {{{1
+    # Rays along +Nx, +Ny, -Nx and -Ny.
+    for criterion in CRITERIA:
+        env = envelope(ud, count=4, criterion=criterion)
+        expected = [1500, 50, 1200, 250]
+        assert env.factor / ud.thickness == pytest.approx(expected)
+    env = envelope(ud, count=4, criterion="hashin")
+    assert list(env.mode[:2]) == ["hashin fiber tension", "hashin matrix tension"]
+
+
+@pytest.mark.parametrize("criterion", CRITERIA)
+def test_envelope(criterion):  # {{{1
+    env = envelope(qi, plane=("Nx", "Nxy"), count=360, criterion=criterion, ΔT=-80)
+    assert np.all(np.isfinite(env.factor)) and np.all(env.factor > 0)
+    loads = env.directions * env.factor[:, None]
+    fi = indices(qi, loads, ΔT=-80, criterion=criterion)
+    assert fi.reshape(len(loads), -1).max(axis=1) == pytest.approx(1)
+    n = np.arange(len(loads))
+    assert fi[n, env.ply, env.face] == pytest.approx(1)
+
+
+def test_combined():  # {{{1
+    separate = [envelope(qi, count=72, criterion=c).factor for c in CRITERIA]
+    combined = envelope(qi, count=72, criterion=CRITERIA)
+    assert combined.factor == pytest.approx(np.min(separate, axis=0))
+    with pytest.raises(ValueError):
+        envelope(qi, plane=("Nx", "Nz"))
@@ -0,0 +1,55 @@
+# file: test_lamparam.py
+# vim:fileencoding=utf-8:fdm=marker:ft=python
+#
+# Author: R.F. Smith <rsmith@xs4all.nl>
+# Created: 2026-10-16T20:58:12+0200
+# Last modified: 2026-10-16T20:58:12+0200
+"""Test of the lamination parameters."""
+
+import math
+import pytest
+
+from lp.core import fiber, resin, lamina, laminate
+from lp.lamparam import invariants, parameters, abd, engineering
+from lp.lamparam import parameters_batch, abd_batch
+
+hf = fiber(233000, 0.2, -0.54e-6, 1.76, "Hyer's carbon fiber")
+hr = resin(4620, 0.36, 41.4e-6, 1.1, "Hyer's resin")
+stacks = (
+    ((0, 90, 90, 0), (100, 100, 100, 100)),
+    ((0, 45, -45, 90), (100, 200, 200, 300)),
+    ((30, -60, 15, 0, 75), (150, 100, 100, 200, 100)),
+)
+
+
+def areclose(x, y):
+    scale = max(abs(n) for row in y for n in row)
+    for rx, ry in zip(x, y):
+        for nx, ny in zip(rx, ry):
+            assert abs(nx - ny) <= 1e-12 * scale
+
+
+def test_abd():  # {{{1
+    inv = invariants(hf, hr, 0.5)
+    for angles, weights in stacks:
+        layers = [lamina(hf, hr, w, a, 0.5) for a, w in zip(angles, weights)]
+        ref = laminate("ref", layers)
+        par = parameters(angles, [la.thickness for la in layers])
+        assert all(abs(ξ) <= 1 + 1e-12 for ξ in par[1:])
+        areclose(abd(inv, par), ref.ABD)
+        labd, Ex, Ey, Gxy, νxy, νyx = engineering(inv, par)
+        areclose(labd, ref.abd)
+        for x, y in zip(
+            (Ex, Ey, Gxy, νxy, νyx), (ref.Ex, ref.Ey, ref.Gxy, ref.νxy, ref.νyx)
+        ):
+            assert math.isclose(x, y, rel_tol=1e-12)
+
+
+def test_abd_batch():  # {{{1
+    pytest.importorskip("numpy")
+    inv = invariants(hf, hr, 0.5)
+    angles = [(0, 45, -45, 90), (30, -60, 15, 0)]
+    t = lamina(hf, hr, 100, 0, 0.5).thickness
+    batch = abd_batch(inv, parameters_batch(angles, t))
+    for a, b in zip(angles, batch):
+        areclose(b, abd(inv, parameters(a, t)))
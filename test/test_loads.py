@@ -0,0 +1,63 @@
+# file: test_loads.py
+# vim:fileencoding=utf-8:fdm=marker:ft=python
+#
+# Author: R.F. Smith <rsmith@xs4all.nl>
+# Created: 2026-10-17T01:02:48+0200
+# Last modified: 2026-10-17T01:02:48+0200
+"""Test of the ply stresses and strains for load cases."""
+
+import pytest
+
+from lp.core import fiber, resin, lamina, laminate
+from lp.loads import plies, thermal, solve
+
+np = pytest.importorskip("numpy")
+
+hf = fiber(233000, 0.2, -0.54e-6, 1.76, "Hyer's carbon fiber")
+hr = resin(4620, 0.36, 41.4e-6, 1.1, "Hyer's resin")
+
+
+def test_unidirectional():  # {{{1
+    lam = laminate("ud", [lamina(hf, hr, 100, 90, 0.5)] * 4)
+    res = solve(plies(lam), [[100, 0, 0, 0, 0, 0]])
+    σ = res.material_stress[0]
+    assert σ[:, :, 1] == pytest.approx(100 / lam.thickness)
+    assert σ[:, :, 0] == pytest.approx(0, abs=1e-9)
+    assert res.material_strain[0, 0, 0, 1] == pytest.approx(res.strain[0, 0, 0, 0])
+
+
+def test_free_expansion():  # {{{1
+    angles = (0, 45, -45, 90, 90, -45, 45, 0)
+    lam = laminate("sym", [lamina(hf, hr, 100, a, 0.5) for a in angles])
+    stack = plies(lam)
+    assert thermal(stack)[3:] == pytest.approx(0, abs=1e-9)
+    res = solve(stack, np.zeros(6), 10)
+    assert res.ε0[0, :2] == pytest.approx([lam.αx * 10, lam.αy * 10])
+    assert res.κ[0] == pytest.approx(0, abs=1e-15)
+
+
+def test_equilibrium():  # {{{1
+    angles = (0, 30, -60, 90, 15)
+    lam = laminate(
+        "asym", [lamina(hf, hr, 100 + 20 * n, a, 0.5) for n, a in enumerate(angles)]
+    )
+    stack = plies(lam)
+    loads = np.random.default_rng(1).normal(size=(20, 6)) * 100
+    ΔT = np.linspace(-40, 40, 20)
+    res = solve(stack, loads, ΔT)
+    zb, zt = stack.z[:, 0], stack.z[:, 1]
+    σb, σt = res.stress[:, :, 0, :], res.stress[:, :, 1, :]
+    # The stresses are linear over the thickness of a ply.
+    N = np.einsum("npi,p->ni", (σb + σt) / 2, zt - zb)
+    M = np.einsum(
+        "npi,p->ni",
+        σb * (2 * zb + zt)[:, None] + σt * (zb + 2 * zt)[:, None],
+        (zt - zb) / 6,
+    )
+    assert np.allclose(N, loads[:, :3], atol=1e-8)
+    assert np.allclose(M, loads[:, 3:], atol=1e-8)
+    # Single load case against the batch.
+    one = solve(stack, loads[3], ΔT[3])
+    assert np.allclose(one.material_stress[0], res.material_stress[3])
+    with pytest.raises(ValueError):
+        solve(stack, np.zeros((2, 5)))
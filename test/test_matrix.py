@@ -3,9 +3,10 @@
 #
 # Author: R.F. Smith <rsmith@xs4all.nl>
 # Created: 2019-01-01T01:59:28+0100
-# Last modified: 2020-12-26T14:09:32+0100
+# Last modified: 2026-10-17T13:41:27+0200
 """Test of the matrix routines"""
 
+import pytest
 import lp.matrix as mat
 
 _rndm = [
@@ -81,3 +82,104 @@ def test_delete():  # {{{1
         [0.57, 0.98, 0.49, 0.01, 0.71],
     ]
     assert mat.delete(_rndm, 1, 3) == smaller
+
+
+def test_lu_zero_pivot():  # {{{1
+    m = [[0.0, 2.0, 1.0], [1.0, 0.0, 0.0], [0.0, 1.0, 3.0]]
+    lu = mat.LU(m)
+    assert lu.det() == -5.0
+    prod = mat.matmul(m, lu.inv())
+    assert mat.clean(mat.add(prod, mat.mul(mat.ident(3), -1))) == mat.zeros(3)
+    assert [round(n, 12) for n in lu.solve([3.0, 1.0, 4.0])] == [1.0, 1.0, 1.0]
+
+
+def test_lu_singular():  # {{{1
+    for m in ([[0.0, 0.0], [0.0, 1.0]], [[1.0, 2.0, 3.0]] * 3, mat.zeros(4)):
+        lu = mat.LU(m)
+        assert lu.det() == 0.0
+        with pytest.raises(ValueError):
+            lu.solve([1.0] * len(m))
+        with pytest.raises(ValueError):
+            lu.inv()
+        with pytest.raises(ValueError):
+            lu.cofactor(0, 0)
+        with pytest.raises(ValueError):
+            mat.inv(m)
+
+
+def test_lu_cofactor():  # {{{1
+    lu = mat.LU(_rndm)
+    for i, j in ((0, 0), (1, 3), (4, 2), (5, 5)):
+        minor = mat.det(mat.delete(_rndm, i, j))
+        assert round(lu.cofactor(i, j), 12) == round((-1) ** (i + j) * minor, 12)
+    adj = lu.adjugate()
+    assert round(adj[3][1], 12) == round(lu.cofactor(1, 3), 12)
+
+
+def test_flat_matrix():  # {{{1
+    m = mat.Matrix(_rndm)
+    assert len(m) == 6
+    assert m[1][3] == _rndm[1][3]
+    assert m.tolist() == _rndm
+    assert m == _rndm and _rndm == m and m != _rndm[:5] and m != 1.0
+    m[2][4] = 1.5
+    assert m.data[2 * 6 + 4] == 1.5
+    assert [round(n, 2) for n in mat.inv(mat.Matrix(_rndm))[0]] == _invm[0]
+
+
+def test_flat_matrix_inplace():  # {{{1
+    m = mat.Matrix.zeros(6)
+    m.iadd_scaled(_rndm, 2.0)
+    m.iadd_scaled(mat.Matrix(_rndm), -1.0)
+    assert m.tolist() == _rndm
+    m.iadd_scaled(m, -1 + 1e-12)
+    assert any(n != 0.0 for n in m.data)
+    m.iclean()
+    assert m == mat.Matrix.zeros(6)
+
+
+def test_flat_matrix_minor():  # {{{1
+    m = mat.Matrix(_rndm)
+    minor = m.minor(1, 3)
+    assert [list(row) for row in minor] == mat.delete(_rndm, 1, 3)
+    assert mat.det(minor) == mat.det(mat.delete(_rndm, 1, 3))
+
+
+def test_kernels(monkeypatch):  # {{{1
+    import lp.kernels as k
+
+    # Compare with the elimination in LU.
+    monkeypatch.setattr(mat, "_INVDET", {})
+    for size in (2, 3, 6):
+        m = [row[:size] for row in _rndm[:size]]
+        lu = mat.LU(m)
+        assert lu._lu is not None
+        assert round(getattr(k, f"det{size}")(m) - lu.det(), 12) == 0.0
+        inv, d = getattr(k, f"invdet{size}")(m)
+        assert round(d - lu.det(), 12) == 0.0
+        ref = [lu.solve(col) for col in mat.ident(size)]
+        for i in range(size):
+            for j in range(size):
+                assert round(inv[i][j] - ref[j][i], 10) == 0.0
+        cg = getattr(k, f"congruence{size}")(m, m)
+        ref = mat.matmul(mat.matmul(mat.transp(m), m), m)
+        assert [[round(n, 12) for n in row] for row in cg] == [
+            [round(n, 12) for n in row] for row in ref
+        ]
+
+
+def test_kernel_fallback():  # {{{1
+    """The 6×6 kernel cannot handle a singular upper left block."""
+    import lp.kernels as k
+
+    m = mat.zeros(6)
+    for j in range(3):
+        m[j][j + 3] = 2.0
+        m[j + 3][j] = 1.0
+    assert k.invdet6(m) is None
+    assert k.det6(m) is None
+    assert mat.det(m) == -8.0
+    assert mat.matmul(m, mat.inv(m)) == mat.ident(6)
+    lu = mat.LU(m)
+    assert lu.det() == -8.0 and lu.cofactor(3, 0) == -8.0 * lu.inv()[0][3]
+    assert lu.solve([2.0, 2.0, 2.0, 1.0, 1.0, 1.0]) == [1.0] * 6
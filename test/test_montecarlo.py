@@ -0,0 +1,49 @@
+# file: test_montecarlo.py
+# vim:fileencoding=utf-8:fdm=marker:ft=python
+#
+# Author: R.F. Smith <rsmith@xs4all.nl>
+# Created: 2026-10-16T23:58:26+0200
+# Last modified: 2026-10-16T23:58:26+0200
+"""Test of the Monte Carlo analysis."""
+
+import math
+import pytest
+
+from lp.core import fiber, resin, lamina, laminate
+from lp.montecarlo import montecarlo, normal, uniform
+
+np = pytest.importorskip("numpy")
+
+hf = fiber(233000, 0.2, -0.54e-6, 1.76, "Hyer's carbon fiber")
+hr = resin(4620, 0.36, 41.4e-6, 1.1, "Hyer's resin")
+gr = resin(2900, 0.25, 40e-6, 1.15, "generic-epoxy")
+layers = [lamina(hf, hr, 200, a, 0.5) for a in (0, 45, -45, 90)]
+layers += ["core"] + [lamina(hf, gr, 100, a, 0.55) for a in (30, -30)]
+
+
+def test_nominal():  # {{{1
+    ref = laminate("ref", layers)
+    result = montecarlo(layers, {}, 10, chunksize=4)
+    for name, stats in result.statistics.items():
+        assert math.isclose(stats.mean, getattr(ref, name), rel_tol=1e-12)
+        assert stats.std <= 1e-12 * abs(stats.mean)
+
+
+def test_scatter():  # {{{1
+    scatter = {
+        "fiber.E1": normal(0.03, relative=True),
+        "resin.E": normal(0.05, relative=True),
+        "vf": uniform(-0.02, 0.02),
+        "angle": normal(1.0),
+    }
+    a = montecarlo(layers, scatter, 2000, seed=7, chunksize=500)
+    b = montecarlo(layers, scatter, 2000, seed=7, chunksize=500, workers=2)
+    assert a.statistics == b.statistics
+    ex = a.statistics["Ex"]
+    assert ex.std > 0
+    assert ex.percentiles[5] < ex.percentiles[50] < ex.percentiles[95]
+    assert math.isclose(ex.mean, laminate("ref", layers).Ex, rel_tol=0.01)
+    c = montecarlo(layers, scatter, 2000, seed=8, chunksize=500)
+    assert c.statistics["Ex"] != ex
+    with pytest.raises(ValueError):
+        montecarlo(layers, {"fiber.E": normal(1)}, 10)
@@ -0,0 +1,69 @@
+# file: test_parallel.py
+# vim:fileencoding=utf-8:fdm=marker:ft=python
+#
+# Author: R.F. Smith <rsmith@xs4all.nl>
+# Created: 2026-10-16T22:31:27+0200
+# Last modified: 2026-10-17T15:04:51+0200
+"""Test of the parallel evaluation of laminates."""
+
+from multiprocessing.shared_memory import SharedMemory
+import os
+import pytest
+
+from lp import evaluate_many
+from lp.parallel import evaluate_shared
+from lp.core import fiber, resin, lamina, laminate, SymmetricLayers
+
+hf = fiber(233000, 0.2, -0.54e-6, 1.76, "Hyer's carbon fiber")
+hr = resin(4620, 0.36, 41.4e-6, 1.1, "Hyer's resin")
+gr = resin(2900, 0.25, 40e-6, 1.15, "generic-epoxy")
+
+
+def stacks():
+    rv = []
+    for n, angle in enumerate(range(-90, 91, 15)):
+        r = hr if n % 2 else gr
+        layers = [lamina(hf, r, 100 + n, a, 0.5) for a in (0, angle, -angle, 90)]
+        if n % 3 == 0:
+            layers = SymmetricLayers(["comment"] + layers)
+        rv.append((f"lam{n}", layers))
+    return rv
+
+
+def test_evaluate_many():  # {{{1
+    data = stacks()
+    ref = [laminate(name, layers) for name, layers in data]
+    assert evaluate_many(data, workers=1) == ref
+    result = evaluate_many(data, workers=2, chunksize=3, threshold=0)
+    assert result == ref
+    assert all(a.layers is layers for a, (_, layers) in zip(result, data))
+
+
+def test_evaluate_shared():  # {{{1
+    data = stacks()
+    ref = [laminate(name, layers) for name, layers in data]
+    for workers in (1, 2):
+        with evaluate_shared(data, workers=workers, chunksize=4, threshold=0) as res:
+            assert len(res) == len(data)
+            assert list(res["Ex"]) == [lam.Ex for lam in ref]
+            assert list(res["ABD16"]) == [lam.ABD[0][5] for lam in ref]
+            name, ex = res.name, res["Ex"]
+            # Repeated access returns the same view instead of a new one.
+            views = len(res._views)
+            assert all(res["Ex"] is ex for _ in range(10))
+            assert len(res._views) == views
+        with pytest.raises(ValueError):
+            ex[0]
+        with pytest.raises(FileNotFoundError):
+            SharedMemory(name=name)
+        with pytest.raises(ValueError):
+            res["Ex"]
+
+
+def test_evaluate_shared_error():  # {{{1
+    data = stacks() + [("", [lamina(hf, hr, 100, 0, 0.5)])]
+    before = set(os.listdir("/dev/shm")) if os.path.isdir("/dev/shm") else set()
+    with pytest.raises(AssertionError):
+        evaluate_shared(data, workers=2, chunksize=4, threshold=0)
+    if before:
+        assert set(os.listdir("/dev/shm")) <= before
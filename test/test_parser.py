@@ -3,7 +3,7 @@
 #
 # Author: R.F. Smith <rsmith@xs4all.nl>
 # Created: 2016-06-08 22:10:46 +0200
-# Last modified: 2023-10-11T22:41:45+0200
+# Last modified: 2026-10-17T14:38:40+0200
 """Test for lamprop parser."""
 
 import io
@@ -17,14 +17,20 @@ from lp.parser import (
     _directives,
     _laminate,
     _get_lamina,
-    _extended,
+    allowables,
+    materials,
+    parse,
+    parse_iter,
+    warn,
 )  # noqa
-from lp.core import fiber, resin, lamina  # noqa
+from lp.core import fiber, resin, lamina, _extended  # noqa
+from lp.types import Event  # noqa
 from lp.generic import resins as generic_resins, fibers as generic_fibers  # noqa
 
 
 def test_directives():  # {{{1
-    r, f, la = _directives("test/twill245.lam")
+    r, f, la, a = _directives("test/twill245.lam")
+    assert len(a) == 0
     assert len(r) == 1
     assert len(f) == 1
     assert len(la) == 9
@@ -203,7 +209,7 @@ l: 100 90 generic-carbon
 l: 100 0  generic-carbon
 """
     dummy = io.StringIO(buf)
-    _, _, ld = _directives(dummy)
+    _, _, ld, _ = _directives(dummy)
     r = _get_components(generic_resins, resin)
     f = _get_components(generic_fibers, fiber)
     assert len(ld) == 6
@@ -214,3 +220,97 @@ l: 100 0  generic-carbon
     assert 63338 < la.Ex < 63339
     assert 63338 < la.Ey < 63339
     assert 1.47 < la.ρ < 1.48
+
+
+def test_allowables():  # {{{1
+    buf = """a: 1400 1100 45 200 65 generic-carbon
+a: 1800 1200 60 T700
+a: 2000 1400 60 200 -80 T800
+"""
+    lams = parse("test/twill245.lam")
+    saved = warn[:]
+    al, messages = allowables(io.StringIO(buf))
+    assert al["generic-carbon"].Xt == 1400
+    assert al["generic-e-glas"].Xc == 600
+    assert "T700" not in al and "T800" not in al
+    assert len(messages) == 2
+    # The messages of a preceding parse are kept.
+    assert warn == saved
+    assert lams == parse("test/twill245.lam")
+
+
+def test_parsed_strengths():  # {{{1
+    buf = """f: 233000 0.2 -0.54e-6 1.76 cf
+a: 1400 1100 45 200 65 cf
+a: 1500 1100 45 200 65 cf
+a: 1000 800 40 150 60 generic-carbon
+t: carbon
+m: 0.5 generic-epoxy
+l: 100 0 cf
+l: 100 0 generic-carbon
+l: 100 0 generic-e-glas
+"""
+    (lam,) = parse(io.StringIO(buf))
+    assert warn == ['Duplicate strengths "cf" on line 3 ignored.']
+    assert [lam] == list(parse_iter(io.StringIO(buf)))
+    cf, gc, eg = (la.fiber.strength for la in lam.layers)
+    assert cf.Xt == 1400 and gc.Xt == 1000
+    # Fibers without strengths in the file keep the generic ones.
+    assert eg == allowables(None)[0]["generic-e-glas"]
+    fibers, _ = materials(io.StringIO(buf))
+    assert fibers["cf"].strength == cf
+
+
+def test_parse_iter():  # {{{1
+    for name in ("test/hyer.lam", "test/unknown.lam", "test/twill245.lam"):
+        assert list(parse_iter(name)) == parse(name)
+    events = []
+    list(parse_iter("test/unknown.lam", events.append))
+    warnings = [e for e in events if e.kind == "warning"]
+    assert warnings[0] == Event(
+        "warning", 11, 'Duplicate fiber "foo" on line 11 ignored.'
+    )
+    assert warnings[-1].line == 46
+
+
+def test_duplicate_materials():  # {{{1
+    buf = """f: 233000 0.2 -0.54e-6 1.76 cf
+f: 100000 0.2 -0.54e-6 1.76 cf
+f: 100000 0.3 -0.5e-6 1.7 generic-carbon
+t: first
+m: 0.5 generic-epoxy
+l: 100 0 cf
+t: generic
+m: 0.5 generic-epoxy
+l: 100 0 generic-carbon
+"""
+    lams = parse(io.StringIO(buf))
+    assert warn == ['Duplicate fiber "cf" on line 2 ignored.']
+    assert lams == list(parse_iter(io.StringIO(buf)))
+    # The first definition in a file is used, and it replaces a generic one.
+    assert lams[0].layers[0].fiber.E1 == 233000
+    assert lams[1].layers[0].fiber.E1 == 100000
+    fibers, _ = materials(io.StringIO(buf))
+    assert fibers["cf"].E1 == 233000 and fibers["generic-carbon"].ν12 == 0.3
+
+
+def test_parse_iter_lazy():  # {{{1
+    read = []
+
+    def lines():
+        yield "f: 233000 0.2 -0.54e-6 1.76 carbon"
+        for n in range(1000):
+            yield f"t: laminate {n}"
+            yield "m: 0.5 generic-epoxy"
+            yield "l: 100 0 carbon"
+            read.append(n)
+
+    it = parse_iter(lines())
+    lam = next(it)
+    assert lam.name == "laminate 0" and len(read) == 1
+    assert sum(1 for _ in it) == 999
+    # A fiber must be defined before it is used.
+    events = []
+    buf = "t: test\nm: 0.5 generic-epoxy\nl: 100 0 later\nf: 233000 0.2 0 1.76 late\n"
+    assert list(parse_iter(io.StringIO(buf), events.append)) == []
+    assert events[-1].kind == "warning"
@@ -0,0 +1,76 @@
+# file: test_plate.py
+# vim:fileencoding=utf-8:fdm=marker:ft=python
+#
+# Author: R.F. Smith <rsmith@xs4all.nl>
+# Created: 2026-10-17T02:05:16+0200
+# Last modified: 2026-10-17T02:05:16+0200
+"""Test of plate buckling and natural frequencies."""
+
+import math
+
+import pytest
+
+from lp.core import fiber, resin, lamina, laminate, laminate_batch
+from lp.plate import stiffness, buckling, frequency
+from lp.types import PlateStiffness
+
+np = pytest.importorskip("numpy")
+
+# Aluminium plate, 2 mm thick.
+E, ν, h, ρ = 70000, 0.3, 2.0, 2.7
+D = E * h**3 / (12 * (1 - ν**2))
+alu = PlateStiffness(D, ν * D, D, (1 - ν) / 2 * D, 0.0, 0.0, ρ * h)
+
+
+def test_isotropic():  # {{{1
+    # Square plate, uniaxial compression: N = 4π²D/b².
+    r = buckling(alu, 500, 500)
+    assert r.N == pytest.approx(4 * math.pi**2 * D / 500**2)
+    assert (r.m, r.n) == (1, 1)
+    # Long plates buckle in several half-waves.
+    r = buckling(alu, [1000, 1500], 500)
+    assert r.N == pytest.approx(4 * math.pi**2 * D / 500**2)
+    assert list(r.m) == [2, 3]
+    # Equal biaxial compression of a square plate: N = 2π²D/b².
+    assert buckling(alu, 500, 500, 1).N == pytest.approx(2 * math.pi**2 * D / 500**2)
+    # f = π/2·(1/a² + 1/b²)·√(D/m), with D in N·m and m in kg/m².
+    f = math.pi / 2 * (2 / 0.5**2) * math.sqrt(D * 1e-3 / (ρ * h))
+    assert frequency(alu, 500, 500) == pytest.approx(f)
+
+
+def test_modes():  # {{{1
+    rng = np.random.default_rng(3)
+    a = rng.uniform(100, 3000, 500)
+    b = rng.uniform(100, 1000, 500)
+    k = rng.uniform(-2, 3, 500)
+    p = PlateStiffness(D, 0.1 * D, 0.2 * D, 0.8 * D, 0.0, 0.0, 1.0)
+    r = buckling(p, a, b, k)
+    # Brute force minimum over all modes.
+    best = np.full(500, np.inf)
+    for m in range(1, 11):
+        for n in range(1, 11):
+            α, β = (m * math.pi / a) ** 2, (n * math.pi / b) ** 2
+            N = (p.D11 * α * α + 2 * (p.D12 + 2 * p.D66) * α * β + p.D22 * β * β) / (
+                α + k * β
+            )
+            best = np.minimum(best, np.where(α + k * β > 0, N, np.inf))
+    assert np.array_equal(np.isinf(r.N), np.isinf(best))
+    finite = np.isfinite(best)
+    assert r.N[finite] == pytest.approx(best[finite])
+
+
+def test_laminates():  # {{{1
+    hf = fiber(233000, 0.2, -0.54e-6, 1.76, "Hyer's carbon fiber")
+    hr = resin(4620, 0.36, 41.4e-6, 1.1, "Hyer's resin")
+    angles = (0, 45, -45, 90, 90, -45, 45, 0)
+    lam = laminate("qi", [lamina(hf, hr, 200, a, 0.5) for a in angles])
+    p = stiffness(lam)
+    assert p.D11 == lam.ABD[3][3] and p.D26 == lam.ABD[4][5]
+    assert p.mass == pytest.approx(lam.ρ * lam.thickness)
+    batch = laminate_batch(hf, hr, 200, [angles, angles[::-1]], 0.5)
+    pb = stiffness(batch)
+    assert pb.D11 == pytest.approx([p.D11] * 2)
+    # Panels × laminates grid.
+    a = np.linspace(200, 1000, 5)[:, None]
+    assert buckling(pb, a, 300).N.shape == (5, 2)
+    assert frequency(pb, a, 300).shape == (5, 2)
@@ -0,0 +1,62 @@
+# file: test_polar.py
+# vim:fileencoding=utf-8:fdm=marker:ft=python
+#
+# Author: R.F. Smith <rsmith@xs4all.nl>
+# Created: 2026-10-17T02:31:40+0200
+# Last modified: 2026-10-17T02:31:40+0200
+"""Test of the polar diagrams."""
+
+import csv
+import xml.dom.minidom
+
+import pytest
+
+from lp.core import fiber, resin, lamina, laminate, tbar
+from lp.polar import rotations, polar, plot, main
+
+np = pytest.importorskip("numpy")
+
+hf = fiber(233000, 0.2, -0.54e-6, 1.76, "Hyer's carbon fiber")
+hr = resin(4620, 0.36, 41.4e-6, 1.1, "Hyer's resin")
+angles = (0, 30, -45, 90, 0, 15)
+
+
+def _laminate(offset):
+    layers = [
+        lamina(hf, hr, 100 + 10 * n, a + offset, 0.5) for n, a in enumerate(angles)
+    ]
+    return laminate("test", layers)
+
+
+def test_rotations():  # {{{1
+    t = rotations([0, 30, 90])
+    for m, a in zip(t, (0, 30, 90)):
+        T = np.array(tbar(a))
+        assert np.array_equal(m, T[np.ix_([0, 1, 5], [0, 1, 5])])
+
+
+def test_polar():  # {{{1
+    p = polar(_laminate(0), 5)
+    assert len(p.angles) == 72
+    for offset in (0, 25, 90, 135, 250):
+        ref = _laminate(offset)
+        i = offset // 5
+        for name in ("Ex", "Ey", "Gxy", "νxy", "νyx"):
+            assert getattr(p, name)[i] == pytest.approx(getattr(ref, name))
+        assert np.allclose(p.ABD[i], ref.ABD, rtol=1e-12, atol=1e-9)
+        assert np.allclose(p.abd[i], ref.abd, rtol=1e-12, atol=1e-15)
+
+
+def test_output(tmp_path):  # {{{1
+    p = polar(_laminate(0), 10)
+    doc = xml.dom.minidom.parseString(plot(p, ("Ex", "Ey"), "<test>"))
+    assert len(doc.getElementsByTagName("polygon")) == 2
+    with pytest.raises(ValueError):
+        plot(p, ("ρ",))
+    out, svg = tmp_path / "polar.csv", tmp_path / "polar.svg"
+    main(["test/hyer.lam", "-s", "15", "-o", str(out), "--svg", str(svg)])
+    with open(out, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 24
+    assert float(rows[6]["angle"]) == 90
+    assert svg.read_text().startswith("<?xml")
@@ -0,0 +1,62 @@
+# file: test_sensitivity.py
+# vim:fileencoding=utf-8:fdm=marker:ft=python
+#
+# Author: R.F. Smith <rsmith@xs4all.nl>
+# Created: 2026-10-17T00:20:13+0200
+# Last modified: 2026-10-17T00:20:13+0200
+"""Test of the derivatives of laminate properties."""
+
+import pytest
+
+from lp.core import fiber, resin, lamina, laminate
+from lp.sensitivity import Dual, sensitivity
+
+hf = fiber(233000, 0.2, -0.54e-6, 1.76, "Hyer's carbon fiber")
+hr = resin(4620, 0.36, 41.4e-6, 1.1, "Hyer's resin")
+# (fiber_weight, angle, vf) of the plies.
+spec = [(100, 0, 0.5), (200, 30, 0.55), (150, -45, 0.5), (100, 90, 0.6)]
+# Step sizes for the central differences.
+steps = {"angle": 1e-4, "fiber_weight": 1e-4, "vf": 1e-6}
+
+
+def _laminate(spec):
+    return laminate("test", [lamina(hf, hr, *s) for s in spec])
+
+
+def test_dual():  # {{{1
+    x = Dual.variable(2.0, 0, 2)
+    y = Dual.variable(3.0, 1, 2)
+    f = (x * y + 1) / (x - y) ** 2 - 4 / x
+    # Derivatives of (xy+1)/(x-y)² - 4/x.
+    assert f.value == pytest.approx(7 - 2)
+    assert f.grad[0] == pytest.approx(3 + 14 + 1)
+    assert f.grad[1] == pytest.approx(2 - 14)
+
+
+def test_values():  # {{{1
+    s = sensitivity([lamina(hf, hr, *x) for x in spec])
+    ref = _laminate(spec)
+    for name in ("thickness", "Ex", "Ey", "Gxy", "νxy", "νyx", "αx", "αy"):
+        assert getattr(s, name).value == pytest.approx(getattr(ref, name))
+    assert len(s.parameters) == 3 * len(spec)
+    assert s.parameters[4] == (1, "fiber_weight")
+
+
+def test_finite_differences():  # {{{1
+    s = sensitivity([lamina(hf, hr, *x) for x in spec])
+    for k, (ply, name) in enumerate(s.parameters):
+        index = ("fiber_weight", "angle", "vf").index(name)
+        h = steps[name]
+        up, down = [list(x) for x in spec], [list(x) for x in spec]
+        up[ply][index] += h
+        down[ply][index] -= h
+        lu, ld = _laminate(up), _laminate(down)
+        for prop in ("thickness", "Ex", "Ey", "Gxy", "νxy", "αx", "αy"):
+            fd = (getattr(lu, prop) - getattr(ld, prop)) / (2 * h)
+            scale = abs(getattr(s, prop).value)
+            assert getattr(s, prop).grad[k] == pytest.approx(
+                fd, rel=1e-5, abs=1e-9 * scale
+            )
+        for i, j in ((0, 0), (0, 2), (1, 4), (3, 3)):
+            fd = (lu.ABD[i][j] - ld.ABD[i][j]) / (2 * h)
+            assert s.ABD[i][j].grad[k] == pytest.approx(fd, rel=1e-5, abs=1e-3)
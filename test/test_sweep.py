@@ -0,0 +1,69 @@
+# file: test_sweep.py
+# vim:fileencoding=utf-8:fdm=marker:ft=python
+#
+# Author: R.F. Smith <rsmith@xs4all.nl>
+# Created: 2026-10-16T21:58:40+0200
+# Last modified: 2026-10-16T21:58:40+0200
+"""Test of the design space sweeps."""
+
+import csv
+import math
+import pytest
+
+from lp.core import fiber, resin, lamina, laminate
+from lp.sweep import template, sweep, main
+
+np = pytest.importorskip("numpy")
+
+hf = fiber(233000, 0.2, -0.54e-6, 1.76, "Hyer's carbon fiber")
+hr = resin(4620, 0.36, 41.4e-6, 1.1, "Hyer's resin")
+
+
+def test_template():  # {{{1
+    t = template("0 a -b 90 s")
+    assert t.plies == (0.0, "a", "-b", 90.0, 90.0, "-b", "a", 0.0)
+    assert t.symbols == ("a", "b")
+    with pytest.raises(ValueError):
+        template("0 a+1")
+
+
+def test_sweep():  # {{{1
+    chunks = list(
+        sweep(
+            ["0 a -a 90"],
+            [(hf, hr)],
+            [0.5, 0.6],
+            [100, 200],
+            {"a": [15, 30, 45]},
+            chunksize=5,
+        )
+    )
+    assert [len(c.columns["Ex"]) for c in chunks] == [5, 5, 2]
+    for c in chunks:
+        for vf, w, a, Ex, νxy in zip(
+            *(c.columns[k] for k in "vf fiber_weight a Ex νxy".split())
+        ):
+            plies = [lamina(hf, hr, w, angle, vf) for angle in (0, a, -a, 90)]
+            ref = laminate("ref", plies)
+            assert math.isclose(Ex, ref.Ex, rel_tol=1e-10)
+            assert math.isclose(νxy, ref.νxy, rel_tol=1e-10)
+
+
+def test_main(tmp_path):  # {{{1
+    out = tmp_path / "sweep.csv"
+    args = ["-m", "test/hyer.lam", "-t", "a -a s", "-f", "Hyer's carbon fiber"]
+    args += ["-r", "Hyer's resin", "-a", "a=0:90:15", "-p", "Ex,Gxy", "-o", str(out)]
+    main(args)
+    with open(out, newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == [
+        "template",
+        "fiber",
+        "resin",
+        "vf",
+        "fiber_weight",
+        "a",
+        "Ex",
+        "Gxy",
+    ]
+    assert len(rows) == 8
@@ -0,0 +1,257 @@
+#!/usr/bin/env python
+# file: gen-kernels.py
+# vim:fileencoding=utf-8:ft=python
+#
+# Author: R.F. Smith <rsmith@xs4all.nl>
+# Created: 2026-10-16T13:05:10+0200
+# Last modified: 2026-10-17T14:02:51+0200
+
+"""Generate src/lp/kernels.py; straight-line matrix functions for the fixed
+matrix sizes used in lamprop (2×2, 3×3 and 6×6).
+
+Run this script from the root directory of the repository after changing it:
+
+    python tools/gen-kernels.py
+"""
+
+import argparse
+
+SIZES = (2, 3, 6)
+# A 6×6 inverse is calculated from 3×3 blocks. The upper left block must not
+# be (nearly) singular for that. Otherwise the kernel returns None.
+BLOCK_EPS = "1e-12"
+
+
+def names(prefix, size):
+    """Return a size×size list of variable names."""
+    return [[f"{prefix}{i}{j}" for j in range(size)] for i in range(size)]
+
+
+def unpack(prefix, arg, size):
+    """Return the line that unpacks the matrix arg into variables."""
+    rows = ", ".join("(" + ", ".join(row) + ")" for row in names(prefix, size))
+    return f"    {rows} = {arg}"
+
+
+def matrix(rows, indent="    ", extra=""):
+    """Return the lines of a list of lists of expressions. The expression
+    extra is returned with it as a tuple."""
+    lines = [f"{indent}return ["]
+    for row in rows:
+        lines.append(f"{indent}    [" + ", ".join(row) + "],")
+    lines.append(f"{indent}]" + (f", {extra}" if extra else ""))
+    return lines
+
+
+def product(a, b):
+    """Return the expressions for the product of a and b."""
+    size = len(a)
+    return [
+        [" + ".join(f"{a[i][k]} * {b[k][j]}" for k in range(size)) for j in range(size)]
+        for i in range(size)
+    ]
+
+
+def assign(target, exprs):
+    """Return the lines assigning expressions to the variables in target."""
+    lines = []
+    for trow, erow in zip(target, exprs):
+        for t, e in zip(trow, erow):
+            lines.append(f"    {t} = {e}")
+    return lines
+
+
+def cofactors(a):
+    """Return the cofactor expressions of a 2×2 or 3×3 matrix of names."""
+    if len(a) == 2:
+        return [[a[1][1], f"-{a[1][0]}"], [f"-{a[0][1]}", a[0][0]]]
+    rv = []
+    for i in range(3):
+        row = []
+        i1, i2 = [r for r in range(3) if r != i]
+        for j in range(3):
+            j1, j2 = [c for c in range(3) if c != j]
+            term = f"{a[i1][j1]} * {a[i2][j2]} - {a[i1][j2]} * {a[i2][j1]}"
+            if (i + j) % 2:
+                term = f"-({term})"
+            row.append(term)
+        rv.append(row)
+    return rv
+
+
+def small_det(a, prefix, full=True):
+    """Return the lines calculating the cofactors and determinant of a 2×2 or
+    3×3 matrix a, assigned to names starting with prefix. If full is False,
+    only the cofactors of the first row are calculated."""
+    size = len(a)
+    cn = names(f"{prefix}c", size)
+    if full:
+        lines = assign(cn, cofactors(a))
+    else:
+        lines = assign(cn[:1], cofactors(a)[:1])
+    det = " + ".join(f"{a[0][j]} * {cn[0][j]}" for j in range(size))
+    lines.append(f"    {prefix}d = {det}")
+    return lines, cn, f"{prefix}d"
+
+
+def small_inv(a, prefix):
+    """Return the lines calculating the inverse of a 2×2 or 3×3 matrix."""
+    lines, cn, d = small_det(a, prefix)
+    size = len(a)
+    lines.append(f"    if {d} == 0.0:")
+    lines.append("        return None")
+    lines.append(f"    {prefix}r = 1.0 / {d}")
+    inv = names(f"{prefix}i", size)
+    lines += assign(
+        inv, [[f"{cn[j][i]} * {prefix}r" for j in range(size)] for i in range(size)]
+    )
+    return lines, inv, d
+
+
+def gen_det(size):
+    a = names("a", size)
+    lines = [f"def det{size}(m):", f'    """Determinant of a {size}×{size} matrix."""']
+    lines.append(unpack("a", "m", size))
+    if size < 6:
+        body, _, d = small_det(a, "", full=False)
+        lines += body
+        lines.append(f"    return {d}")
+        return lines
+    body, d = block_schur(a, full=False)
+    lines += body
+    lines.append(f"    return {d} * zd")
+    return lines
+
+
+def block_schur(a, full=True):
+    """Return the lines calculating the inverse of the upper left 3×3 block P
+    of a 6×6 matrix and the Schur complement Z = S - R·P⁻¹·Q. If full is
+    False, only the cofactors of Z needed for its determinant are
+    calculated."""
+    P = [row[:3] for row in a[:3]]
+    Q = [row[3:] for row in a[:3]]
+    R = [row[:3] for row in a[3:]]
+    S = [row[3:] for row in a[3:]]
+    lines = []
+    scale = ", ".join(f"abs({n})" for row in P for n in row)
+    lines.append(f"    ps = max({scale})")
+    body, _, d = small_det(P, "p")
+    lines += body
+    lines.append(f"    if abs({d}) <= {BLOCK_EPS} * ps * ps * ps:")
+    lines.append("        return None")
+    lines.append(f"    pr = 1.0 / {d}")
+    pc = names("pc", 3)
+    Pi = names("pi", 3)
+    lines += assign(Pi, [[f"{pc[j][i]} * pr" for j in range(3)] for i in range(3)])
+    Y = names("y", 3)  # P⁻¹·Q
+    lines += assign(Y, product(Pi, Q))
+    Z = names("z", 3)
+    RY = product(R, Y)
+    lines += assign(
+        Z, [[f"{S[i][j]} - ({RY[i][j]})" for j in range(3)] for i in range(3)]
+    )
+    body, _, _ = small_det(Z, "z", full)
+    lines += body
+    return lines, d
+
+
+def gen_invdet(size):
+    a = names("a", size)
+    lines = [f"def invdet{size}(m):"]
+    lines.append(
+        f'    """Inverse and determinant of a {size}×{size} matrix, or None if '
+        'they cannot\n    be calculated with this method."""'
+    )
+    lines.append(unpack("a", "m", size))
+    if size < 6:
+        body, inv, d = small_inv(a, "")
+        lines += body
+        lines += matrix(inv, extra=d)
+        return lines
+    body, _ = block_schur(a)
+    lines += body
+    lines.append("    if zd == 0.0:")
+    lines.append("        return None")
+    lines.append("    zr = 1.0 / zd")
+    zc = names("zc", 3)
+    Zi = names("zi", 3)
+    lines += assign(Zi, [[f"{zc[j][i]} * zr" for j in range(3)] for i in range(3)])
+    R = [row[:3] for row in a[3:]]
+    X = names("x", 3)  # R·P⁻¹
+    lines += assign(X, product(R, names("pi", 3)))
+    W = names("w", 3)  # P⁻¹·Q·Z⁻¹
+    lines += assign(W, product(names("y", 3), Zi))
+    WX = product(W, X)
+    ZX = product(Zi, X)
+    Pi = names("pi", 3)
+    rows = []
+    for i in range(3):
+        rows.append(
+            [f"{Pi[i][j]} + {WX[i][j]}" for j in range(3)]
+            + [f"-{W[i][j]}" for j in range(3)]
+        )
+    for i in range(3):
+        rows.append([f"-({ZX[i][j]})" for j in range(3)] + [Zi[i][j] for j in range(3)])
+    lines += matrix(rows, extra="pd * zd")
+    return lines
+
+
+def gen_matmul(size):
+    lines = [
+        f"def matmul{size}(a, b):",
+        f'    """Product of two {size}×{size} matrices."""',
+        unpack("a", "a", size),
+        unpack("b", "b", size),
+    ]
+    lines += matrix(product(names("a", size), names("b", size)))
+    return lines
+
+
+def gen_congruence(size):
+    lines = [
+        f"def congruence{size}(t, c):",
+        f'    """Return tᵀ·c·t for {size}×{size} matrices."""',
+        unpack("t", "t", size),
+        unpack("c", "c", size),
+    ]
+    t, c = names("t", size), names("c", size)
+    u = names("u", size)
+    lines += assign(u, product(c, t))
+    tt = [[t[j][i] for j in range(size)] for i in range(size)]
+    lines += matrix(product(tt, u))
+    return lines
+
+
+def generate():
+    lines = [
+        "# file: kernels.py",
+        "# vim:fileencoding=utf-8:ft=python",
+        "#",
+        "# Generated by tools/gen-kernels.py; do not edit.",
+        "#",
+        "# SPDX-License-Identifier: BSD-2-Clause",
+        '"""',
+        "Straight-line matrix functions for 2×2, 3×3 and 6×6 matrices.",
+        "",
+        "These are used by lp.matrix when the size of the matrix matches.",
+        "The arguments can be lists of lists or lp.matrix.Matrix.",
+        '"""',
+        "",
+        "# fmt: off",
+    ]
+    for size in SIZES:
+        for gen in (gen_det, gen_invdet, gen_matmul, gen_congruence):
+            lines += ["", ""]
+            lines += gen(size)
+    lines.append("")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    opts = argparse.ArgumentParser(description="Generate matrix kernels for lamprop.")
+    opts.add_argument(
+        "-o", "--output", default="src/lp/kernels.py", help="file to write"
+    )
+    args = opts.parse_args()
+    with open(args.output, "w", encoding="utf-8") as out:
+        out.write(generate())